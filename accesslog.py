@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Access log for DevTechAI WebApp v2.0
+Request handlers append a small dict per request to an in-memory queue; a
+background thread formats the records as JSON lines and writes them in
+batches, rotating the file by size. Successful requests can be sampled,
+errors are always kept.
+"""
+
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+
+try:
+    import fcntl
+except ImportError:  # no advisory locks (Windows): run a single server process
+    fcntl = None
+
+FLUSH_INTERVAL = 0.5
+MAX_PENDING = 50000
+MAX_BYTES = 100 * 1024 * 1024
+BACKUPS = 5
+
+
+def format_timestamp(ts):
+    """ISO 8601 UTC with milliseconds"""
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(ts)) + f'.{int(ts % 1 * 1000):03d}Z'
+
+
+class AccessLog:
+    """Buffered JSON-lines request log written by a background thread
+
+    ``path`` is a file, or '-' for stderr. Several processes may share one
+    file: each batch is a single append, and rotation happens under an
+    exclusive lock on the file.
+    """
+
+    def __init__(self, path, max_bytes=MAX_BYTES, backups=BACKUPS, sample=1.0,
+                 flush_interval=FLUSH_INTERVAL, max_pending=MAX_PENDING):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.sample = sample
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.pid = os.getpid()
+        # deque.append and popleft are atomic, so handlers never take a lock
+        self.pending = deque()
+        self.dropped = 0
+        self.written = 0
+        self.fd = None
+        if path != '-':
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            self.open()
+        self.closing = threading.Event()
+        self.thread = threading.Thread(target=self.run, name='access-log', daemon=True)
+        self.thread.start()
+
+    def open(self):
+        self.fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def log(self, record):
+        """Queue one request record; never blocks on I/O"""
+        status = record.get('status')
+        if self.sample < 1.0 and status is not None and status < 400 and random.random() >= self.sample:
+            return
+        if len(self.pending) >= self.max_pending:
+            self.dropped += 1
+            return
+        self.pending.append(record)
+
+    def run(self):
+        while not self.closing.wait(self.flush_interval):
+            self.flush()
+        self.flush()
+
+    def flush(self):
+        """Format and write everything queued so far"""
+        pending = self.pending
+        lines = []
+        while pending:
+            record = pending.popleft()
+            record['ts'] = format_timestamp(record['ts'])
+            record['pid'] = self.pid
+            phases = record.pop('phases', None)
+            if phases:
+                record['phases_ms'] = {phase: round(seconds * 1000, 3) for phase, seconds in phases.items()}
+            lines.append(json.dumps(record, separators=(',', ':')))
+        if not lines:
+            return
+        data = ('\n'.join(lines) + '\n').encode('utf-8', 'replace')
+        try:
+            if self.fd is None:
+                sys.stderr.buffer.write(data)
+                sys.stderr.flush()
+            else:
+                self.write(data)
+        except OSError as e:
+            self.dropped += len(lines)
+            sys.stderr.write(f"[DevTechAI Server] Writing the access log failed, dropped {len(lines)} records: {e}\n")
+            return
+        self.written += len(lines)
+
+    def write(self, data):
+        while True:
+            with FileLock(self.fd):
+                try:
+                    current = os.stat(self.path)
+                except FileNotFoundError:
+                    current = None
+                # A changed inode means another process rotated the file: follow it
+                if current is not None and current.st_ino == os.fstat(self.fd).st_ino:
+                    if not self.max_bytes or not current.st_size or current.st_size + len(data) <= self.max_bytes:
+                        os.write(self.fd, data)
+                        return
+                    self.rotate()
+            self.reopen()
+
+    def rotate(self):
+        """access.log -> access.log.1 -> ... -> access.log.<backups>; the oldest is removed"""
+        for index in range(self.backups - 1, 0, -1):
+            source = f'{self.path}.{index}'
+            if os.path.exists(source):
+                os.replace(source, f'{self.path}.{index + 1}')
+        if self.backups > 0:
+            os.replace(self.path, f'{self.path}.1')
+        else:
+            os.unlink(self.path)
+
+    def reopen(self):
+        os.close(self.fd)
+        self.open()
+
+    def close(self):
+        """Write what is queued and stop the writer thread"""
+        self.closing.set()
+        self.thread.join(5.0)
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+class FileLock:
+    """Exclusive flock held while a batch is written or the log is rotated"""
+
+    def __init__(self, fd):
+        self.fd = fd
+
+    def __enter__(self):
+        if fcntl is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info):
+        if fcntl is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
@@ -7,6 +7,8 @@ import os
 import re
 from pathlib import Path
 
+from pagewriter import PageWriter
+
 # Mobile responsive CSS to add
 MOBILE_CSS = '''
   <!-- Mobile Responsive Enhancements -->
@@ -173,11 +175,10 @@ MOBILE_CSS = '''
   </style>
 '''
 
-def add_mobile_css_to_file(file_path):
+def add_mobile_css_to_file(file_path, writer):
     """Add mobile responsive CSS to an HTML file"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = writer.read_text(file_path)
         
         # Check if mobile CSS already exists
         if 'Mobile Responsive Enhancements' in content:
@@ -202,8 +203,7 @@ def add_mobile_css_to_file(file_path):
             else:
                 new_content = content[:insert_pos] + MOBILE_CSS + content[insert_pos:]
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            writer.write(file_path, new_content)
             
             print(f"  ✅ {file_path.name} - Mobile CSS added")
             return True
@@ -215,11 +215,10 @@ def add_mobile_css_to_file(file_path):
         print(f"  ❌ {file_path.name} - Error: {e}")
         return False
 
-def update_logo_in_file(file_path):
+def update_logo_in_file(file_path, writer):
     """Update logo to use logo-img class"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = writer.read_text(file_path)
         
         # Update logo images to use logo-img class
         # Pattern 1: <img src="...logo.png" ... style="height: 40px;...">
@@ -235,10 +234,7 @@ def update_logo_in_file(file_path):
         if 'class="logo-img"' not in content:
             content = re.sub(r'(<img src="[^"]*logo\.png[^"]*")([^>]*>)', r'\1 class="logo-img"\2', content)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        return True
+        return writer.write(file_path, content)
     except Exception as e:
         print(f"  ⚠️  {file_path.name} - Logo update error: {e}")
         return False
@@ -253,19 +249,21 @@ def main():
     total_files = 0
     updated_files = 0
     
-    for dir_name in directories:
-        dir_path = base_dir / dir_name
-        if not dir_path.exists():
-            continue
-        
-        print(f"\n📁 Processing {dir_name}/")
-        html_files = list(dir_path.glob('*.html'))
-        
-        for html_file in html_files:
-            total_files += 1
-            if add_mobile_css_to_file(html_file):
-                updated_files += 1
-            update_logo_in_file(html_file)
+    # Pages are replaced atomically once all of them are updated
+    with PageWriter() as writer:
+        for dir_name in directories:
+            dir_path = base_dir / dir_name
+            if not dir_path.exists():
+                continue
+
+            print(f"\n📁 Processing {dir_name}/")
+            html_files = list(dir_path.glob('*.html'))
+
+            for html_file in html_files:
+                total_files += 1
+                if add_mobile_css_to_file(html_file, writer):
+                    updated_files += 1
+                update_logo_in_file(html_file, writer)
     
     print(f"\n{'='*50}")
     print(f"✅ Processed {total_files} files")
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Site catalog for DevTechAI WebApp v2.0
+Services, team, portfolio and solutions live in data/catalog.json; long page
+bodies live in HTML fragments under data/content/ referenced by each entry.
+The server and the page generators both read the catalog through this module.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'catalog.json')
+SECTIONS = ('services', 'team', 'portfolio', 'solutions')
+
+
+class CatalogError(ValueError):
+    """Raised when the catalog file or one of its content fragments is invalid"""
+
+
+class Catalog:
+    """Immutable snapshot of the catalog, indexed by id and slug per section"""
+
+    def __init__(self, sections, sources, version):
+        self.sections = sections
+        self.sources = sources
+        self.version = version
+        self.by_id = {name: {item['id']: item for item in items} for name, items in sections.items()}
+        self.by_slug = {name: {item['slug']: item for item in items} for name, items in sections.items()}
+
+    def __getitem__(self, section):
+        return self.sections[section]
+
+    def get(self, section, key):
+        """Look up an entry by numeric id or slug"""
+        index = self.by_id if isinstance(key, int) else self.by_slug
+        return index[section].get(key)
+
+    def pages(self, section):
+        """Entries of a section that carry a generated page body"""
+        return [item for item in self.sections[section] if item.get('content') is not None]
+
+    def changed(self):
+        """True when any file this snapshot was built from has changed on disk"""
+        return any(source_signature(path) != signature for path, signature in self.sources.items())
+
+
+def source_signature(path):
+    """(mtime_ns, size) of a file, or None when it is missing"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def load_catalog(path=CATALOG_PATH):
+    """Read the catalog and its content fragments into a Catalog"""
+    base_dir = os.path.dirname(os.path.abspath(path))
+    sources = {path: source_signature(path)}
+    digest = hashlib.blake2b(digest_size=8)
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        data = json.loads(raw)
+    except (OSError, ValueError) as e:
+        raise CatalogError(f"cannot load {path}: {e}") from e
+    digest.update(raw)
+
+    sections = {}
+    for name in SECTIONS:
+        items = data.get(name, [])
+        seen_ids, seen_slugs = set(), set()
+        for item in items:
+            if not isinstance(item.get('id'), int) or not item.get('slug'):
+                raise CatalogError(f"{name} entry without an integer id and a slug: {item!r}")
+            if item['id'] in seen_ids or item['slug'] in seen_slugs:
+                raise CatalogError(f"duplicate {name} entry: {item['slug']}")
+            seen_ids.add(item['id'])
+            seen_slugs.add(item['slug'])
+            if item.get('content'):
+                fragment = os.path.join(base_dir, item['content'])
+                try:
+                    with open(fragment, 'rb') as f:
+                        body = f.read()
+                except OSError as e:
+                    raise CatalogError(f"cannot load content for {name}/{item['slug']}: {e}") from e
+                sources[fragment] = source_signature(fragment)
+                digest.update(body)
+                item['content'] = body.decode('utf-8')
+        sections[name] = tuple(items)
+    return Catalog(sections, sources, digest.hexdigest())
+
+
+class CatalogWatcher:
+    """Polls the catalog files and swaps in a fresh snapshot when they change"""
+
+    def __init__(self, path=CATALOG_PATH, interval=2.0):
+        self.path = path
+        self.interval = interval
+        self.catalog = load_catalog(path)
+        self.listeners = []
+        self._stop = threading.Event()
+        self._thread = None
+
+    def subscribe(self, listener):
+        """Call listener(catalog) now and after every successful reload"""
+        self.listeners.append(listener)
+        listener(self.catalog)
+
+    def check(self):
+        """Reload if any source changed; a broken edit keeps the previous snapshot"""
+        if not self.catalog.changed():
+            return False
+        try:
+            catalog = load_catalog(self.path)
+        except CatalogError as e:
+            sys.stderr.write(f"[DevTechAI Server] Catalog reload failed, keeping version {self.catalog.version}: {e}\n")
+            # Remember the broken files so the error is reported once per edit
+            self.catalog.sources = {path: source_signature(path) for path in self.catalog.sources}
+            return False
+        self.catalog = catalog
+        for listener in self.listeners:
+            listener(catalog)
+        sys.stderr.write(f"[DevTechAI Server] Catalog reloaded (version {catalog.version})\n")
+        return True
+
+    def start(self):
+        """Start the background polling thread (no-op when interval is 0)"""
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name='catalog-watcher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Streaming request body parsing for DevTechAI WebApp v2.0
+Form posts are read in small chunks (Content-Length or chunked framing) and
+fed to an incremental urlencoded or multipart parser, so memory per request
+stays bounded by the configured caps no matter what the client sends.
+"""
+
+import re
+from urllib.parse import unquote_plus
+
+CHUNK_SIZE = 16 * 1024
+MAX_FORM_BYTES = 64 * 1024
+MAX_FORM_FIELDS = 32
+MAX_FIELD_BYTES = 16 * 1024
+MAX_PART_HEADER_BYTES = 4 * 1024
+MAX_CHUNK_LINE = 1024
+MAX_TRAILER_BYTES = 4 * 1024
+CHUNK_SIZE_RE = re.compile(rb'[0-9A-Fa-f]{1,16}\Z')
+
+
+class RequestBodyError(ValueError):
+    """A request body that cannot be accepted; ``status`` is the HTTP code to answer with"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class Form:
+    """Fields extracted from a form post; uploaded files are counted, not kept"""
+
+    def __init__(self):
+        self.fields = []
+        self.files = []
+
+    def get(self, name, default=None):
+        for field, value in self.fields:
+            if field == name:
+                return value
+        return default
+
+    def __contains__(self, name):
+        return any(field == name for field, _ in self.fields)
+
+
+def body_length(transfer_encoding, content_length, max_bytes):
+    """Declared body size, or None for a chunked body; rejects oversized bodies before reading"""
+    if transfer_encoding is not None:
+        if transfer_encoding.strip().lower() != 'chunked':
+            raise RequestBodyError(501, f"Unsupported Transfer-Encoding: {transfer_encoding}")
+        return None
+    if content_length is None:
+        return 0
+    if not content_length.strip().isdigit():
+        raise RequestBodyError(400, "Bad Content-Length")
+    length = int(content_length)
+    if length > max_bytes:
+        raise RequestBodyError(413, f"Request body too large (limit {max_bytes} bytes)")
+    return length
+
+
+def iter_body(rfile, length, max_bytes, chunk_size=CHUNK_SIZE):
+    """Yield the body from a blocking stream in chunks of at most chunk_size"""
+    if length is not None:
+        remaining = length
+        while remaining:
+            data = rfile.read(min(remaining, chunk_size))
+            if not data:
+                raise RequestBodyError(400, "Incomplete request body")
+            remaining -= len(data)
+            yield data
+        return
+
+    received = 0
+    while True:
+        size = chunk_header(rfile.readline(MAX_CHUNK_LINE + 1))
+        if size == 0:
+            break
+        received += size
+        if received > max_bytes:
+            raise RequestBodyError(413, f"Request body too large (limit {max_bytes} bytes)")
+        while size:
+            data = rfile.read(min(size, chunk_size))
+            if not data:
+                raise RequestBodyError(400, "Incomplete request body")
+            size -= len(data)
+            yield data
+        if rfile.readline(MAX_CHUNK_LINE + 1) != b'\r\n':
+            raise RequestBodyError(400, "Bad chunk terminator")
+    # Trailer fields are read and ignored
+    trailer_bytes = 0
+    while True:
+        line = rfile.readline(MAX_CHUNK_LINE + 1)
+        if line in (b'\r\n', b'\n', b''):
+            break
+        trailer_bytes = count_trailer(trailer_bytes, line)
+
+
+async def aiter_body(reader, length, max_bytes, chunk_size=CHUNK_SIZE):
+    """Yield the body from an asyncio StreamReader in chunks of at most chunk_size"""
+    if length is not None:
+        remaining = length
+        while remaining:
+            data = await reader.read(min(remaining, chunk_size))
+            if not data:
+                raise RequestBodyError(400, "Incomplete request body")
+            remaining -= len(data)
+            yield data
+        return
+
+    received = 0
+    while True:
+        size = chunk_header(await read_line(reader))
+        if size == 0:
+            break
+        received += size
+        if received > max_bytes:
+            raise RequestBodyError(413, f"Request body too large (limit {max_bytes} bytes)")
+        while size:
+            data = await reader.read(min(size, chunk_size))
+            if not data:
+                raise RequestBodyError(400, "Incomplete request body")
+            size -= len(data)
+            yield data
+        if await read_line(reader) != b'\r\n':
+            raise RequestBodyError(400, "Bad chunk terminator")
+    trailer_bytes = 0
+    while True:
+        line = await read_line(reader)
+        if line in (b'\r\n', b'\n', b''):
+            break
+        trailer_bytes = count_trailer(trailer_bytes, line)
+
+
+async def read_line(reader):
+    """Read one framing line; an over-long line is a malformed body, not a crash"""
+    try:
+        return await reader.readline()
+    except ValueError:
+        raise RequestBodyError(400, "Bad chunk size line") from None
+
+
+def count_trailer(received, line):
+    """Add a trailer line to the bytes seen so far; trailers get a small cap of their own"""
+    received += len(line)
+    if received > MAX_TRAILER_BYTES:
+        raise RequestBodyError(431, "Request trailer fields too large")
+    return received
+
+
+def chunk_header(line):
+    """Size from a chunk-size line (extensions ignored)"""
+    if not line.endswith(b'\n') or len(line) > MAX_CHUNK_LINE:
+        raise RequestBodyError(400, "Bad chunk size line")
+    # Hex digits only: int() would also take signs and underscores, and -1 reads to EOF
+    match = CHUNK_SIZE_RE.match(line.split(b';', 1)[0].strip(b' \t\r\n'))
+    if match is None:
+        raise RequestBodyError(400, "Bad chunk size line")
+    return int(match.group(), 16)
+
+
+def content_type_params(value):
+    """Split a Content-Type or Content-Disposition value into (main value, params)"""
+    main, _, rest = value.partition(';')
+    params = {}
+    for match in re.finditer(r';?\s*([\w.-]+)\s*=\s*(?:"((?:[^"\\]|\\.)*)"|([^;\s]*))', ';' + rest):
+        params[match.group(1).lower()] = match.group(2) if match.group(2) is not None else match.group(3)
+    return main.strip().lower(), params
+
+
+class UrlEncodedParser:
+    """Incremental application/x-www-form-urlencoded parser"""
+
+    def __init__(self, max_fields=MAX_FORM_FIELDS, max_field_bytes=MAX_FIELD_BYTES):
+        self.form = Form()
+        self.max_fields = max_fields
+        # Percent-encoding can triple the size of a value on the wire
+        self.max_pair_bytes = max_field_bytes * 3
+        self.buffer = b''
+
+    def feed(self, data):
+        self.buffer += data
+        *pairs, self.buffer = self.buffer.split(b'&')
+        for pair in pairs:
+            self.add(pair)
+        if len(self.buffer) > self.max_pair_bytes:
+            raise RequestBodyError(413, "Form field too large")
+
+    def close(self):
+        self.add(self.buffer)
+        self.buffer = b''
+        return self.form
+
+    def add(self, pair):
+        if not pair:
+            return
+        if len(self.form.fields) >= self.max_fields:
+            raise RequestBodyError(413, "Too many form fields")
+        name, _, value = pair.partition(b'=')
+        self.form.fields.append((unquote_plus(name.decode('utf-8', 'replace')),
+                                 unquote_plus(value.decode('utf-8', 'replace'))))
+
+
+class MultipartParser:
+    """Incremental multipart/form-data parser; file contents are counted and dropped"""
+
+    def __init__(self, boundary, max_fields=MAX_FORM_FIELDS, max_field_bytes=MAX_FIELD_BYTES):
+        self.form = Form()
+        self.max_fields = max_fields
+        self.max_field_bytes = max_field_bytes
+        self.delimiter = b'\r\n--' + boundary.encode('latin-1')
+        # The leading CRLF lets the first boundary match like all the others
+        self.buffer = b'\r\n'
+        self.state = 'preamble'
+        self.part = None
+
+    def feed(self, data):
+        self.buffer += data
+        while self.step():
+            pass
+
+    def close(self):
+        if self.state != 'done':
+            raise RequestBodyError(400, "Truncated multipart body")
+        return self.form
+
+    def step(self):
+        """Consume as much of the buffer as the current state allows"""
+        if self.state == 'preamble':
+            index = self.buffer.find(self.delimiter)
+            if index < 0:
+                self.buffer = self.buffer[-len(self.delimiter):]
+                return False
+            self.buffer = self.buffer[index + len(self.delimiter):]
+            self.state = 'boundary'
+            return True
+
+        if self.state == 'boundary':
+            if len(self.buffer) < 2:
+                return False
+            if self.buffer.startswith(b'--'):
+                self.state = 'done'
+                self.buffer = b''
+                return False
+            end = self.buffer.find(b'\r\n')
+            if end < 0:
+                if len(self.buffer) > MAX_CHUNK_LINE:
+                    raise RequestBodyError(400, "Bad multipart boundary")
+                return False
+            self.buffer = self.buffer[end + 2:]
+            self.state = 'headers'
+            return True
+
+        if self.state == 'headers':
+            end = self.buffer.find(b'\r\n\r\n')
+            if end < 0:
+                if len(self.buffer) > MAX_PART_HEADER_BYTES:
+                    raise RequestBodyError(431, "Multipart headers too large")
+                return False
+            self.start_part(self.buffer[:end])
+            self.buffer = self.buffer[end + 4:]
+            self.state = 'body'
+            return True
+
+        if self.state == 'body':
+            index = self.buffer.find(self.delimiter)
+            if index < 0:
+                # Keep a tail that could be the start of a delimiter split across chunks
+                keep = len(self.delimiter) - 1
+                if len(self.buffer) > keep:
+                    self.part_data(self.buffer[:-keep])
+                    self.buffer = self.buffer[-keep:]
+                return False
+            self.part_data(self.buffer[:index])
+            self.finish_part()
+            self.buffer = self.buffer[index + len(self.delimiter):]
+            self.state = 'boundary'
+            return True
+
+        # 'done': the epilogue is ignored
+        self.buffer = b''
+        return False
+
+    def start_part(self, raw_headers):
+        if len(self.form.fields) + len(self.form.files) >= self.max_fields:
+            raise RequestBodyError(413, "Too many form fields")
+        disposition = ''
+        for line in raw_headers.decode('utf-8', 'replace').split('\r\n'):
+            name, _, value = line.partition(':')
+            if name.strip().lower() == 'content-disposition':
+                disposition = value
+        _, params = content_type_params(disposition)
+        if 'name' not in params:
+            raise RequestBodyError(400, "Multipart part without a field name")
+        self.part = {'name': params['name'], 'filename': params.get('filename'), 'size': 0, 'chunks': []}
+
+    def part_data(self, data):
+        if not data:
+            return
+        part = self.part
+        part['size'] += len(data)
+        if part['filename'] is not None:
+            return
+        if part['size'] > self.max_field_bytes:
+            raise RequestBodyError(413, "Form field too large")
+        part['chunks'].append(data)
+
+    def finish_part(self):
+        part = self.part
+        if part['filename'] is not None:
+            self.form.files.append((part['name'], part['filename'], part['size']))
+        else:
+            self.form.fields.append((part['name'], b''.join(part['chunks']).decode('utf-8', 'replace')))
+        self.part = None
+
+
+def parser_for(content_type, max_fields=MAX_FORM_FIELDS, max_field_bytes=MAX_FIELD_BYTES):
+    """Incremental parser for a form Content-Type"""
+    media_type, params = content_type_params(content_type or '')
+    if media_type == 'application/x-www-form-urlencoded':
+        return UrlEncodedParser(max_fields, max_field_bytes)
+    if media_type == 'multipart/form-data':
+        boundary = params.get('boundary')
+        if not boundary or len(boundary) > 70:
+            raise RequestBodyError(400, "Missing or invalid multipart boundary")
+        return MultipartParser(boundary, max_fields, max_field_bytes)
+    raise RequestBodyError(415, f"Unsupported form Content-Type: {media_type or 'none'}")
+
+
+def read_form(rfile, content_type, length, max_bytes):
+    """Parse a form from a blocking stream without holding the whole body"""
+    if length == 0:
+        return Form()
+    parser = parser_for(content_type)
+    for data in iter_body(rfile, length, max_bytes):
+        parser.feed(data)
+    return parser.close()
+
+
+async def read_form_async(reader, content_type, length, max_bytes):
+    """Parse a form from an asyncio StreamReader without holding the whole body"""
+    if length == 0:
+        return Form()
+    parser = parser_for(content_type)
+    async for data in aiter_body(reader, length, max_bytes):
+        parser.feed(data)
+    return parser.close()
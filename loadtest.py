@@ -0,0 +1,512 @@
+#!/usr/bin/env python3
+"""
+Load tests for the DevTechAI WebApp v2.0 server
+Starts server.py on a free local port, drives it with the scenarios below
+from separate client processes and reports throughput, latency percentiles
+and the server's peak RSS. Results can be stored as a baseline and later
+runs compared against it.
+
+    python3 loadtest.py                                # all scenarios, threaded mode
+    python3 loadtest.py --modes threaded,asyncio --scenarios api-burst,form-flood
+    python3 loadtest.py --save-baseline                # record loadtest-baseline.json
+    python3 loadtest.py --compare                      # exit 1 on a regression
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import platform
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from html.parser import HTMLParser
+from urllib.parse import urlparse
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(ROOT, 'loadtest-baseline.json')
+SERVER_MODES = ('single', 'threaded', 'prefork', 'asyncio')
+# Connections opened by each slowloris client, and seconds between the header lines they trickle
+SLOWLORIS_CONNECTIONS = 64
+SLOWLORIS_INTERVAL = 1.0
+# A response taking longer than this counts as an error
+REQUEST_TIMEOUT = 5.0
+API_TARGETS = (
+    '/api/health',
+    '/api/services',
+    '/api/team?fields=id,name',
+    '/api/portfolio?category=ai&limit=3',
+    '/api/batch?r=health,services,team',
+)
+FORM_BODY = 'name=Load+Test&email=load%40example.com&subject=Benchmark&message=Hello+from+loadtest.py'
+# Relative change from the baseline that counts as a regression
+TOLERANCE = 0.20
+# p99 differences below this many milliseconds are noise, whatever the ratio
+P99_FLOOR_MS = 2.0
+# Share of failed requests (connection errors and 4xx/5xx) that fails a scenario
+MAX_ERROR_RATE = 0.001
+
+
+class PageAssets(HTMLParser):
+    """Same-site URLs a browser fetches while loading a page"""
+
+    def __init__(self):
+        super().__init__()
+        self.urls = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'link' and attrs.get('href') and \
+                set((attrs.get('rel') or '').split()) & {'stylesheet', 'icon', 'apple-touch-icon', 'preload'}:
+            self.add(attrs['href'])
+        elif tag in ('script', 'img') and attrs.get('src'):
+            self.add(attrs['src'])
+
+    def add(self, url):
+        parsed = urlparse(url)
+        if parsed.scheme or parsed.netloc:
+            return
+        path = '/' + parsed.path.lstrip('/')
+        if os.path.isfile(os.path.join(ROOT, path.lstrip('/'))):
+            self.urls.append(path + ('?' + parsed.query if parsed.query else ''))
+
+
+def page_requests(page='index.html'):
+    """The page itself followed by its assets, in document order, without repeats"""
+    parser = PageAssets()
+    with open(os.path.join(ROOT, page), encoding='utf-8') as f:
+        parser.feed(f.read())
+    return ['/' + page] + list(dict.fromkeys(parser.urls))
+
+
+def build_request(method, target, keep_alive, body=None, content_type=None):
+    lines = [f'{method} {target} HTTP/1.1', 'Host: localhost', 'User-Agent: devtechai-loadtest',
+             'Accept-Encoding: gzip, br']
+    if not keep_alive:
+        lines.append('Connection: close')
+    if body is not None:
+        lines.append(f'Content-Type: {content_type}')
+        lines.append(f'Content-Length: {len(body)}')
+    return ('\r\n'.join(lines) + '\r\n\r\n' + (body or '')).encode('latin-1')
+
+
+class Scenario:
+    """Requests each virtual client sends in a loop, over keep-alive connections or not"""
+
+    def __init__(self, name, description, requests, keep_alive=True, slowloris=0):
+        self.name = name
+        self.description = description
+        self.requests = [build_request(method, target, keep_alive, *body) for method, target, *body in requests]
+        self.keep_alive = keep_alive
+        self.slowloris = slowloris
+
+
+def build_scenarios():
+    static = [('GET', target) for target in page_requests()]
+    form = ('POST', '/forms/contact.php', FORM_BODY, 'application/x-www-form-urlencoded')
+    scenarios = [
+        Scenario('static-keepalive', "index.html and its assets over keep-alive connections", static),
+        Scenario('static-close', "index.html and its assets, one connection per request", static,
+                 keep_alive=False),
+        Scenario('api-burst', "API collection, filter and batch queries", [('GET', target) for target in API_TARGETS]),
+        Scenario('form-flood', "Contact form posts", [form]),
+        Scenario('slowloris', f"Static keep-alive mix while {SLOWLORIS_CONNECTIONS} clients trickle headers",
+                 static, slowloris=SLOWLORIS_CONNECTIONS),
+    ]
+    return {scenario.name: scenario for scenario in scenarios}
+
+
+async def read_response(reader):
+    """Read one response; returns (status, whether the server keeps the connection)"""
+    head = await reader.readuntil(b'\r\n\r\n')
+    status = int(head[9:12])
+    length = 0
+    keep_alive = True
+    for line in head.split(b'\r\n')[1:]:
+        name, _, value = line.partition(b':')
+        name = name.strip().lower()
+        if name == b'content-length':
+            length = int(value)
+        elif name == b'connection':
+            keep_alive = value.strip().lower() != b'close'
+    if length:
+        await reader.readexactly(length)
+    return status, keep_alive
+
+
+async def virtual_client(port, scenario, offset, record_from, stop_at, latencies, statuses, errors):
+    requests = scenario.requests
+    position = offset % len(requests)
+    reader = writer = None
+    loop = asyncio.get_running_loop()
+    while loop.time() < stop_at:
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection('127.0.0.1', port)
+                writer.get_extra_info('socket').setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            started = loop.time()
+            writer.write(requests[position])
+            status, keep_alive = await asyncio.wait_for(read_response(reader), REQUEST_TIMEOUT)
+            finished = loop.time()
+        except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError, ValueError):
+            errors[0] += 1
+            keep_alive = False
+            await asyncio.sleep(0.01)
+        else:
+            if started >= record_from and finished <= stop_at:
+                latencies.append(finished - started)
+                statuses[status] += 1
+        position = (position + 1) % len(requests)
+        if writer is not None and not (keep_alive and scenario.keep_alive):
+            writer.close()
+            reader = writer = None
+    if writer is not None:
+        writer.close()
+
+
+async def slowloris_client(port, stop_at, open_counts):
+    """Hold a connection open by sending one header line at a time, reconnecting when dropped"""
+    loop = asyncio.get_running_loop()
+    while loop.time() < stop_at:
+        try:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(b'GET / HTTP/1.1\r\nHost: localhost\r\n')
+            while loop.time() < stop_at:
+                await asyncio.sleep(SLOWLORIS_INTERVAL)
+                if reader.at_eof():
+                    break
+                writer.write(b'X-Trickle: 1\r\n')
+                await writer.drain()
+            else:
+                open_counts[0] += 1
+            writer.close()
+        except OSError:
+            await asyncio.sleep(SLOWLORIS_INTERVAL)
+
+
+async def drive(port, scenario, connections, offset, warmup, duration, slowloris):
+    loop = asyncio.get_running_loop()
+    record_from = loop.time() + warmup
+    stop_at = record_from + duration
+    latencies = []
+    statuses = Counter()
+    errors = [0]
+    open_counts = [0]
+    tasks = [virtual_client(port, scenario, offset + index, record_from, stop_at, latencies, statuses, errors)
+             for index in range(connections)]
+    tasks += [slowloris_client(port, stop_at, open_counts) for _ in range(slowloris)]
+    await asyncio.gather(*tasks)
+    return latencies, statuses, errors[0], open_counts[0]
+
+
+def client_process(args):
+    """Entry point of one load-generating process"""
+    port, scenario, connections, offset, warmup, duration, slowloris = args
+    return asyncio.run(drive(port, scenario, connections, offset, warmup, duration, slowloris))
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def process_tree(pid):
+    """pid and all of its descendants (Linux /proc)"""
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'rb') as f:
+                ppid = int(f.read().rsplit(b')', 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    tree = [pid]
+    for parent in tree:
+        tree.extend(children.get(parent, ()))
+    return tree
+
+
+def tree_rss(pid):
+    """Resident memory of a process and its children in bytes, or None without /proc"""
+    if not os.path.isdir('/proc'):
+        return None
+    total = 0
+    for member in process_tree(pid):
+        try:
+            with open(f'/proc/{member}/statm', 'rb') as f:
+                total += int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except (OSError, ValueError, IndexError):
+            pass
+    return total
+
+
+class RssSampler:
+    """Peak RSS of the server process tree, sampled in the background"""
+
+    def __init__(self, pid, interval=0.25):
+        self.pid = pid
+        self.interval = interval
+        self.peak = None
+        self.stopping = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while not self.stopping.wait(self.interval):
+            rss = tree_rss(self.pid)
+            if rss is not None:
+                self.peak = max(self.peak or 0, rss)
+
+    def stop(self):
+        self.stopping.set()
+        self.thread.join()
+        return self.peak
+
+
+class ServerProcess:
+    """server.py running in a scratch directory for submissions, WAL and logs"""
+
+    def __init__(self, mode, workers, extra_args=()):
+        self.port = free_port()
+        self.scratch = tempfile.TemporaryDirectory(prefix='devtechai-loadtest-')
+        var = self.scratch.name
+        command = [
+            sys.executable, os.path.join(ROOT, 'server.py'),
+            '--host', '127.0.0.1', '--port', str(self.port), '--mode', mode, '--workers', str(workers),
+            '--submissions', f'sqlite:{os.path.join(var, "submissions.db")}',
+            '--wal-dir', os.path.join(var, 'wal'),
+            '--subscribers-dir', os.path.join(var, 'subscribers'),
+            '--access-log', os.path.join(var, 'access.log'),
+            '--trace-dir', os.path.join(var, 'traces'),
+            # Every client is 127.0.0.1, so per-client limits would only measure 429s
+            '--form-rate-limit', 'off', '--api-rate-limit', 'off',
+        ] + list(extra_args)
+        self.log = open(os.path.join(var, 'server.log'), 'wb')
+        self.process = subprocess.Popen(command, cwd=ROOT, stdout=self.log, stderr=subprocess.STDOUT)
+        self.wait_ready()
+
+    def wait_ready(self, timeout=15.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"server.py exited with status {self.process.returncode}:\n{self.output()}")
+            try:
+                with socket.create_connection(('127.0.0.1', self.port), timeout=1.0) as sock:
+                    sock.sendall(build_request('GET', '/api/health', False))
+                    if sock.recv(12).startswith(b'HTTP/1.1 200'):
+                        return
+            except OSError:
+                pass
+            time.sleep(0.1)
+        self.stop()
+        raise RuntimeError(f"server.py did not answer within {timeout:g}s:\n{self.output()}")
+
+    def output(self):
+        self.log.flush()
+        with open(self.log.name, 'rb') as f:
+            return f.read().decode('utf-8', 'replace')[-2000:]
+
+    def stop(self):
+        if self.process.poll() is None:
+            self.process.send_signal(signal.SIGTERM)
+            try:
+                self.process.wait(10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        self.log.close()
+        self.scratch.cleanup()
+
+
+def percentile(ordered, fraction):
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_scenario(config, mode, scenario):
+    """Start a fresh server, load it and summarize what happened"""
+    server = ServerProcess(mode, config.workers, config.server_args)
+    sampler = RssSampler(server.process.pid)
+    processes = max(1, min(config.client_processes, config.connections))
+    shares = [config.connections // processes + (index < config.connections % processes)
+              for index in range(processes)]
+    jobs = [(server.port, scenario, share, sum(shares[:index]), config.warmup, config.duration,
+             scenario.slowloris if index == 0 else 0)
+            for index, share in enumerate(shares)]
+    try:
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.map(client_process, jobs)
+    finally:
+        peak_rss = sampler.stop()
+        server.stop()
+    latencies = sorted(latency for result in results for latency in result[0])
+    statuses = sum((result[1] for result in results), Counter())
+    summary = {
+        'requests': len(latencies),
+        'rps': round(len(latencies) / config.duration, 1),
+        'p50_ms': None if not latencies else round(percentile(latencies, 0.50) * 1000, 3),
+        'p90_ms': None if not latencies else round(percentile(latencies, 0.90) * 1000, 3),
+        'p99_ms': None if not latencies else round(percentile(latencies, 0.99) * 1000, 3),
+        'errors': sum(result[2] for result in results),
+        'non_2xx': sum(count for status, count in statuses.items() if not 200 <= status < 400),
+        'rss_mb': None if peak_rss is None else round(peak_rss / (1024 * 1024), 1),
+    }
+    if scenario.slowloris:
+        summary['slowloris_held'] = sum(result[3] for result in results)
+    return summary
+
+
+def error_rate(result):
+    """Failed share of the requests a scenario sent"""
+    failed = result['errors'] + result['non_2xx']
+    return failed / max(1, result['requests'] + result['errors'])
+
+
+def compare(results, baseline, tolerance, max_error_rate=MAX_ERROR_RATE):
+    """Regressions of ``results`` against ``baseline`` as readable strings"""
+    regressions = []
+    for key, result in results.items():
+        # Failing requests are a regression whether or not the baseline had them
+        if error_rate(result) > max_error_rate:
+            regressions.append(f"{key}: {result['errors']} errors and {result['non_2xx']} error responses "
+                               f"({error_rate(result):.2%}, limit {max_error_rate:.2%})")
+        base = baseline.get(key)
+        if not base:
+            continue
+        if base.get('rps') and result['rps'] < base['rps'] * (1 - tolerance):
+            regressions.append(f"{key}: {result['rps']:g} req/s, baseline {base['rps']:g}")
+        if base.get('p99_ms') is not None and result['p99_ms'] is not None and \
+                result['p99_ms'] > base['p99_ms'] * (1 + tolerance) and \
+                result['p99_ms'] - base['p99_ms'] > P99_FLOOR_MS:
+            regressions.append(f"{key}: p99 {result['p99_ms']:g} ms, baseline {base['p99_ms']:g} ms")
+        if base.get('rss_mb') and result['rss_mb'] is not None and result['rss_mb'] > base['rss_mb'] * (1 + tolerance):
+            regressions.append(f"{key}: {result['rss_mb']:g} MB RSS, baseline {base['rss_mb']:g} MB")
+    return regressions
+
+
+def format_ms(value):
+    return '-' if value is None else f'{value:.2f}'
+
+
+def print_result(key, result):
+    held = f"  slowloris held {result['slowloris_held']}" if 'slowloris_held' in result else ''
+    rss = '-' if result['rss_mb'] is None else f"{result['rss_mb']:.1f}"
+    print(f"{key:<28} {result['rps']:>9.1f} {format_ms(result['p50_ms']):>8} {format_ms(result['p90_ms']):>8} "
+          f"{format_ms(result['p99_ms']):>8} {result['errors'] + result['non_2xx']:>7} {rss:>8}{held}")
+
+
+def machine_info():
+    return {'platform': platform.platform(), 'python': platform.python_version(), 'cpus': os.cpu_count()}
+
+
+def parse_args(argv=None):
+    scenarios = build_scenarios()
+    parser = argparse.ArgumentParser(description='Load tests for the DevTechAI WebApp v2.0 server')
+    parser.add_argument('--modes', default='threaded',
+                        help=f"Comma-separated server modes to test ({', '.join(SERVER_MODES)}; default: threaded)")
+    parser.add_argument('--scenarios', default=','.join(scenarios),
+                        help=f"Comma-separated scenarios (default: all of {', '.join(scenarios)})")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Server worker processes in prefork/asyncio mode (default: CPU count)')
+    parser.add_argument('--connections', type=int, default=32,
+                        help='Concurrent client connections (default: 32)')
+    parser.add_argument('--client-processes', type=int, default=max(1, min(4, (os.cpu_count() or 2) // 2)),
+                        help='Processes generating load (default: half the CPUs, at most 4)')
+    parser.add_argument('--duration', type=float, default=10.0, help='Measured seconds per scenario (default: 10)')
+    parser.add_argument('--warmup', type=float, default=1.0, help='Unmeasured seconds before each run (default: 1)')
+    parser.add_argument('--server-arg', dest='server_args', action='append', default=[],
+                        help='Extra server.py option, e.g. --server-arg=--cache-mb=0 (repeatable)')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='Baseline file (default: loadtest-baseline.json)')
+    parser.add_argument('--save-baseline', action='store_true', help='Store these results as the baseline')
+    parser.add_argument('--compare', action='store_true', help='Exit with status 1 when a result regressed')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE,
+                        help=f'Relative change treated as a regression (default: {TOLERANCE})')
+    parser.add_argument('--max-error-rate', type=float, default=MAX_ERROR_RATE,
+                        help=f'Share of failed requests treated as a regression (default: {MAX_ERROR_RATE})')
+    parser.add_argument('--json', dest='json_path', help='Also write the results to this file')
+    config = parser.parse_args(argv)
+    config.modes = [mode.strip() for mode in config.modes.split(',') if mode.strip()]
+    config.scenarios = [name.strip() for name in config.scenarios.split(',') if name.strip()]
+    for mode in config.modes:
+        if mode not in SERVER_MODES:
+            parser.error(f"unknown mode {mode!r} (choose from {', '.join(SERVER_MODES)})")
+    for name in config.scenarios:
+        if name not in scenarios:
+            parser.error(f"unknown scenario {name!r} (choose from {', '.join(scenarios)})")
+    config.scenarios = [scenarios[name] for name in config.scenarios]
+    if config.connections < 1 or config.duration <= 0 or config.warmup < 0:
+        parser.error("--connections and --duration must be positive")
+    return config
+
+
+def main(argv=None):
+    config = parse_args(argv)
+    baseline = {}
+    if os.path.exists(config.baseline):
+        with open(config.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+    elif config.compare:
+        print(f"❌ No baseline at {config.baseline}; record one with --save-baseline")
+        return 2
+
+    print(f"🚀 Load testing server.py: {config.connections} connections, {config.duration:g}s per scenario")
+    print(f"{'scenario':<28} {'req/s':>9} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'errors':>7} {'RSS MB':>8}")
+    print("-" * 84)
+    results = {}
+    for mode in config.modes:
+        for scenario in config.scenarios:
+            key = f'{mode}/{scenario.name}'
+            try:
+                results[key] = run_scenario(config, mode, scenario)
+            except RuntimeError as e:
+                print(f"❌ {key}: {e}")
+                return 1
+            print_result(key, results[key])
+    print("-" * 84)
+
+    report = {'machine': machine_info(), 'connections': config.connections, 'duration': config.duration,
+              'results': results}
+    if config.json_path:
+        with open(config.json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    status = 0
+    if baseline and baseline.get('machine') != report['machine']:
+        print(f"⚠️  Baseline was recorded on {baseline.get('machine')}; numbers may not be comparable")
+    regressions = compare(results, baseline.get('results', {}), config.tolerance, config.max_error_rate)
+    for regression in regressions:
+        print(f"📉 Regression: {regression}")
+    if not regressions:
+        print(f"✅ No regressions against {os.path.basename(config.baseline)} (tolerance {config.tolerance:.0%})")
+    elif config.compare:
+        status = 1
+
+    if config.save_baseline:
+        stored = baseline.get('results', {}) if baseline.get('machine') == report['machine'] else {}
+        for key, result in results.items():
+            # A failing run is not a reference point for later ones
+            if error_rate(result) > config.max_error_rate:
+                print(f"⚠️  Not saving {key} to the baseline: {error_rate(result):.2%} of its requests failed")
+                stored.pop(key, None)
+            else:
+                stored[key] = result
+        report['results'] = dict(sorted(stored.items()))
+        with open(config.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f"💾 Baseline saved to {config.baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
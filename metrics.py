@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Prometheus metrics for DevTechAI WebApp v2.0
+Counters and fixed-bucket latency histograms live in a flat array of doubles
+with one block per worker process. The array is an anonymous shared mapping
+created before the workers fork, so whichever worker answers /metrics reports
+the sum of all of them, while each process only ever writes its own block.
+"""
+
+import bisect
+import mmap
+import os
+import sys
+import threading
+import time
+
+ROUTES = ('static', 'api', 'forms', 'metrics', 'admin')
+METHODS = ('GET', 'HEAD', 'POST', 'OTHER')
+# Status codes the server sends; anything else is counted as "other"
+STATUS_CODES = (200, 204, 206, 301, 304, 400, 404, 405, 408, 411, 413, 414, 415, 416, 429, 431,
+                500, 501, 503)
+# Upper bounds (seconds) of the request latency histogram; +Inf is implied
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Per-process values refreshed by the sampler thread: (name, type, help)
+SAMPLED = (
+    ('devtechai_static_cache_hits_total', 'counter', 'Static file lookups answered from memory'),
+    ('devtechai_static_cache_misses_total', 'counter', 'Static file lookups that read the file'),
+    ('devtechai_static_cache_bytes', 'gauge', 'Bytes of file bodies held in the static cache'),
+    ('devtechai_api_cache_hits_total', 'counter', 'API queries answered from a serialized response'),
+    ('devtechai_api_cache_misses_total', 'counter', 'API queries that had to be serialized'),
+    ('devtechai_submissions_pending', 'gauge', 'Form submissions waiting for the sink'),
+    ('devtechai_submissions_delivered_total', 'counter', 'Form submissions delivered to the sink'),
+    ('devtechai_access_log_dropped_total', 'counter', 'Access log records dropped because the writer fell behind'),
+    ('process_cpu_seconds_total', 'counter', 'User and system CPU time of the worker processes'),
+    ('process_resident_memory_bytes', 'gauge', 'Resident memory of the worker processes'),
+    ('process_start_time_seconds', 'gauge', 'Start time of the oldest worker since the epoch'),
+)
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+SAMPLE_INTERVAL = 1.0
+
+STATUS_INDEX = {code: position for position, code in enumerate(STATUS_CODES)}
+METHOD_INDEX = {method: position for position, method in enumerate(METHODS)}
+ROUTE_INDEX = {route: position for position, route in enumerate(ROUTES)}
+
+# Layout of one worker's block
+REQUESTS_AT = 0
+REQUESTS_SIZE = len(ROUTES) * len(METHODS) * (len(STATUS_CODES) + 1)
+HISTOGRAM_AT = REQUESTS_AT + REQUESTS_SIZE
+HISTOGRAM_WIDTH = len(LATENCY_BUCKETS) + 2  # per-bucket counts, +Inf, sum
+BYTES_AT = HISTOGRAM_AT + len(ROUTES) * HISTOGRAM_WIDTH
+IN_FLIGHT_AT = BYTES_AT + len(ROUTES)
+SAMPLED_AT = IN_FLIGHT_AT + 1
+BLOCK_SIZE = SAMPLED_AT + len(SAMPLED)
+
+SAMPLED_INDEX = {name: SAMPLED_AT + position for position, (name, _, _) in enumerate(SAMPLED)}
+
+
+def route_for(path):
+    """Route label for a request path"""
+    if path.startswith('/api/'):
+        return 'api'
+    if path.startswith('/forms/'):
+        return 'forms'
+    if path == '/metrics':
+        return 'metrics'
+    if path.startswith('/admin/'):
+        return 'admin'
+    return 'static'
+
+
+def format_value(value):
+    """Sample value in the shortest form that round-trips"""
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def resident_memory():
+    """Current RSS in bytes (peak RSS where /proc is unavailable)"""
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    # ru_maxrss is in KiB on Linux, bytes on macOS
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+class Metrics:
+    """Request metrics for ``workers`` processes sharing one anonymous mapping"""
+
+    def __init__(self, workers=1):
+        self.workers = workers
+        self.buffer = mmap.mmap(-1, workers * BLOCK_SIZE * 8)
+        self.values = memoryview(self.buffer).cast('d')
+        self.bind(0)
+
+    def bind(self, slot):
+        """Make this process write to worker block ``slot`` (called after fork)"""
+        self.base = slot * BLOCK_SIZE
+        self.lock = threading.Lock()
+        self.sources = []
+        self.sampler = None
+        values = self.values
+        # A restarted worker carries on the counters of the one it replaces; its
+        # sampled counters start from zero, so they are added to the old values
+        values[self.base + IN_FLIGHT_AT] = 0
+        self.offsets = {name: values[self.base + SAMPLED_INDEX[name]]
+                        for name, kind, _ in SAMPLED if kind == 'counter'}
+        self.started_at = time.time()
+
+    def start_request(self):
+        """Count a request as in flight until finish_request"""
+        with self.lock:
+            self.values[self.base + IN_FLIGHT_AT] += 1
+
+    def finish_request(self, elapsed, path, method, status, body_bytes):
+        """Record a completed request that took ``elapsed`` seconds"""
+        if method == 'HEAD':
+            body_bytes = 0
+        route = ROUTE_INDEX[route_for(path)] if path is not None else ROUTE_INDEX['static']
+        counter = (route * len(METHODS) + METHOD_INDEX.get(method, METHOD_INDEX['OTHER'])) \
+            * (len(STATUS_CODES) + 1) + STATUS_INDEX.get(status, len(STATUS_CODES))
+        histogram = self.base + HISTOGRAM_AT + route * HISTOGRAM_WIDTH
+        bucket = bisect.bisect_left(LATENCY_BUCKETS, elapsed)
+        values = self.values
+        with self.lock:
+            values[self.base + IN_FLIGHT_AT] -= 1
+            values[self.base + REQUESTS_AT + counter] += 1
+            values[histogram + bucket] += 1
+            values[histogram + HISTOGRAM_WIDTH - 1] += elapsed
+            values[self.base + BYTES_AT + route] += body_bytes
+
+    def add_source(self, source):
+        """Register source() -> {sampled name: value}, polled by the sampler thread"""
+        self.sources.append(source)
+
+    def sample(self):
+        """Copy this process's cache, queue and resource figures into its block"""
+        sampled = {
+            'process_cpu_seconds_total': time.process_time(),
+            'process_resident_memory_bytes': resident_memory(),
+            'process_start_time_seconds': self.started_at,
+        }
+        for source in self.sources:
+            sampled.update(source())
+        for name, value in sampled.items():
+            self.values[self.base + SAMPLED_INDEX[name]] = self.offsets.get(name, 0.0) + value
+
+    def start_sampler(self, interval=SAMPLE_INTERVAL):
+        """Refresh the sampled values in the background"""
+        if self.sampler is not None:
+            return
+        self.sample()
+        self.sampler = threading.Thread(target=self._sample_loop, args=(interval,), name='metrics-sampler',
+                                        daemon=True)
+        self.sampler.start()
+
+    def _sample_loop(self, interval):
+        while True:
+            time.sleep(interval)
+            self.sample()
+
+    def totals(self):
+        """Every worker's block summed, except the start time which is the earliest"""
+        values = self.values
+        totals = [0.0] * BLOCK_SIZE
+        for slot in range(self.workers):
+            block = values[slot * BLOCK_SIZE:(slot + 1) * BLOCK_SIZE].tolist()
+            totals = [total + value for total, value in zip(totals, block)]
+        start_index = SAMPLED_INDEX['process_start_time_seconds']
+        starts = [values[slot * BLOCK_SIZE + start_index] for slot in range(self.workers)]
+        totals[start_index] = min((start for start in starts if start), default=0.0)
+        return totals
+
+    def render(self):
+        """The Prometheus text exposition of all workers"""
+        self.sample()
+        totals = self.totals()
+        lines = [
+            '# HELP http_requests_total HTTP requests by route, method and status code.',
+            '# TYPE http_requests_total counter',
+        ]
+        status_labels = [str(code) for code in STATUS_CODES] + ['other']
+        limited = [0.0] * len(ROUTES)
+        for r, route in enumerate(ROUTES):
+            for m, method in enumerate(METHODS):
+                for s, status in enumerate(status_labels):
+                    value = totals[REQUESTS_AT + (r * len(METHODS) + m) * len(status_labels) + s]
+                    if value:
+                        lines.append(f'http_requests_total{{route="{route}",method="{method}",'
+                                     f'status_code="{status}"}} {format_value(value)}')
+                    if status == '429':
+                        limited[r] += value
+
+        lines += [
+            '# HELP http_request_duration_seconds Time from reading the request to sending the response.',
+            '# TYPE http_request_duration_seconds histogram',
+        ]
+        for r, route in enumerate(ROUTES):
+            histogram = HISTOGRAM_AT + r * HISTOGRAM_WIDTH
+            cumulative = 0.0
+            for b, bound in enumerate(LATENCY_BUCKETS + (float('inf'),)):
+                cumulative += totals[histogram + b]
+                le = '+Inf' if b == len(LATENCY_BUCKETS) else f'{bound:g}'
+                lines.append(f'http_request_duration_seconds_bucket{{route="{route}",le="{le}"}} '
+                             f'{format_value(cumulative)}')
+            elapsed = totals[histogram + HISTOGRAM_WIDTH - 1]
+            lines.append(f'http_request_duration_seconds_sum{{route="{route}"}} {format_value(elapsed)}')
+            lines.append(f'http_request_duration_seconds_count{{route="{route}"}} {format_value(cumulative)}')
+
+        lines += [
+            '# HELP http_response_body_bytes_total Response body bytes sent.',
+            '# TYPE http_response_body_bytes_total counter',
+        ]
+        lines += [f'http_response_body_bytes_total{{route="{route}"}} {format_value(totals[BYTES_AT + r])}'
+                  for r, route in enumerate(ROUTES)]
+        lines += [
+            '# HELP rate_limit_exceeded_total Requests answered with 429 Too Many Requests.',
+            '# TYPE rate_limit_exceeded_total counter',
+        ]
+        lines += [f'rate_limit_exceeded_total{{route="{route}"}} {format_value(limited[r])}'
+                  for r, route in enumerate(ROUTES)]
+        lines += [
+            '# HELP http_requests_in_flight Requests currently being served.',
+            '# TYPE http_requests_in_flight gauge',
+            f'http_requests_in_flight {format_value(totals[IN_FLIGHT_AT])}',
+            '# HELP devtechai_workers Worker processes serving requests.',
+            '# TYPE devtechai_workers gauge',
+            f'devtechai_workers {self.workers}',
+        ]
+        for name, kind, description in SAMPLED:
+            lines.append(f'# HELP {name} {description}.')
+            lines.append(f'# TYPE {name} {kind}')
+            lines.append(f'{name} {format_value(totals[SAMPLED_INDEX[name]])}')
+        return ('\n'.join(lines) + '\n').encode()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Atomic page writer for DevTechAI WebApp v2.0
+The site builder and the update-*.py scripts write into the live docroot.
+Instead of rewriting pages in place, every file is staged as a temporary file
+next to its target and only renamed over it when the whole batch is ready: the
+server sees either the old or the new page, never a truncated one. Files whose
+bytes would not change are not touched at all.
+"""
+
+import os
+import tempfile
+
+
+class PageWriter:
+    """Stages file writes and publishes them together with commit()
+
+    Used as a context manager, the batch is committed when the block succeeds
+    and discarded when it raises. The temporary files are fsynced together
+    before the first rename, and each directory once after the last.
+    """
+
+    def __init__(self, fsync=True):
+        self.fsync = fsync
+        # target -> temporary file, in the order they were staged
+        self.staged = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+    def read(self, path):
+        """Bytes of ``path`` as this batch will leave it, or None when it does not exist"""
+        path = os.path.abspath(path)
+        return read_file(self.staged.get(path, path))
+
+    def read_text(self, path):
+        return self.read(path).decode('utf-8')
+
+    def write(self, path, data):
+        """Stage ``data`` (str or bytes) for ``path``; returns False when the file already holds it"""
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        path = os.path.abspath(path)
+        if self.read(path) == data:
+            return False
+        if path in self.staged and read_file(path) == data:
+            # A later write in the batch restored what is on disk
+            self.discard(path)
+            return False
+        try:
+            mode = os.stat(path).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = 0o644
+        directory, name = os.path.split(path)
+        fd, temp = tempfile.mkstemp(prefix=f'.{name}.', suffix='.tmp', dir=directory)
+        try:
+            # mkstemp creates the file 0600; keep the permissions the page had
+            os.fchmod(fd, mode)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+        except BaseException:
+            os.unlink(temp)
+            raise
+        self.discard(path)
+        self.staged[path] = temp
+        return True
+
+    def extend(self, staged):
+        """Take over (target, temporary file) pairs staged by another process"""
+        for path, temp in staged:
+            self.discard(path)
+            self.staged[path] = temp
+
+    def discard(self, path):
+        temp = self.staged.pop(os.path.abspath(path), None)
+        if temp is not None:
+            os.unlink(temp)
+
+    def commit(self):
+        """Publish every staged file; returns the targets in the order they were staged"""
+        staged, self.staged = self.staged, {}
+        if self.fsync:
+            for temp in staged.values():
+                fd = os.open(temp, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+        directories = []
+        for path, temp in staged.items():
+            os.replace(temp, path)
+            if os.path.dirname(path) not in directories:
+                directories.append(os.path.dirname(path))
+        if self.fsync:
+            for directory in directories:
+                fsync_directory(directory)
+        return list(staged)
+
+    def abort(self):
+        """Remove every staged temporary file"""
+        for path in list(self.staged):
+            self.discard(path)
+
+
+def remove_leftovers(path):
+    """Delete temporary files that a killed writer left next to ``path`` and its sidecars"""
+    directory, name = os.path.split(os.path.abspath(path))
+    try:
+        entries = os.listdir(directory)
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        if entry.startswith(f'.{name}.') and entry.endswith('.tmp'):
+            try:
+                os.unlink(os.path.join(directory, entry))
+            except FileNotFoundError:
+                pass
+
+
+def read_file(path):
+    """Bytes of a file, or None when it does not exist"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def fsync_directory(path):
+    """Persist renames in ``path`` (not supported on every platform)"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Per-client rate limiting for DevTechAI WebApp v2.0
+Token buckets are kept in GCRA form: one float per client (the time its
+bucket will be full again). Clients live in two generations of plain dicts
+that rotate every ``ttl`` seconds, so idle clients are dropped in O(1) and
+memory stays bounded however many addresses show up. Behind a reverse
+proxy, clients are identified by X-Forwarded-For, but only when the request
+came from one of the configured trusted proxies.
+"""
+
+import ipaddress
+import math
+import re
+import threading
+import time
+
+PERIODS = {'s': 1, 'sec': 1, 'm': 60, 'min': 60, 'h': 3600, 'hour': 3600}
+MAX_CLIENTS = 1000000
+
+
+def parse_limit(spec):
+    """'20/s', '10/min' or '100/h' as (requests, seconds); None for '0' or 'off'"""
+    spec = (spec or '').strip().lower()
+    if spec in ('', '0', 'off', 'none'):
+        return None
+    match = re.fullmatch(r'(\d+)\s*/\s*(\d*)\s*([a-z]+)', spec)
+    if not match or match.group(3) not in PERIODS or int(match.group(1)) == 0:
+        raise ValueError(f"invalid rate limit {spec!r} (use e.g. 20/s, 10/min or off)")
+    return int(match.group(1)), int(match.group(2) or 1) * PERIODS[match.group(3)]
+
+
+def parse_proxies(spec):
+    """'10.0.0.0/8, 127.0.0.1' as a tuple of networks; raises ValueError"""
+    networks = []
+    for part in (spec or '').split(','):
+        part = part.strip()
+        if part:
+            try:
+                networks.append(ipaddress.ip_network(part, strict=False))
+            except ValueError:
+                raise ValueError(f"invalid trusted proxy {part!r} (use addresses or CIDR ranges)") from None
+    return tuple(networks)
+
+
+def is_trusted(address, proxies):
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    if ip.version == 6 and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return any(ip in network for network in proxies)
+
+
+def forwarded_client(peer, forwarded_for, proxies):
+    """The address a request really came from
+
+    That is the peer itself unless the peer is a trusted proxy; then it is the
+    right-most X-Forwarded-For entry that is not a trusted proxy too. Entries
+    further left were written by the client and cannot be trusted.
+    """
+    if not proxies or not forwarded_for or not is_trusted(peer, proxies):
+        return peer
+    address = peer
+    for address in reversed(forwarded_for.split(',')):
+        address = address.strip()
+        if not is_trusted(address, proxies):
+            return address
+    return address
+
+
+def client_key(address):
+    """Bucket key for a client address; IPv6 clients share a bucket per /64"""
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return address
+    if ip.version == 6:
+        if ip.ipv4_mapped is not None:
+            return ip.ipv4_mapped.packed
+        return ip.packed[:8]
+    return ip.packed
+
+
+class RateLimiter:
+    """Token bucket of ``burst`` requests refilled at ``rate`` per second, per client"""
+
+    def __init__(self, rate, burst, max_clients=MAX_CLIENTS):
+        self.interval = 1.0 / rate
+        # A full bucket lets `burst` requests through back to back
+        self.tolerance = (burst - 1) * self.interval
+        # After this long without requests every bucket is full again and can be forgotten
+        self.ttl = max(1.0, burst * self.interval)
+        self.max_clients = max_clients
+        self.current = {}
+        self.previous = {}
+        self.rotated_at = time.monotonic()
+        self.lock = threading.Lock()
+        self.limited = 0
+
+    def check(self, key, now=None):
+        """0 when the request may proceed, otherwise the seconds until it would"""
+        if now is None:
+            now = time.monotonic()
+        with self.lock:
+            if now - self.rotated_at >= self.ttl or len(self.current) >= self.max_clients:
+                self.rotate(now)
+            full_at = self.current.get(key)
+            if full_at is None:
+                full_at = self.previous.pop(key, now)
+            full_at = max(full_at, now)
+            if full_at - now > self.tolerance:
+                self.current[key] = full_at
+                self.limited += 1
+                return full_at - now - self.tolerance
+            self.current[key] = full_at + self.interval
+            return 0
+
+    def rotate(self, now):
+        # Entries left in `previous` were idle for a whole ttl, so their buckets are full
+        self.previous = self.current
+        self.current = {}
+        self.rotated_at = now
+
+    def __len__(self):
+        return len(self.current) + len(self.previous)
+
+
+class RateLimits:
+    """Limiters for URL path prefixes; the first matching prefix applies"""
+
+    def __init__(self, rules, max_clients=MAX_CLIENTS, trusted_proxies=()):
+        self.trusted_proxies = trusted_proxies
+        self.rules = []
+        for prefix, spec in rules:
+            limit = parse_limit(spec)
+            if limit is not None:
+                requests, seconds = limit
+                self.rules.append((prefix, RateLimiter(requests / seconds, requests, max_clients)))
+
+    def __bool__(self):
+        return bool(self.rules)
+
+    def retry_after(self, path, address, forwarded_for=None):
+        """Whole seconds a client must wait before this request is allowed, or 0"""
+        for prefix, limiter in self.rules:
+            if path.startswith(prefix):
+                client = forwarded_client(address, forwarded_for, self.trusted_proxies)
+                wait = limiter.check(client_key(client))
+                return math.ceil(wait) if wait else 0
+        return 0
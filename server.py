@@ -4,128 +4,2507 @@ Simple HTTP Server for DevTechAI WebApp v2.0
 Serves the static files and handles basic routing
 """
 
+import argparse
+import asyncio
+import bisect
+import contextvars
+import datetime
+import email.utils
+import errno
+import functools
+import fnmatch
+import gzip
+import hashlib
+import html
 import http.server
-import socketserver
+import io
+import ipaddress
+import mimetypes
+import posixpath
+import re
+import secrets
+import socket
 import os
+import signal
+import stat
 import sys
-from urllib.parse import urlparse, parse_qs
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, parse_qs, unquote
 import json
 
+from catalog import CATALOG_PATH, CatalogError, CatalogWatcher, load_catalog
+from submissions import QueueFull, SubmissionQueue, sink_from_spec
+from subscribers import SubscriberIndex
+from ratelimit import RateLimits, parse_limit, parse_proxies
+from metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, Metrics
+from accesslog import AccessLog
+from tracing import PROFILE_MODES, Trace, Tracer
+from forms import MAX_FORM_BYTES, RequestBodyError, aiter_body, body_length, iter_body, read_form, read_form_async
+
+try:
+    import brotli
+except ImportError:  # optional: only needed to brotli-compress on the fly
+    brotli = None
+
+SERVER_MODES = ('single', 'threaded', 'prefork', 'asyncio')
+# A prefork worker that exits within WORKER_MIN_UPTIME seconds failed at startup;
+# it is restarted after a doubling delay, and the server gives up after
+# WORKER_MAX_FAST_FAILURES of those in a row
+WORKER_MIN_UPTIME = 10.0
+WORKER_RESTART_DELAY = 0.1
+WORKER_MAX_RESTART_DELAY = 10.0
+WORKER_MAX_FAST_FAILURES = 5
+
+# Canned responses for the simulated form handlers
+FORM_RESPONSES = {
+    '/forms/contact.php': {
+        'status': 'success',
+        'message': 'Your message has been sent successfully. We will get back to you soon!'
+    },
+    '/forms/newsletter.php': {
+        'status': 'success',
+        'message': 'Thank you for subscribing to our newsletter!'
+    },
+}
+# Fields each form must carry (the same ones the site's forms mark required)
+FORM_REQUIRED_FIELDS = {
+    '/forms/contact.php': ('name', 'email', 'subject', 'message'),
+    '/forms/newsletter.php': ('email',),
+}
+# Name a submission is stored under in the submissions queue
+FORM_NAMES = {
+    '/forms/contact.php': 'contact',
+    '/forms/newsletter.php': 'newsletter',
+}
+# Answer sent while the submissions queue is applying backpressure
+QUEUE_FULL_RESPONSE = {
+    'status': 'error',
+    'message': 'We are receiving a lot of messages right now. Please try again in a moment.'
+}
+# Answer sent to a client that is over its rate limit
+RATE_LIMITED_RESPONSE = {
+    'status': 'error',
+    'message': 'Too many requests. Please slow down and try again shortly.'
+}
+# Largest body accepted on non-form POSTs, which is read and dropped
+MAX_BODY_BYTES = 1024 * 1024
+# Prometheus scrape endpoint (see monitoring/prometheus.yml)
+METRICS_PATH = '/metrics'
+# Slow-request tracing settings; answered for loopback clients only
+TRACING_ADMIN_PATH = '/admin/tracing'
+
+
+# Endpoints served from pre-serialized responses (see build_api_responses)
+API_PATHS = ('/api/health', '/api/services', '/api/team', '/api/portfolio', '/api/solutions')
+# Catalog section behind each collection endpoint
+API_SECTIONS = {
+    '/api/services': 'services',
+    '/api/team': 'team',
+    '/api/portfolio': 'portfolio',
+    '/api/solutions': 'solutions',
+}
+# Field matched by ?category= on collections that have one
+API_CATEGORY_FIELDS = {'portfolio': 'category', 'solutions': 'group'}
+# Largest page a client can ask for with ?limit=
+API_MAX_LIMIT = 100
+# /api/batch?r=health,services answers several endpoints in one response
+API_BATCH_PATH = '/api/batch'
+API_BATCH_RESOURCES = {path.rsplit('/', 1)[1]: path for path in API_PATHS}
+
+
+def api_payload(path, catalog):
+    """Return the JSON payload for an API path, or None for unknown endpoints"""
+    if path == '/api/health':
+        return {'status': 'healthy', 'message': 'DevTechAI WebApp v2.0 is running'}
+    section = API_SECTIONS.get(path)
+    if section is None:
+        return None
+    return {section: [api_item(section, item) for item in catalog[section]]}
+
+
+def api_item(section, item):
+    """Public view of a catalog entry; page bodies and build-only fields stay out"""
+    if section == 'services':
+        return {'id': item['id'], 'name': item['name'], 'description': item['description'],
+                'url': f"services/{item['slug']}.html"}
+    elif section == 'team':
+        return {'id': item['id'], 'name': item['name'], 'position': item['position'], 'image': item['image']}
+    elif section == 'portfolio':
+        return {'id': item['id'], 'name': item['name'], 'subtitle': item['subtitle'],
+                'category': item['category'], 'image': f"assets/img/masonry-portfolio/{item['image']}",
+                'url': f"portfolio/{item['slug']}.html"}
+    return {'id': item['id'], 'name': item['name'], 'description': item['description'],
+            'icon': item['icon'], 'group': item['group'], 'url': f"solutions/{item['slug']}.html"}
+
+
+class DeadlineReader(io.RawIOBase):
+    """Socket reader whose recv calls can share one overall deadline
+
+    The socket timeout alone bounds each recv, so a client trickling one byte
+    at a time could hold a worker thread forever; while ``deadline`` is set,
+    every recv only gets the time left until it.
+    """
+
+    def __init__(self, sock, timeout):
+        self.sock = sock
+        self.timeout = timeout
+        self.deadline = None
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self.deadline is not None:
+            remaining = self.deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("request not received in time")
+            self.sock.settimeout(remaining)
+        return self.sock.recv_into(buffer)
+
+    def start(self, seconds):
+        self.deadline = time.monotonic() + seconds
+
+    def stop(self):
+        if self.deadline is not None:
+            self.deadline = None
+            self.sock.settimeout(self.timeout)
+
+
 class DevTechAIHandler(http.server.SimpleHTTPRequestHandler):
+    # Persistent connections: one page load reuses a handful of sockets
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    # Idle keep-alive timeout (seconds) and requests served per connection;
+    # the server overrides both from its configuration.
+    timeout = 5
+    max_keepalive_requests = 100
+    max_form_bytes = MAX_FORM_BYTES
+    # Overall limit for reading a request body, like AsyncHTTPServer.body_timeout
+    body_timeout = 30.0
+    # Cache-Control for static files: first fnmatch pattern on the URL path wins.
+    # Vendor bundles never change in place; HTML is revalidated often.
+    cache_policies = (
+        ('/assets/vendor/*', 'public, max-age=31536000, immutable'),
+        ('/assets/img/*', 'public, max-age=604800'),
+        ('/assets/css/*', 'public, max-age=3600'),
+        ('/assets/js/*', 'public, max-age=3600'),
+        ('*.html', 'public, max-age=300, must-revalidate'),
+        ('*/', 'public, max-age=300, must-revalidate'),
+    )
+    default_cache_control = 'public, max-age=3600'
+    # URLs carrying a version query (logo.png?v=2) change whenever the file does
+    fingerprinted_cache_control = 'public, max-age=31536000, immutable'
+    _connection_header_sent = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=os.getcwd(), **kwargs)
     
+    def setup(self):
+        """Apply the server's keep-alive settings before the socket timeout is set"""
+        self.timeout = getattr(self.server, 'keepalive_timeout', self.timeout)
+        self.max_keepalive_requests = getattr(self.server, 'max_keepalive_requests', self.max_keepalive_requests)
+        self.max_form_bytes = getattr(self.server, 'max_form_bytes', self.max_form_bytes)
+        self.requests_on_connection = 0
+        super().setup()
+        # Read through a DeadlineReader so the request line and headers share
+        # one deadline, like the asyncio engine's wait_for on the header block
+        self.rfile.close()
+        self.head_reader = DeadlineReader(self.connection, self.timeout)
+        self.rfile = io.BufferedReader(self.head_reader)
+    
+    def handle_one_request(self):
+        """Serve one request and record it in the server's metrics"""
+        self.trace = None
+        self.response_status = None
+        self.response_bytes = 0
+        # Waiting for the request and receiving its head share the idle timeout
+        self.head_reader.start(self.timeout)
+        try:
+            super().handle_one_request()
+        finally:
+            self.head_reader.stop()
+            if self.trace is not None:
+                self.record_request(self.trace.finish())
+    
+    def record_request(self, elapsed):
+        """Feed a finished request to the server's metrics, access log and tracer"""
+        metrics = getattr(self.server, 'metrics', None)
+        if metrics is not None:
+            path = urlparse(self.path).path if self.command else None
+            metrics.finish_request(elapsed, path, self.command, self.response_status, self.response_bytes)
+        access_log = getattr(self.server, 'access_log', None)
+        tracer = getattr(self.server, 'tracer', None)
+        if access_log is None and tracer is None:
+            return
+        # Headers are missing when the request line or header block was malformed
+        headers = getattr(self, 'headers', None) if self.command else None
+        record = access_record(
+            self.client_address[0], self.command, self.path if self.command else None,
+            self.request_version, self.response_status, self.response_bytes, elapsed,
+            headers.get('User-Agent') if headers is not None else None,
+            headers.get('Referer') if headers is not None else None, self.trace.phases)
+        if tracer is not None:
+            tracer.end(self.trace, record)
+        if access_log is not None:
+            access_log.log(record)
+    
+    def parse_request(self):
+        """Parse the request and enforce the per-connection request limit"""
+        self._connection_header_sent = False
+        tracer = getattr(self.server, 'tracer', None)
+        self.trace = tracer.begin() if tracer is not None else Trace()
+        metrics = getattr(self.server, 'metrics', None)
+        if metrics is not None:
+            metrics.start_request()
+        ok = super().parse_request()
+        # The body gets its own deadline (see read_body)
+        self.head_reader.stop()
+        if not ok:
+            return False
+        self.trace.mark('parse')
+        self.requests_on_connection += 1
+        if self.requests_on_connection >= self.max_keepalive_requests:
+            self.close_connection = True
+        return True
+    
+    def send_response_only(self, code, message=None):
+        self.response_status = code
+        super().send_response_only(code, message)
+    
+    def send_header(self, keyword, value):
+        if keyword.lower() == 'connection':
+            self._connection_header_sent = True
+        elif keyword.lower() == 'content-length':
+            self.response_bytes = int(value)
+        super().send_header(keyword, value)
+    
+    def end_headers(self):
+        """Tell the client explicitly whether the connection stays open"""
+        if not self._connection_header_sent and self.request_version != 'HTTP/0.9':
+            self.send_header('Connection', 'close' if self.close_connection else 'keep-alive')
+            if not self.close_connection:
+                self.send_header('Keep-Alive', f'timeout={int(self.timeout)}, max={self.max_keepalive_requests - self.requests_on_connection}')
+        super().end_headers()
+    
+    def send_error(self, code, message=None, explain=None):
+        """Send an error page without dropping a reusable connection"""
+        # Errors on GET/HEAD leave the connection in a known state; anything
+        # else (unparsed requests, unread request bodies) must close it.
+        reusable = (
+            getattr(self, 'command', None) in ('GET', 'HEAD')
+            and code < 500
+            and code not in (400, 408, 413, 414, 431)
+            and not self.close_connection
+        )
+        if not reusable:
+            super().send_error(code, message, explain)
+            return
+        try:
+            short, long = self.responses[code]
+        except KeyError:
+            short, long = '???', '???'
+        if message is None:
+            message = short
+        if explain is None:
+            explain = long
+        self.log_error("code %d, message %s", code, message)
+        self.send_response(code, message)
+        body = (self.error_message_format % {
+            'code': code,
+            'message': html.escape(message, quote=False),
+            'explain': html.escape(explain, quote=False)
+        }).encode('UTF-8', 'replace')
+        self.send_header("Content-Type", self.error_content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+    
     def do_GET(self):
         """Handle GET requests"""
         parsed_path = urlparse(self.path)
+        self.trace.mark('route')
         
         # Handle API endpoints
         if parsed_path.path.startswith('/api/'):
-            self.handle_api_request(parsed_path)
+            if not self.rate_limited(parsed_path.path):
+                self.handle_api_request(parsed_path)
+            return
+        
+        if parsed_path.path == METRICS_PATH and getattr(self.server, 'metrics', None) is not None:
+            self.send_metrics()
+            return
+        
+        if parsed_path.path == TRACING_ADMIN_PATH and getattr(self.server, 'tracing_admin', False):
+            self.handle_tracing_admin(parsed_path)
             return
         
         # Serve static files
         super().do_GET()
     
+    def do_HEAD(self):
+        """Handle HEAD requests"""
+        parsed_path = urlparse(self.path)
+        self.trace.mark('route')
+        
+        if parsed_path.path.startswith('/api/'):
+            if not self.rate_limited(parsed_path.path):
+                self.handle_api_request(parsed_path)
+            return
+        
+        if parsed_path.path == METRICS_PATH and getattr(self.server, 'metrics', None) is not None:
+            self.send_metrics()
+            return
+        
+        if parsed_path.path == TRACING_ADMIN_PATH and getattr(self.server, 'tracing_admin', False):
+            self.handle_tracing_admin(parsed_path)
+            return
+        
+        super().do_HEAD()
+    
     def do_POST(self):
         """Handle POST requests"""
         parsed_path = urlparse(self.path)
+        self.trace.mark('route')
+        if self.rate_limited(parsed_path.path):
+            return
         
         # Handle API endpoints
         if parsed_path.path.startswith('/api/'):
-            self.handle_api_request(parsed_path)
+            if self.discard_request_body():
+                self.handle_api_request(parsed_path)
             return
         
         # Handle form submissions
-        if parsed_path.path in ['/forms/contact.php', '/forms/newsletter.php']:
+        if parsed_path.path in FORM_RESPONSES:
             self.handle_form_submission(parsed_path)
             return
         
-        super().do_POST()
+        if parsed_path.path == TRACING_ADMIN_PATH and getattr(self.server, 'tracing_admin', False):
+            if self.discard_request_body():
+                self.handle_tracing_admin(parsed_path)
+            return
+        
+        self.send_error(501, "Unsupported method ('POST')")
+    
+    def rate_limited(self, path):
+        """Answer 429 when the client is over its rate limit for this path"""
+        limits = getattr(self.server, 'rate_limits', None)
+        if not limits:
+            return False
+        forwarded_for = ', '.join(self.headers.get_all('X-Forwarded-For', ()))
+        retry_after = limits.retry_after(path, self.client_address[0], forwarded_for)
+        if not retry_after:
+            return False
+        if self.command == 'POST':
+            # Rejected before the body is read, so the connection cannot be reused
+            self.close_connection = True
+        self.send_json_response(RATE_LIMITED_RESPONSE, 429, [('Retry-After', str(retry_after))])
+        return True
+    
+    def send_metrics(self):
+        """Send the Prometheus exposition of every worker's metrics"""
+        body = self.server.metrics.render()
+        self.send_response(200)
+        self.send_header('Content-Type', METRICS_CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+    
+    def handle_tracing_admin(self, parsed_path):
+        """Show the slow-request tracing settings, or change them on POST"""
+        code, result = tracing_admin(self.server.tracer, self.command, self.client_address[0], parsed_path.query)
+        if code != 200:
+            self.send_error(code, result)
+        else:
+            self.send_json_response(result, extra_headers=[('Cache-Control', 'no-store')])
     
     def handle_api_request(self, parsed_path):
         """Handle API requests"""
-        path = parsed_path.path
-        
-        if path == '/api/health':
-            self.send_json_response({'status': 'healthy', 'message': 'DevTechAI WebApp v2.0 is running'})
-        elif path == '/api/services':
-            services = [
-                {'id': 1, 'name': 'AI Integration', 'description': 'Integrate OpenAI, Anthropic, Google AI, and Azure AI services'},
-                {'id': 2, 'name': 'Workflow Automation', 'description': 'Automate processes using N8N, Zapier, and custom solutions'},
-                {'id': 3, 'name': 'Cloud Solutions', 'description': 'Deploy across AWS, GCP, OCI, and Azure platforms'},
-                {'id': 4, 'name': 'Monitoring & Analytics', 'description': 'Comprehensive monitoring with Prometheus and Grafana'},
-                {'id': 5, 'name': 'Security & Compliance', 'description': 'Enterprise-grade security with GDPR, CCPA, HIPAA compliance'},
-                {'id': 6, 'name': 'API Development', 'description': 'Build robust APIs with comprehensive documentation'}
-            ]
-            self.send_json_response({'services': services})
-        elif path == '/api/team':
-            team = [
-                {'id': 1, 'name': 'Alex Johnson', 'position': 'Chief Executive Officer', 'image': 'assets/img/team/team-1.jpg'},
-                {'id': 2, 'name': 'Sarah Chen', 'position': 'Chief Technology Officer', 'image': 'assets/img/team/team-2.jpg'},
-                {'id': 3, 'name': 'Michael Rodriguez', 'position': 'AI Solutions Architect', 'image': 'assets/img/team/team-3.jpg'},
-                {'id': 4, 'name': 'Emily Davis', 'position': 'Cloud Infrastructure Lead', 'image': 'assets/img/team/team-4.jpg'}
-            ]
-            self.send_json_response({'team': team})
-        else:
+        try:
+            response = resolve_api_request(parsed_path.path, parsed_path.query)
+            self.trace.mark('api')
+        except ApiQueryError as e:
+            self.send_error(400, str(e))
+            return
+        if response is None:
             self.send_error(404, "API endpoint not found")
+        else:
+            self.send_prepared_response(response)
+    
+    def send_prepared_response(self, response):
+        """Send a pre-serialized JSONResponse, honouring If-None-Match"""
+        representation = response.select(self.headers.get('Accept-Encoding'))
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None and etag_matches(if_none_match, representation.etag):
+            self.send_response(304)
+            self.send_header('ETag', representation.etag)
+            self.send_header('Cache-Control', response.cache_control)
+            self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
+            return
+        self.send_response(200)
+        for keyword, value in representation.headers:
+            self.send_header(keyword, value)
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(representation.body)
     
     def handle_form_submission(self, parsed_path):
-        """Handle form submissions"""
-        content_length = int(self.headers.get('Content-Length', 0))
-        post_data = self.rfile.read(content_length)
-        
-        if parsed_path.path == '/forms/contact.php':
-            # Simulate contact form processing
-            self.send_json_response({
-                'status': 'success',
-                'message': 'Your message has been sent successfully. We will get back to you soon!'
-            })
-        elif parsed_path.path == '/forms/newsletter.php':
-            # Simulate newsletter subscription
-            self.send_json_response({
-                'status': 'success',
-                'message': 'Thank you for subscribing to our newsletter!'
-            })
-    
-    def send_json_response(self, data):
-        """Send JSON response"""
+        """Handle form submissions, parsing the body as it arrives"""
+        def read():
+            length = body_length(self.headers.get('Transfer-Encoding'), self.headers.get('Content-Length'),
+                                 self.max_form_bytes)
+            return read_form(self.rfile, self.headers.get('Content-Type'), length, self.max_form_bytes)
+        ok, form = self.read_body(read)
+        if not ok:
+            return
+        missing = missing_form_fields(parsed_path.path, form)
+        if missing:
+            self.send_error(400, f"Missing form field: {missing[0]}")
+            return
+        try:
+            queue_submission(getattr(self.server, 'submission_queue', None),
+                             getattr(self.server, 'subscriber_index', None), parsed_path.path, form)
+            self.trace.mark('queue')
+        except QueueFull:
+            self.send_json_response(QUEUE_FULL_RESPONSE, 503, [('Retry-After', '1')])
+            return
+        self.send_json_response(FORM_RESPONSES[parsed_path.path])
+    
+    def send_head(self):
+        """Send headers for a static file, serving hot files from the in-memory cache"""
+        self.byte_ranges = None
+        parsed_path = urlparse(self.path)
+        path = self.translate_path(self.path)
+        self.trace.mark('route')
+        cache = getattr(self.server, 'static_cache', None)
+        entry = None
+        if cache is not None:
+            entry = cache.get(path + 'index.html' if path.endswith('/') else path)
+            self.trace.mark('cache')
+        if entry is None:
+            return self.send_file_head(path, parsed_path)
+
+        cache_control = cache_control_for(parsed_path.path, parsed_path.query)
+        byte_ranges = None
+        if self.command == 'GET' and 'Range' in self.headers:
+            # Ranges always address the unencoded file
+            representation = entry.plain
+            byte_ranges = resolve_ranges(self.headers['Range'], self.headers.get('If-Range'),
+                                         representation.etag, entry.mtime, len(entry.body), entry.content_type)
+        if byte_ranges is None:
+            representation = cache.select(entry, self.headers.get('Accept-Encoding'))
+        if is_fresh(self.headers.get('If-None-Match'), self.headers.get('If-Modified-Since'),
+                    representation.etag, entry.mtime):
+            self.send_not_modified(representation.etag, entry.last_modified, cache_control, entry.compressible)
+            return None
+        if byte_ranges is not None:
+            if not self.send_partial_head(byte_ranges, representation.etag, entry.last_modified, cache_control):
+                return None
+            return io.BytesIO(byte_ranges.slice(entry.body))
         self.send_response(200)
+        for keyword, value in representation.headers:
+            self.send_header(keyword, value)
+        self.send_header('Cache-Control', cache_control)
+        self.end_headers()
+        return io.BytesIO(representation.body)
+    
+    def list_directory(self, path):
+        """Directories without an index page are not listed, as on the asyncio engine"""
+        self.send_error(404, "File not found")
+        return None
+    
+    def send_file_head(self, path, parsed_path):
+        """Send headers for a file that is not cached and return it open for reading
+
+        Directories are answered with their index page, or a redirect when the
+        trailing slash is missing, like the asyncio engine.
+        """
+        try:
+            opened = open_static_file(path)
+        except IsADirectoryError:
+            location = parsed_path.path + '/'
+            if parsed_path.query:
+                location += '?' + parsed_path.query
+            self.send_response(301)
+            self.send_header('Location', location)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return None
+        if opened is None:
+            self.send_error(404, "File not found")
+            return None
+        f, fs, etag = opened
+        path = f.name
+        try:
+            self.trace.mark('open')
+            last_modified = self.date_time_string(fs.st_mtime)
+            cache_control = cache_control_for(parsed_path.path, parsed_path.query)
+            if is_fresh(self.headers.get('If-None-Match'), self.headers.get('If-Modified-Since'),
+                        etag, fs.st_mtime):
+                f.close()
+                self.send_not_modified(etag, last_modified, cache_control, False)
+                return None
+            content_type = self.guess_type(path)
+            if self.command == 'GET' and 'Range' in self.headers:
+                byte_ranges = resolve_ranges(self.headers['Range'], self.headers.get('If-Range'),
+                                             etag, fs.st_mtime, fs.st_size, content_type)
+                if byte_ranges is not None:
+                    if not self.send_partial_head(byte_ranges, etag, last_modified, cache_control):
+                        f.close()
+                        return None
+                    self.byte_ranges = byte_ranges
+                    return f
+            self.send_response(200)
+            self.send_header("Content-type", content_type)
+            self.send_header("Content-Length", str(fs.st_size))
+            self.send_header("Last-Modified", last_modified)
+            self.send_header("ETag", etag)
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Cache-Control", cache_control)
+            self.end_headers()
+            return f
+        except:
+            f.close()
+            raise
+    
+    def send_partial_head(self, byte_ranges, etag, last_modified, cache_control):
+        """Send 206 headers for a Range request, or 416 if no range is satisfiable"""
+        if not byte_ranges.satisfiable:
+            self.send_response(416)
+            self.send_header('Content-Range', f'bytes */{byte_ranges.size}')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return False
+        self.send_response(206)
+        self.send_header('Content-type', byte_ranges.content_type)
+        self.send_header('Content-Length', str(byte_ranges.content_length))
+        for keyword, value in byte_ranges.headers:
+            self.send_header(keyword, value)
+        self.send_header('Last-Modified', last_modified)
+        self.send_header('ETag', etag)
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('Cache-Control', cache_control)
+        self.end_headers()
+        return True
+    
+    def send_not_modified(self, etag, last_modified, cache_control, vary):
+        """Answer a conditional GET whose cached copy is still valid"""
+        self.send_response(304)
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', last_modified)
+        self.send_header('Cache-Control', cache_control)
+        if vary:
+            self.send_header('Vary', 'Accept-Encoding')
+        self.end_headers()
+    
+    def copyfile(self, source, outputfile):
+        """Write cached bodies in one call and let the kernel copy files to the socket"""
+        if isinstance(source, io.BytesIO):
+            outputfile.write(source.getvalue())
+        elif getattr(self, 'byte_ranges', None) is not None:
+            self.copy_ranges(source, outputfile, self.byte_ranges)
+        elif outputfile is self.wfile and getattr(self.server, 'use_sendfile', False):
+            outputfile.flush()
+            # socket.sendfile() uses os.sendfile() for plain sockets and falls
+            # back to send() for TLS sockets and non-regular files.
+            self.connection.sendfile(source)
+        else:
+            super().copyfile(source, outputfile)
+    
+    def copy_ranges(self, source, outputfile, byte_ranges):
+        """Write the requested slices of an open file"""
+        use_sendfile = outputfile is self.wfile and getattr(self.server, 'use_sendfile', False)
+        for prefix, start, length in byte_ranges.parts:
+            if prefix:
+                outputfile.write(prefix)
+            if use_sendfile:
+                outputfile.flush()
+                self.connection.sendfile(source, start, length)
+            else:
+                source.seek(start)
+                remaining = length
+                while remaining:
+                    chunk = source.read(min(remaining, 256 * 1024))
+                    if not chunk:
+                        break
+                    outputfile.write(chunk)
+                    remaining -= len(chunk)
+        if byte_ranges.trailer:
+            outputfile.write(byte_ranges.trailer)
+    
+    def discard_request_body(self):
+        """Read and drop the request body so the next pipelined request parses cleanly
+
+        Returns False after answering with an error when the body is unacceptable.
+        """
+        def read():
+            length = body_length(self.headers.get('Transfer-Encoding'), self.headers.get('Content-Length'),
+                                 MAX_BODY_BYTES)
+            for _ in iter_body(self.rfile, length, MAX_BODY_BYTES):
+                pass
+        return self.read_body(read)[0]
+
+    def read_body(self, read):
+        """Run ``read`` under the body deadline; returns (ok, result)
+
+        A client trickling its body would otherwise hold a worker thread for
+        as long as each recv stays under the idle timeout. Failures are
+        answered here and close the connection, since the rest of the body is
+        never read.
+        """
+        self.head_reader.start(self.body_timeout)
+        try:
+            result = read()
+        except RequestBodyError as e:
+            self.close_connection = True
+            self.send_error(e.status, e.message)
+            return False, None
+        except TimeoutError:
+            self.close_connection = True
+            self.send_error(408, "Request body timed out")
+            return False, None
+        finally:
+            self.head_reader.stop()
+        self.trace.mark('body')
+        return True, result
+    
+    def send_json_response(self, data, code=200, extra_headers=()):
+        """Send JSON response"""
+        body = json.dumps(data).encode()
+        self.send_response(code)
+        for keyword, value in extra_headers:
+            self.send_header(keyword, value)
         self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+    
+    def log_request(self, code='-', size='-'):
+        """Requests are written to the access log once they finish (see record_request)"""
     
     def log_message(self, format, *args):
         """Custom log message format"""
         sys.stderr.write(f"[DevTechAI Server] {format % args}\n")
 
-def main():
+class ThreadPoolHTTPServer(http.server.HTTPServer):
+    """HTTP server that hands each connection to a bounded pool of worker threads"""
+
+    request_queue_size = 128
+
+    def __init__(self, server_address, handler_class, max_threads=32, bind_and_activate=True):
+        self.max_threads = max_threads
+        self._pool = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix='devtechai-worker')
+        # Allow a short backlog of accepted connections per thread; beyond that the
+        # accept loop blocks and new clients wait in the kernel listen queue.
+        self._slots = threading.BoundedSemaphore(max_threads * 2)
+        super().__init__(server_address, handler_class, bind_and_activate)
+
+    def process_request(self, request, client_address):
+        """Queue the connection on the thread pool instead of handling it inline"""
+        self._slots.acquire()
+        try:
+            self._pool.submit(self._process_request_worker, request, client_address)
+        except RuntimeError:
+            # Pool already shut down
+            self._slots.release()
+            self.shutdown_request(request)
+
+    def _process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self._slots.release()
+
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown(wait=True)
+
+
+def translate_path(directory, path):
+    """Map a URL path onto the docroot the same way SimpleHTTPRequestHandler does"""
+    path = path.split('?', 1)[0].split('#', 1)[0]
+    trailing_slash = path.rstrip().endswith('/')
+    try:
+        path = unquote(path, errors='surrogatepass')
+    except UnicodeDecodeError:
+        path = unquote(path)
+    path = posixpath.normpath(path)
+    result = directory
+    for word in filter(None, path.split('/')):
+        if os.path.dirname(word) or word in (os.curdir, os.pardir):
+            continue
+        result = os.path.join(result, word)
+    if trailing_slash:
+        result += '/'
+    return result
+
+
+def open_static_file(fs_path):
+    """Open a docroot file; returns (file, stat, etag) or None when there is nothing to serve
+
+    Directories are served by their index page, as SimpleHTTPRequestHandler
+    does, but never listed. Raises IsADirectoryError for a directory named
+    without its trailing slash, which the caller redirects.
+    """
+    if os.path.isdir(fs_path):
+        if not fs_path.endswith('/'):
+            raise IsADirectoryError(fs_path)
+        for index in ('index.html', 'index.htm'):
+            if os.path.isfile(os.path.join(fs_path, index)):
+                fs_path = os.path.join(fs_path, index)
+                break
+        else:
+            return None
+    if fs_path.endswith('/'):
+        return None
+    try:
+        f = open(fs_path, 'rb')
+    except OSError:
+        return None
+    try:
+        st = os.fstat(f.fileno())
+        return f, st, file_etag(f, st)
+    except OSError:
+        f.close()
+        return None
+
+
+def guess_type(path):
+    """Guess the Content-Type of a file using the stdlib handler's table"""
+    _, ext = posixpath.splitext(path)
+    extensions_map = DevTechAIHandler.extensions_map
+    if ext in extensions_map:
+        return extensions_map[ext]
+    if ext.lower() in extensions_map:
+        return extensions_map[ext.lower()]
+    guess, _ = mimetypes.guess_type(path)
+    return guess or 'application/octet-stream'
+
+
+def is_not_modified(if_modified_since, mtime):
+    """Evaluate an If-Modified-Since header against a file's mtime"""
+    if not if_modified_since:
+        return False
+    try:
+        since = email.utils.parsedate_to_datetime(if_modified_since)
+    except (TypeError, IndexError, OverflowError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=datetime.timezone.utc)
+    return since.timestamp() >= int(mtime)
+
+
+# Encodings we can serve, in order of preference, and their sidecar file suffixes
+CONTENT_ENCODINGS = (('br', '.br'), ('zstd', '.zst'), ('gzip', '.gz'))
+
+COMPRESSIBLE_TYPES = {
+    'application/javascript', 'application/json', 'application/manifest+json',
+    'application/xml', 'application/vnd.ms-fontobject', 'font/ttf', 'font/otf',
+    'image/svg+xml', 'image/x-icon', 'image/vnd.microsoft.icon',
+}
+
+# Bodies smaller than this are not worth compressing on the fly
+MIN_COMPRESS_BYTES = 1024
+# Brotli's default (11) takes far longer than gzip for a few percent; sitebuild.py
+# --compress sidecars still use 11 since they are built offline
+BROTLI_QUALITY = 5
+
+
+def is_compressible(content_type):
+    """Whether a Content-Type benefits from gzip/brotli"""
+    return content_type.startswith('text/') or content_type in COMPRESSIBLE_TYPES \
+        or content_type.endswith('+xml') or content_type.endswith('+json')
+
+
+@functools.lru_cache(maxsize=256)
+def accepted_encodings(accept_encoding):
+    """Return the encodings from CONTENT_ENCODINGS the client accepts, best first"""
+    qualities = {}
+    for part in accept_encoding.split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if coding:
+            qualities[coding] = q
+    wildcard = qualities.get('*', 0.0)
+    ranked = []
+    for index, (coding, _) in enumerate(CONTENT_ENCODINGS):
+        q = qualities.get(coding, wildcard)
+        if q > 0:
+            ranked.append((-q, index, coding))
+    return tuple(coding for _, _, coding in sorted(ranked))
+
+
+def compress_body(body, encoding):
+    """Compress a body on the fly; returns None if the encoding is unavailable"""
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=6, mtime=0)
+    if encoding == 'br' and brotli is not None:
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return None
+
+
+Representation = namedtuple('Representation', 'body headers etag')
+
+
+def etag_matches(if_none_match, etag):
+    """Weak comparison of an If-None-Match header against an entity tag"""
+    if if_none_match.strip() == '*':
+        return True
+    opaque = etag[2:] if etag.startswith('W/') else etag
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def is_fresh(if_none_match, if_modified_since, etag, mtime):
+    """Whether a conditional GET can be answered with 304 Not Modified
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted when
+    the client sent no entity tags.
+    """
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+    return is_not_modified(if_modified_since, mtime)
+
+
+# Content hashes of files served from disk, keyed on (dev, ino, size, mtime_ns)
+FILE_ETAG_CACHE_SIZE = 4096
+_file_etags = OrderedDict()
+_file_etags_lock = threading.Lock()
+
+
+def file_etag(f, st):
+    """Entity tag for a file we do not hold in memory: its content hash, as for cached files
+
+    Each version of a file is hashed once, so the tag stays the same whether or
+    not the static cache holds the file and across workers and restarts.
+    """
+    identity = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+    with _file_etags_lock:
+        etag = _file_etags.get(identity)
+        if etag is not None:
+            _file_etags.move_to_end(identity)
+            return etag
+    digest = hashlib.blake2b(digest_size=12)
+    f.seek(0)
+    for chunk in iter(functools.partial(f.read, 1024 * 1024), b''):
+        digest.update(chunk)
+    f.seek(0)
+    etag = f'"{digest.hexdigest()}"'
+    after = os.fstat(f.fileno())
+    if (after.st_size, after.st_mtime_ns) != (st.st_size, st.st_mtime_ns):
+        # Changed while we read it; hash it again next time
+        return etag
+    with _file_etags_lock:
+        _file_etags[identity] = etag
+        while len(_file_etags) > FILE_ETAG_CACHE_SIZE:
+            _file_etags.popitem(last=False)
+    return etag
+
+
+# More ranges than this in one request are ignored and the whole file is sent
+MAX_BYTE_RANGES = 16
+
+
+def parse_range(range_header, size):
+    """Parse a ``Range: bytes=...`` header against a file of ``size`` bytes
+
+    Returns None when the header should be ignored (bad syntax, other units,
+    too many ranges), an empty list when no range is satisfiable, otherwise
+    sorted, coalesced ``(first, last)`` byte positions.
+    """
+    unit, _, spec = range_header.partition('=')
+    if unit.strip().lower() != 'bytes' or not spec.strip():
+        return None
+    ranges = []
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        first, sep, last = part.partition('-')
+        first, last = first.strip(), last.strip()
+        if not sep or not (first.isdigit() or (not first and last.isdigit())) or (last and not last.isdigit()):
+            return None
+        if not first:
+            suffix = int(last)
+            if suffix == 0 or size == 0:
+                continue
+            ranges.append((max(0, size - suffix), size - 1))
+            continue
+        start = int(first)
+        if last and int(last) < start:
+            return None
+        if start >= size:
+            continue
+        end = int(last) if last else size - 1
+        ranges.append((start, min(end, size - 1)))
+    if len(ranges) > MAX_BYTE_RANGES:
+        return None
+    ranges.sort()
+    merged = []
+    for start, end in ranges:
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def if_range_matches(if_range, etag, mtime):
+    """Whether an If-Range precondition still holds, so the Range can be honoured"""
+    if if_range is None:
+        return True
+    if_range = if_range.strip()
+    if if_range.startswith('W/'):
+        return False
+    if if_range.startswith('"'):
+        return if_range == etag
+    try:
+        date = email.utils.parsedate_to_datetime(if_range)
+    except (TypeError, IndexError, OverflowError, ValueError):
+        return False
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    return int(date.timestamp()) == int(mtime)
+
+
+class ByteRanges:
+    """The slices of a file answering a Range request, with their multipart framing"""
+
+    def __init__(self, ranges, size, content_type):
+        self.ranges = ranges
+        self.size = size
+        if not ranges:
+            self.content_type = content_type
+            self.headers = [('Content-Range', f'bytes */{size}')]
+            self.parts = []
+            self.trailer = b''
+        elif len(ranges) == 1:
+            start, end = ranges[0]
+            self.content_type = content_type
+            self.headers = [('Content-Range', f'bytes {start}-{end}/{size}')]
+            self.parts = [(b'', start, end - start + 1)]
+            self.trailer = b''
+        else:
+            boundary = secrets.token_hex(16)
+            self.content_type = f'multipart/byteranges; boundary={boundary}'
+            self.headers = []
+            self.parts = []
+            for index, (start, end) in enumerate(ranges):
+                separator = '' if index == 0 else '\r\n'
+                prefix = (f'{separator}--{boundary}\r\n'
+                          f'Content-Type: {content_type}\r\n'
+                          f'Content-Range: bytes {start}-{end}/{size}\r\n\r\n').encode('latin-1')
+                self.parts.append((prefix, start, end - start + 1))
+            self.trailer = f'\r\n--{boundary}--\r\n'.encode('latin-1')
+        self.content_length = sum(len(prefix) + length for prefix, _, length in self.parts) + len(self.trailer)
+
+    @property
+    def satisfiable(self):
+        return bool(self.ranges)
+
+    def slice(self, body):
+        """Assemble the response body from an in-memory file"""
+        view = memoryview(body)
+        chunks = []
+        for prefix, start, length in self.parts:
+            chunks.append(prefix)
+            chunks.append(view[start:start + length])
+        chunks.append(self.trailer)
+        return b''.join(chunks)
+
+
+def resolve_ranges(range_header, if_range, etag, mtime, size, content_type):
+    """Turn Range/If-Range request headers into ByteRanges, or None to send the whole file"""
+    if range_header is None or not if_range_matches(if_range, etag, mtime):
+        return None
+    ranges = parse_range(range_header, size)
+    if ranges is None:
+        return None
+    return ByteRanges(ranges, size, content_type)
+
+
+FINGERPRINT_QUERY = re.compile(r'(?:^|&)v=[^&]+')
+
+
+@functools.lru_cache(maxsize=4096)
+def cache_control_for(path, query=''):
+    """Look up the Cache-Control header for a static URL in DevTechAIHandler.cache_policies"""
+    if query and FINGERPRINT_QUERY.search(query):
+        return DevTechAIHandler.fingerprinted_cache_control
+    for pattern, value in DevTechAIHandler.cache_policies:
+        if fnmatch.fnmatchcase(path, pattern):
+            return value
+    return DevTechAIHandler.default_cache_control
+
+
+class CachedFile:
+    """A static file body held in memory with its response headers precomputed"""
+
+    __slots__ = ('path', 'body', 'content_type', 'last_modified', 'mtime', 'identity', 'checked_at',
+                 'compressible', 'digest', 'plain', 'variants', 'sidecars')
+
+    def __init__(self, path, body, st, checked_at):
+        self.path = path
+        self.body = body
+        self.mtime = st.st_mtime
+        self.identity = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+        self.checked_at = checked_at
+        self.content_type = guess_type(path)
+        self.last_modified = email.utils.formatdate(st.st_mtime, usegmt=True)
+        self.compressible = is_compressible(self.content_type)
+        self.digest = hashlib.blake2b(body, digest_size=12).hexdigest()
+        self.plain = self.representation(body)
+        # encoding -> Representation, or None once we know the encoding is unavailable
+        self.variants = {}
+        # encoding -> identity of the sidecar file a variant was read from, or None
+        self.sidecars = {}
+
+    def representation(self, body, encoding=None):
+        """Build the body, headers and strong ETag for one encoding of this file"""
+        etag = f'"{self.digest}"' if encoding is None else f'"{self.digest}-{encoding}"'
+        headers = [
+            ('Content-type', self.content_type),
+            ('Content-Length', str(len(body))),
+            ('Last-Modified', self.last_modified),
+            ('ETag', etag),
+            ('Accept-Ranges', 'bytes'),
+        ]
+        if encoding is not None:
+            headers.append(('Content-Encoding', encoding))
+        if self.compressible:
+            headers.append(('Vary', 'Accept-Encoding'))
+        return Representation(body, headers, etag)
+
+    @property
+    def size(self):
+        """Bytes held by this entry, including compressed variants"""
+        return len(self.body) + sum(len(v.body) for v in self.variants.values() if v is not None)
+
+
+class JSONResponse:
+    """A JSON payload serialized once, with its ETag and compressed variants ready to send"""
+
+    cache_control = 'no-cache'
+
+    def __init__(self, payload):
+        self.prepare(json.dumps(payload).encode())
+
+    @classmethod
+    def from_body(cls, body):
+        """Wrap JSON that is already serialized"""
+        response = cls.__new__(cls)
+        response.prepare(body)
+        return response
+
+    def prepare(self, body):
+        self.etag_base = hashlib.blake2b(body, digest_size=12).hexdigest()
+        self.plain = self.representation(body)
+        self.variants = {}
+        if len(body) >= MIN_COMPRESS_BYTES:
+            for encoding, _ in CONTENT_ENCODINGS:
+                compressed = compress_body(body, encoding)
+                if compressed is not None and len(compressed) < len(body):
+                    self.variants[encoding] = self.representation(compressed, encoding)
+
+    def representation(self, body, encoding=None):
+        etag = f'"{self.etag_base}"' if encoding is None else f'"{self.etag_base}-{encoding}"'
+        headers = [
+            ('Content-type', 'application/json'),
+            ('Content-Length', str(len(body))),
+            ('Access-Control-Allow-Origin', '*'),
+            ('ETag', etag),
+            ('Cache-Control', self.cache_control),
+            ('Vary', 'Accept-Encoding'),
+        ]
+        if encoding is not None:
+            headers.append(('Content-Encoding', encoding))
+        return Representation(body, headers, etag)
+
+    def select(self, accept_encoding):
+        """Pick the best pre-built representation for an Accept-Encoding header"""
+        if accept_encoding and self.variants:
+            for encoding in accepted_encodings(accept_encoding):
+                variant = self.variants.get(encoding)
+                if variant is not None:
+                    return variant
+        return self.plain
+
+
+def missing_form_fields(path, form):
+    """Required fields of a form that are absent or blank"""
+    return [name for name in FORM_REQUIRED_FIELDS.get(path, ()) if not form.get(name, '').strip()]
+
+
+def queue_submission(queue, subscribers, path, form):
+    """Hand a validated form to the write-behind queue; raises QueueFull under backpressure
+
+    Newsletter addresses that are already subscribed are acknowledged but not queued again.
+    """
+    fields = {}
+    for name, value in form.fields:
+        fields.setdefault(name, value)
+    submit = functools.partial(queue.submit, FORM_NAMES[path], fields) if queue is not None else None
+    if FORM_NAMES[path] == 'newsletter' and subscribers is not None:
+        subscribers.add(fields['email'], commit=submit)
+    elif submit is not None:
+        submit()
+
+
+def build_api_responses(catalog):
+    """Serialize every API endpoint once; requests are answered from these bytes"""
+    return {path: JSONResponse(api_payload(path, catalog)) for path in API_PATHS}
+
+
+class ApiQueryError(ValueError):
+    """Raised for query parameters a collection endpoint cannot answer"""
+
+
+class ApiCollection:
+    """Entries of a collection endpoint with the indexes behind its query parameters
+
+    ``?id=`` looks up ids, ``?name=`` matches a case-insensitive name prefix,
+    ``?category=`` matches the section's category field, ``?fields=`` projects
+    entries and ``?limit=``/``?cursor=`` page through the result. Answers are
+    serialized once and kept in a small LRU keyed by the normalized query.
+    """
+
+    max_cached_queries = 256
+
+    def __init__(self, section, items, category_field=None):
+        self.section = section
+        self.items = tuple(items)
+        self.fields = tuple(dict.fromkeys(field for item in self.items for field in item))
+        self.category_field = category_field
+        self.by_id = {item['id']: position for position, item in enumerate(self.items)}
+        self.names = sorted((item['name'].casefold(), position) for position, item in enumerate(self.items))
+        self.name_keys = [name for name, _ in self.names]
+        self.by_category = {}
+        if category_field is not None:
+            for position, item in enumerate(self.items):
+                if item.get(category_field) is not None:
+                    self.by_category.setdefault(item[category_field].casefold(), []).append(position)
+        self.responses = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def query(self, params):
+        """JSONResponse for parse_qs() parameters, or None when none of them applies"""
+        key = self.normalize(params)
+        if not any(value is not None for value in key):
+            return None
+        with self.lock:
+            response = self.responses.get(key)
+            if response is not None:
+                self.responses.move_to_end(key)
+                self.hits += 1
+                return response
+        response = JSONResponse(self.payload(*key))
+        with self.lock:
+            self.misses += 1
+            self.responses[key] = response
+            while len(self.responses) > self.max_cached_queries:
+                self.responses.popitem(last=False)
+        return response
+
+    def normalize(self, params):
+        """Validate parameters into a hashable (ids, name, category, fields, limit, cursor) key"""
+        def values(name):
+            return [value for raw in params.get(name, ()) for value in raw.split(',') if value]
+
+        ids = name = category = fields = limit = cursor = None
+        if values('id'):
+            try:
+                ids = frozenset(int(value) for value in values('id'))
+            except ValueError:
+                raise ApiQueryError("id must be an integer") from None
+        if params.get('name'):
+            name = params['name'][-1].casefold()
+        if params.get('category'):
+            if self.category_field is None:
+                raise ApiQueryError(f"{self.section} cannot be filtered by category")
+            category = params['category'][-1].casefold()
+        if values('fields'):
+            fields = tuple(dict.fromkeys(values('fields')))
+            unknown = [field for field in fields if field not in self.fields]
+            if unknown:
+                raise ApiQueryError(f"unknown field {unknown[0]!r} (available: {', '.join(self.fields)})")
+        if params.get('limit'):
+            limit = self.parse_count('limit', params['limit'][-1])
+            if not 1 <= limit <= API_MAX_LIMIT:
+                raise ApiQueryError(f"limit must be between 1 and {API_MAX_LIMIT}")
+        if params.get('cursor'):
+            cursor = self.parse_count('cursor', params['cursor'][-1])
+        return ids, name, category, fields, limit, cursor
+
+    @staticmethod
+    def parse_count(name, value):
+        if not value.isdigit():
+            raise ApiQueryError(f"{name} must be a non-negative integer")
+        return int(value)
+
+    def payload(self, ids, name, category, fields, limit, cursor):
+        """Build the JSON payload for a normalized query using the indexes"""
+        matches = None
+        if ids is not None:
+            matches = {self.by_id[item_id] for item_id in ids if item_id in self.by_id}
+        if name is not None:
+            start = bisect.bisect_left(self.name_keys, name)
+            prefixed = set()
+            for key, position in self.names[start:]:
+                if not key.startswith(name):
+                    break
+                prefixed.add(position)
+            matches = prefixed if matches is None else matches & prefixed
+        if category is not None:
+            in_category = set(self.by_category.get(category, ()))
+            matches = in_category if matches is None else matches & in_category
+        positions = range(len(self.items)) if matches is None else sorted(matches)
+
+        offset = cursor or 0
+        page = positions[offset:offset + limit] if limit is not None else positions[offset:]
+        if fields is None:
+            entries = [self.items[position] for position in page]
+        else:
+            entries = [{field: self.items[position].get(field) for field in fields} for position in page]
+        payload = {self.section: entries}
+        if limit is not None or cursor is not None:
+            following = offset + len(page)
+            payload['total'] = len(positions)
+            payload['next_cursor'] = str(following) if following < len(positions) else None
+        return payload
+
+
+def build_api_collections(catalog):
+    """Index every catalog-backed endpoint for filtered and paginated queries"""
+    return {path: ApiCollection(section, [api_item(section, item) for item in catalog[section]],
+                                API_CATEGORY_FIELDS.get(section))
+            for path, section in API_SECTIONS.items()}
+
+
+def build_batch_response(query):
+    """Join the pre-serialized bodies of the resources named in ?r= into one object"""
+    names = [name for raw in parse_qs(query).get('r', ()) for name in raw.split(',') if name]
+    if not names:
+        raise ApiQueryError(f"r must list resources: {', '.join(API_BATCH_RESOURCES)}")
+    unknown = [name for name in names if name not in API_BATCH_RESOURCES]
+    if unknown:
+        raise ApiQueryError(f"unknown resource {unknown[0]!r} (available: {', '.join(API_BATCH_RESOURCES)})")
+    names = list(dict.fromkeys(names))
+    parts = [(name, api_responses[API_BATCH_RESOURCES[name]]) for name in names]
+    # Keyed by content, so a batch built from a catalog that was just replaced is never served
+    key = tuple((name, response.etag_base) for name, response in parts)
+    with batch_lock:
+        response = batch_responses.get(key)
+        if response is not None:
+            batch_responses.move_to_end(key)
+            batch_counts['hits'] += 1
+            return response
+    body = b'{' + b', '.join(json.dumps(name).encode() + b': ' + response.plain.body
+                             for name, response in parts) + b'}'
+    response = JSONResponse.from_body(body)
+    with batch_lock:
+        batch_counts['misses'] += 1
+        batch_responses[key] = response
+        while len(batch_responses) > MAX_BATCH_RESPONSES:
+            batch_responses.popitem(last=False)
+    return response
+
+
+def resolve_api_request(path, query):
+    """Response for an API request, or None for unknown endpoints; raises ApiQueryError"""
+    if path == API_BATCH_PATH:
+        return build_batch_response(query)
+    response = api_responses.get(path)
+    collection = api_collections.get(path)
+    if response is None or collection is None or not query:
+        return response
+    return collection.query(parse_qs(query)) or response
+
+
+# Replaced wholesale on every catalog reload, so readers never see a mix
+api_responses = {}
+api_collections = {}
+# Every combination of ?r= fits; the bound only matters across catalog reloads
+MAX_BATCH_RESPONSES = 64
+batch_responses = OrderedDict()
+batch_lock = threading.Lock()
+# Query cache hits and misses of collections retired by reloads, plus the batch LRU's
+retired_api_counts = {'hits': 0, 'misses': 0}
+batch_counts = {'hits': 0, 'misses': 0}
+
+
+def publish_catalog(catalog):
+    """Re-serialize the API responses and rebuild their indexes from a freshly loaded catalog"""
+    global api_responses, api_collections
+    for collection in api_collections.values():
+        retired_api_counts['hits'] += collection.hits
+        retired_api_counts['misses'] += collection.misses
+    api_collections = build_api_collections(catalog)
+    api_responses = build_api_responses(catalog)
+
+
+def api_cache_counts():
+    """Hits and misses of the API query and batch caches since this process started"""
+    collections = list(api_collections.values())
+    return {
+        'devtechai_api_cache_hits_total': retired_api_counts['hits'] + batch_counts['hits']
+                                          + sum(collection.hits for collection in collections),
+        'devtechai_api_cache_misses_total': retired_api_counts['misses'] + batch_counts['misses']
+                                            + sum(collection.misses for collection in collections),
+    }
+
+
+def start_catalog_watcher(config):
+    """Load the catalog for this process and keep the API in sync with it"""
+    watcher = CatalogWatcher(config.catalog, interval=config.catalog_poll)
+    watcher.subscribe(publish_catalog)
+    watcher.start()
+    return watcher
+
+
+class StaticFileCache:
+    """Bounded LRU cache of static file bodies keyed by filesystem path
+
+    Entries are revalidated with ``os.stat`` at most once per
+    ``revalidate_interval`` seconds; a changed mtime, size or inode reloads
+    the file, and a sidecar that appeared, changed or went away drops the
+    variant built from it. Files larger than ``max_file_bytes`` are never cached.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, max_file_bytes=1024 * 1024, revalidate_interval=1.0):
+        self.max_bytes = max_bytes
+        self.max_file_bytes = max_file_bytes
+        self.revalidate_interval = revalidate_interval
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def peek(self, path):
+        """Return the CachedFile for ``path`` if it can be served without touching the disk"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and now - entry.checked_at < self.revalidate_interval:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry
+        return None
+
+    def get(self, path):
+        """Return the CachedFile for ``path``, or None if it is not a cacheable regular file"""
+        entry = self.peek(path)
+        if entry is not None:
+            return entry
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(path)
+
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._discard(path)
+            return None
+        if not stat.S_ISREG(st.st_mode) or st.st_size > self.max_file_bytes:
+            self._discard(path)
+            return None
+
+        if entry is not None and entry.identity == (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns):
+            stale = [encoding for encoding, identity in list(entry.sidecars.items())
+                     if sidecar_identity(entry, encoding) != identity]
+            with self._lock:
+                for encoding in stale:
+                    entry.sidecars.pop(encoding, None)
+                    variant = entry.variants.pop(encoding, None)
+                    if variant is not None and self._entries.get(path) is entry:
+                        self.current_bytes -= len(variant.body)
+                entry.checked_at = now
+                if path in self._entries:
+                    self._entries.move_to_end(path)
+                self.hits += 1
+            return entry
+
+        try:
+            with open(path, 'rb') as f:
+                body = f.read(st.st_size + 1)
+        except OSError:
+            self._discard(path)
+            return None
+        if len(body) != st.st_size:
+            # File changed while we were reading it; serve it uncached this time
+            return None
+
+        entry = CachedFile(path, body, st, now)
+        with self._lock:
+            self.misses += 1
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self.current_bytes -= old.size
+            self._entries[path] = entry
+            self.current_bytes += len(body)
+            self._evict()
+        return entry
+
+    def select(self, entry, accept_encoding):
+        """Pick the best representation of ``entry`` for an Accept-Encoding header
+
+        Returns a Representation. Pre-built sidecars (``main.css.gz``,
+        ``main.css.br``, ...) are preferred; otherwise gzip (and brotli, when
+        the ``brotli`` module is installed) is produced once and cached.
+        """
+        if not entry.compressible or not accept_encoding:
+            return entry.plain
+        for encoding in accepted_encodings(accept_encoding):
+            # Revalidation in another thread may drop a variant at any time
+            try:
+                variant = entry.variants[encoding]
+            except KeyError:
+                variant = self._load_variant(entry, encoding)
+            if variant is not None:
+                return variant
+        return entry.plain
+
+    def select_cached(self, entry, accept_encoding):
+        """select() from variants already in memory; None when it would read or compress"""
+        if not entry.compressible or not accept_encoding:
+            return entry.plain
+        for encoding in accepted_encodings(accept_encoding):
+            try:
+                variant = entry.variants[encoding]
+            except KeyError:
+                return None
+            if variant is not None:
+                return variant
+        return entry.plain
+
+    def _load_variant(self, entry, encoding):
+        body = None
+        sidecar = sidecar_identity(entry, encoding)
+        if sidecar is not None:
+            try:
+                with open(entry.path + dict(CONTENT_ENCODINGS)[encoding], 'rb') as f:
+                    body = f.read()
+            except OSError:
+                sidecar = None
+        if body is None and len(entry.body) >= MIN_COMPRESS_BYTES:
+            body = compress_body(entry.body, encoding)
+        if body is not None and len(body) >= len(entry.body):
+            body = None
+        variant = None if body is None else entry.representation(body, encoding)
+        with self._lock:
+            if encoding not in entry.variants:
+                entry.variants[encoding] = variant
+                entry.sidecars[encoding] = sidecar
+                if variant is not None and self._entries.get(entry.path) is entry:
+                    self.current_bytes += len(body)
+                    self._evict()
+            return entry.variants[encoding]
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits (caller holds the lock)"""
+        while self.current_bytes > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= evicted.size
+
+    def _discard(self, path):
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self.current_bytes -= old.size
+
+
+def sidecar_identity(entry, encoding):
+    """(dev, ino, size, mtime_ns) of a usable pre-built sidecar of ``entry``, or None"""
+    try:
+        st = os.stat(entry.path + dict(CONTENT_ENCODINGS)[encoding])
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode) or st.st_mtime < entry.mtime:
+        return None
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+# Trace of the request the current connection task is serving
+current_trace = contextvars.ContextVar('current_trace', default=None)
+
+
+class AsyncHTTPServer:
+    """HTTP/1.1 server built on asyncio streams
+
+    Uses the same routing as DevTechAIHandler (``api_payload`` and
+    ``FORM_RESPONSES``) but keeps every connection on one event loop, so idle
+    keep-alive clients cost a socket and a coroutine instead of a thread.
+    """
+
+    server_version = DevTechAIHandler.server_version
+    max_header_bytes = 64 * 1024
+    # Time allowed to receive a whole request body
+    body_timeout = 30.0
+
+    def __init__(self, directory, idle_timeout=15.0, max_requests=1000, static_cache=None, use_sendfile=True,
+                 max_form_bytes=MAX_FORM_BYTES, submission_queue=None, subscriber_index=None,
+                 rate_limits=None, metrics=None, access_log=None, tracer=None, tracing_admin=False):
+        self.directory = directory
+        self.metrics = metrics
+        self.access_log = access_log
+        self.tracer = tracer
+        self.tracing_admin = tracing_admin and tracer is not None
+        self.rate_limits = rate_limits
+        self.submission_queue = submission_queue
+        self.subscriber_index = subscriber_index
+        self.max_form_bytes = max_form_bytes
+        self.use_sendfile = use_sendfile
+        self.static_cache = static_cache
+        self.idle_timeout = idle_timeout
+        self.max_requests = max_requests
+
+    async def serve(self, host, port, listen_socket=None):
+        """Accept connections until the task is cancelled"""
+        if listen_socket is not None:
+            server = await asyncio.start_server(self.handle_connection, sock=listen_socket,
+                                                limit=self.max_header_bytes)
+        else:
+            server = await asyncio.start_server(self.handle_connection, host or None, port,
+                                                limit=self.max_header_bytes, reuse_address=True,
+                                                backlog=1024)
+        async with server:
+            await server.serve_forever()
+
+    async def handle_connection(self, reader, writer):
+        """Serve requests from one connection until it closes or goes idle"""
+        requests_served = 0
+        peer = writer.get_extra_info('peername')
+        client_host = peer[0] if peer else ''
+        sock = writer.get_extra_info('socket')
+        if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+            # asyncio only disables Nagle when the listening socket was created with
+            # proto=IPPROTO_TCP; without it the body waits ~40 ms for the head's ACK
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), self.idle_timeout)
+                except asyncio.LimitOverrunError:
+                    await self.send_error(writer, 431, "Request header fields too large", None, False)
+                    break
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+
+                trace = self.tracer.begin() if self.tracer is not None else Trace()
+                if self.metrics is not None:
+                    self.metrics.start_request()
+                current_trace.set(trace)
+                request = parse_request_head(head)
+                trace.mark('parse')
+                requests_served += 1
+                try:
+                    keep_alive = await self.serve_request(reader, writer, request, client_host, requests_served)
+                finally:
+                    self.record_request(trace, client_host, request)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    def record_request(self, trace, client_host, request):
+        """Feed a finished request to the metrics, the access log and the tracer"""
+        elapsed = trace.finish()
+        if request is not None:
+            method, target, version, headers = request
+        else:
+            method = target = version = None
+            headers = {}
+        if self.metrics is not None:
+            self.metrics.finish_request(elapsed, urlparse(target).path if target else None, method,
+                                        trace.status, trace.size)
+        if self.access_log is None and self.tracer is None:
+            return
+        record = access_record(client_host, method, target, version, trace.status, trace.size, elapsed,
+                               headers.get('user-agent'), headers.get('referer'), trace.phases)
+        if self.tracer is not None:
+            self.tracer.end(trace, record)
+        if self.access_log is not None:
+            self.access_log.log(record)
+
+    async def serve_request(self, reader, writer, request, client_host, requests_served):
+        """Answer one parsed request; returns whether the connection stays open"""
+        if request is None:
+            await self.send_error(writer, 400, "Bad request syntax", None, False)
+            return False
+        method, target, version, headers = request
+
+        connection = headers.get('connection', '').lower()
+        if version == 'HTTP/1.1':
+            keep_alive = connection != 'close'
+        else:
+            keep_alive = connection == 'keep-alive'
+        if requests_served >= self.max_requests:
+            keep_alive = False
+
+        if self.rate_limits:
+            retry_after = self.rate_limits.retry_after(urlparse(target).path, client_host,
+                                                       headers.get('x-forwarded-for'))
+            if retry_after:
+                # A POST body is left unread, so only GET/HEAD connections survive
+                keep_alive = keep_alive and method in ('GET', 'HEAD')
+                return await self.send_json(writer, RATE_LIMITED_RESPONSE, request, keep_alive,
+                                            429, [('Retry-After', str(retry_after))])
+
+        try:
+            form = await asyncio.wait_for(self.read_body(reader, request), self.body_timeout)
+        except RequestBodyError as e:
+            return await self.send_error(writer, e.status, e.message, request, False)
+        except asyncio.TimeoutError:
+            return await self.send_error(writer, 408, "Request body timed out", request, False)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return False
+        if method == 'POST':
+            current_trace.get().mark('body')
+
+        return await self.dispatch(writer, request, keep_alive, form, client_host)
+
+    async def read_body(self, reader, request):
+        """Parse a form post as it streams in, or read and drop any other body"""
+        method, target, version, headers = request
+        if method == 'POST' and urlparse(target).path in FORM_RESPONSES:
+            length = body_length(headers.get('transfer-encoding'), headers.get('content-length'),
+                                 self.max_form_bytes)
+            return await read_form_async(reader, headers.get('content-type'), length, self.max_form_bytes)
+        length = body_length(headers.get('transfer-encoding'), headers.get('content-length'), MAX_BODY_BYTES)
+        async for _ in aiter_body(reader, length, MAX_BODY_BYTES):
+            pass
+        return None
+
+    async def dispatch(self, writer, request, keep_alive, form=None, client_host=''):
+        """Route one request; returns whether the connection stays open"""
+        method, target, version, headers = request
+        parsed = urlparse(target)
+        path = parsed.path
+        trace = current_trace.get()
+        trace.mark('route')
+
+        if method in ('GET', 'HEAD', 'POST') and path.startswith('/api/'):
+            try:
+                response = resolve_api_request(path, parsed.query)
+                trace.mark('api')
+            except ApiQueryError as e:
+                return await self.send_error(writer, 400, str(e), request, keep_alive)
+            if response is None:
+                return await self.send_error(writer, 404, "API endpoint not found", request, keep_alive)
+            return await self.send_prepared(writer, response, request, keep_alive)
+
+        if method == 'POST':
+            if path in FORM_RESPONSES:
+                missing = missing_form_fields(path, form)
+                if missing:
+                    return await self.send_error(writer, 400, f"Missing form field: {missing[0]}", request, keep_alive)
+                try:
+                    # WAL writes, segment rotation and the subscriber flock can block
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, queue_submission, self.submission_queue, self.subscriber_index, path, form)
+                    trace.mark('queue')
+                except QueueFull:
+                    return await self.send_json(writer, QUEUE_FULL_RESPONSE, request, keep_alive,
+                                                503, [('Retry-After', '1')])
+                return await self.send_json(writer, FORM_RESPONSES[path], request, keep_alive)
+
+        if path == TRACING_ADMIN_PATH and self.tracing_admin and method in ('GET', 'HEAD', 'POST'):
+            code, result = tracing_admin(self.tracer, method, client_host, parsed.query)
+            if code != 200:
+                return await self.send_error(writer, code, result, request, keep_alive)
+            return await self.send_json(writer, result, request, keep_alive,
+                                        extra_headers=[('Cache-Control', 'no-store')])
+
+        if method == 'POST':
+            return await self.send_error(writer, 501, "Unsupported method ('POST')", request, keep_alive)
+
+        if method in ('GET', 'HEAD'):
+            if path == METRICS_PATH and self.metrics is not None:
+                headers = [('Content-Type', METRICS_CONTENT_TYPE), ('Cache-Control', 'no-store')]
+                return await self.send_bytes(writer, 200, headers, self.metrics.render(), request, keep_alive)
+            return await self.send_static(writer, path, request, keep_alive)
+
+        return await self.send_error(writer, 501, f"Unsupported method ({method!r})", request, keep_alive)
+
+    async def send_static(self, writer, path, request, keep_alive):
+        """Serve a file from the docroot"""
+        method, target, version, headers = request
+        fs_path = translate_path(self.directory, path)
+        query = urlparse(target).query
+        trace = current_trace.get()
+        trace.mark('route')
+        loop = asyncio.get_running_loop()
+
+        if self.static_cache is not None:
+            # Hits are served from memory; stat, reads and compression run off the event loop
+            cache_path = fs_path + 'index.html' if fs_path.endswith('/') else fs_path
+            entry = self.static_cache.peek(cache_path)
+            if entry is None:
+                entry = await loop.run_in_executor(None, self.static_cache.get, cache_path)
+            trace.mark('cache')
+            if entry is not None:
+                cache_control = cache_control_for(path, query)
+                byte_ranges = None
+                if method == 'GET' and 'range' in headers:
+                    representation = entry.plain
+                    byte_ranges = resolve_ranges(headers['range'], headers.get('if-range'), representation.etag,
+                                                 entry.mtime, len(entry.body), entry.content_type)
+                if byte_ranges is None:
+                    representation = self.static_cache.select_cached(entry, headers.get('accept-encoding'))
+                    if representation is None:
+                        representation = await loop.run_in_executor(None, self.static_cache.select, entry,
+                                                                    headers.get('accept-encoding'))
+                if is_fresh(headers.get('if-none-match'), headers.get('if-modified-since'),
+                            representation.etag, entry.mtime):
+                    return await self.send_not_modified(writer, representation.etag, entry.last_modified,
+                                                        cache_control, entry.compressible, request, keep_alive)
+                if byte_ranges is not None:
+                    response_headers = self.partial_headers(byte_ranges, representation.etag,
+                                                            entry.last_modified, cache_control)
+                    if not byte_ranges.satisfiable:
+                        return await self.write_response(writer, 416, response_headers, b'', request, keep_alive)
+                    return await self.write_response(writer, 206, response_headers, byte_ranges.slice(entry.body),
+                                                     request, keep_alive)
+                response_headers = representation.headers + [('Cache-Control', cache_control)]
+                return await self.write_response(writer, 200, response_headers, representation.body,
+                                                 request, keep_alive)
+
+        try:
+            opened = await loop.run_in_executor(None, open_static_file, fs_path)
+        except IsADirectoryError:
+            location = path + '/'
+            if query:
+                location += '?' + query
+            return await self.send_bytes(writer, 301, [('Location', location)], b'', request, keep_alive)
+        if opened is None:
+            return await self.send_error(writer, 404, "File not found", request, keep_alive)
+        f, fs, etag = opened
+        fs_path = f.name
+
+        with f:
+            trace.mark('open')
+            last_modified = email.utils.formatdate(fs.st_mtime, usegmt=True)
+            cache_control = cache_control_for(path, query)
+            if is_fresh(headers.get('if-none-match'), headers.get('if-modified-since'), etag, fs.st_mtime):
+                return await self.send_not_modified(writer, etag, last_modified, cache_control, False,
+                                                    request, keep_alive)
+
+            content_type = guess_type(fs_path)
+            byte_ranges = None
+            if method == 'GET' and 'range' in headers:
+                byte_ranges = resolve_ranges(headers['range'], headers.get('if-range'), etag,
+                                             fs.st_mtime, fs.st_size, content_type)
+            if byte_ranges is not None:
+                response_headers = self.partial_headers(byte_ranges, etag, last_modified, cache_control)
+                if not byte_ranges.satisfiable:
+                    return await self.write_response(writer, 416, response_headers, b'', request, keep_alive)
+                writer.write(self.build_head(206, response_headers, keep_alive))
+                for prefix, start, length in byte_ranges.parts:
+                    if prefix:
+                        writer.write(prefix)
+                    await self.send_file_slice(writer, f, start, length)
+                writer.write(byte_ranges.trailer)
+                await writer.drain()
+                self.log_request(request, 206, byte_ranges.content_length)
+                return keep_alive
+
+            response_headers = [
+                ('Content-Type', content_type),
+                ('Content-Length', str(fs.st_size)),
+                ('Last-Modified', last_modified),
+                ('ETag', etag),
+                ('Accept-Ranges', 'bytes'),
+                ('Cache-Control', cache_control),
+            ]
+            writer.write(self.build_head(200, response_headers, keep_alive))
+            if method != 'HEAD' and fs.st_size:
+                await self.send_file_slice(writer, f, 0, fs.st_size)
+            await writer.drain()
+            self.log_request(request, 200, fs.st_size)
+        return keep_alive
+
+    async def send_file_slice(self, writer, f, offset, count):
+        """Copy part of an open file to the client"""
+        await writer.drain()
+        if self.use_sendfile:
+            # Zero-copy on plain sockets; asyncio falls back to reads for TLS transports
+            loop = asyncio.get_running_loop()
+            await loop.sendfile(writer.transport, f, offset, count)
+            return
+        f.seek(offset)
+        while count:
+            chunk = f.read(min(count, 256 * 1024))
+            if not chunk:
+                break
+            writer.write(chunk)
+            await writer.drain()
+            count -= len(chunk)
+
+    def partial_headers(self, byte_ranges, etag, last_modified, cache_control):
+        """Headers for a 206 Partial Content (or 416) response"""
+        if not byte_ranges.satisfiable:
+            return byte_ranges.headers + [('Content-Length', '0')]
+        return [
+            ('Content-Type', byte_ranges.content_type),
+            ('Content-Length', str(byte_ranges.content_length)),
+        ] + byte_ranges.headers + [
+            ('Last-Modified', last_modified),
+            ('ETag', etag),
+            ('Accept-Ranges', 'bytes'),
+            ('Cache-Control', cache_control),
+        ]
+
+    async def send_not_modified(self, writer, etag, last_modified, cache_control, vary, request, keep_alive):
+        """Answer a conditional GET whose cached copy is still valid"""
+        response_headers = [('ETag', etag), ('Last-Modified', last_modified), ('Cache-Control', cache_control)]
+        if vary:
+            response_headers.append(('Vary', 'Accept-Encoding'))
+        return await self.send_bytes(writer, 304, response_headers, b'', request, keep_alive)
+
+    async def send_prepared(self, writer, response, request, keep_alive):
+        """Send a pre-serialized JSONResponse, honouring If-None-Match"""
+        headers = request[3]
+        representation = response.select(headers.get('accept-encoding'))
+        if_none_match = headers.get('if-none-match')
+        if if_none_match is not None and etag_matches(if_none_match, representation.etag):
+            response_headers = [('ETag', representation.etag), ('Cache-Control', response.cache_control),
+                                ('Vary', 'Accept-Encoding')]
+            return await self.write_response(writer, 304, response_headers, b'', request, keep_alive)
+        return await self.write_response(writer, 200, representation.headers, representation.body,
+                                         request, keep_alive)
+
+    async def send_json(self, writer, payload, request, keep_alive, code=200, extra_headers=()):
+        """Send a JSON payload with the same headers as send_json_response"""
+        body = json.dumps(payload).encode()
+        headers = list(extra_headers) + [('Content-type', 'application/json'), ('Access-Control-Allow-Origin', '*')]
+        return await self.send_bytes(writer, code, headers, body, request, keep_alive)
+
+    async def send_error(self, writer, code, message, request, keep_alive):
+        """Send an HTML error page like BaseHTTPRequestHandler.send_error"""
+        short, explain = http.server.BaseHTTPRequestHandler.responses.get(code, ('???', ''))
+        body = (http.server.DEFAULT_ERROR_MESSAGE % {
+            'code': code,
+            'message': html.escape(message or short, quote=False),
+            'explain': html.escape(explain, quote=False),
+        }).encode('UTF-8', 'replace')
+        headers = [('Content-Type', http.server.DEFAULT_ERROR_CONTENT_TYPE)]
+        return await self.send_bytes(writer, code, headers, body, request, keep_alive)
+
+    async def send_bytes(self, writer, code, headers, body, request, keep_alive):
+        """Write a complete in-memory response, adding Content-Length"""
+        if code >= 200 and code not in (204, 304):
+            headers = headers + [('Content-Length', str(len(body)))]
+        else:
+            body = b''
+        return await self.write_response(writer, code, headers, body, request, keep_alive)
+
+    async def write_response(self, writer, code, headers, body, request, keep_alive):
+        """Write a response whose headers are already complete"""
+        head_only = request is not None and request[0] == 'HEAD'
+        writer.write(self.build_head(code, headers, keep_alive))
+        if body and not head_only:
+            writer.write(body)
+        await writer.drain()
+        self.log_request(request, code, len(body) if body else '-')
+        return keep_alive
+
+    def build_head(self, code, headers, keep_alive):
+        """Serialize the status line and headers"""
+        reason = http.server.BaseHTTPRequestHandler.responses.get(code, ('',))[0]
+        lines = [
+            f'HTTP/1.1 {code} {reason}',
+            f'Server: {self.server_version} Python/{sys.version.split()[0]} asyncio',
+            f'Date: {email.utils.formatdate(usegmt=True)}',
+        ]
+        lines.extend(f'{name}: {value}' for name, value in headers)
+        if keep_alive:
+            lines.append('Connection: keep-alive')
+            lines.append(f'Keep-Alive: timeout={int(self.idle_timeout)}')
+        else:
+            lines.append('Connection: close')
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1', 'strict')
+
+    def log_request(self, request, code, size):
+        """Note the response being sent for record_request"""
+        trace = current_trace.get()
+        if trace is not None:
+            trace.status = code
+            trace.size = size if isinstance(size, int) else 0
+
+
+def access_record(client, method, target, version, status, size, elapsed, user_agent, referer, phases=None):
+    """One access log entry; AccessLog formats it off the request path"""
+    return {
+        'ts': time.time(),
+        'client': client,
+        'method': method,
+        'path': target,
+        'protocol': version,
+        'status': status,
+        'bytes': 0 if method == 'HEAD' else size,
+        'duration_ms': round(elapsed * 1000, 3),
+        'user_agent': user_agent,
+        'referer': referer,
+        'phases': phases,
+    }
+
+
+def is_loopback(address):
+    """Whether a client address is this host (IPv4-mapped IPv6 included)"""
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    if ip.version == 6 and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_loopback
+
+
+def tracing_admin(tracer, method, client, query):
+    """(status, JSON payload or error message) for /admin/tracing
+
+    GET shows the tracer's settings; POST ?slow_ms=&profile=&profile_sample=
+    changes them for every worker. Other hosts get a plain 404.
+    """
+    if not is_loopback(client):
+        return 404, "File not found"
+    if method == 'POST':
+        params = parse_qs(query)
+        try:
+            tracer.configure(**{name: params[name][-1] for name in ('slow_ms', 'profile', 'profile_sample')
+                                if name in params})
+        except ValueError as e:
+            return 400, str(e)
+    return 200, tracer.status()
+
+
+def parse_request_head(head):
+    """Parse a raw request line and header block into (method, target, version, headers)"""
+    try:
+        text = head.decode('iso-8859-1')
+    except UnicodeDecodeError:
+        return None
+    lines = text.split('\r\n')
+    words = lines[0].split()
+    if len(words) != 3 or not words[2].startswith('HTTP/'):
+        return None
+    method, target, version = words
+    headers = {}
+    for line in lines[1:]:
+        if not line:
+            continue
+        name, sep, value = line.partition(':')
+        if not sep or not name or name != name.strip():
+            return None
+        name = name.lower()
+        if name == 'x-forwarded-for' and name in headers:
+            # Each proxy may add its own line; they form one list
+            headers[name] += ', ' + value.strip()
+        else:
+            headers[name] = value.strip()
+    return method, target, version, headers
+
+
+def run_asyncio(config, listen_socket=None, metrics=None, tracer=None):
+    """Run the asyncio engine in the current process"""
+    start_catalog_watcher(config)
+    engine = AsyncHTTPServer(os.getcwd(), idle_timeout=config.keepalive_timeout,
+                             max_requests=config.max_keepalive_requests,
+                             static_cache=build_static_cache(config),
+                             use_sendfile=config.sendfile,
+                             max_form_bytes=config.max_form_kb * 1024,
+                             submission_queue=build_submission_queue(config),
+                             subscriber_index=build_subscriber_index(config),
+                             rate_limits=build_rate_limits(config),
+                             metrics=metrics or build_metrics(config),
+                             access_log=build_access_log(config),
+                             tracer=tracer or build_tracer(config),
+                             tracing_admin=config.tracing_admin)
+    start_metrics(engine.metrics, engine.static_cache, engine.submission_queue, engine.access_log)
+    engine.tracer.start()
+    try:
+        asyncio.run(engine.serve(config.host, config.port, listen_socket))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        close_server_resources(engine)
+
+
+def create_listen_socket(host, port, backlog=1024):
+    """Create a listening socket that several worker processes can share"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if hasattr(socket, 'SO_REUSEPORT'):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    return sock
+
+
+def build_server(config, listen_socket=None, metrics=None, tracer=None):
+    """Create the HTTP server for the configured concurrency mode"""
+    address = (config.host, config.port)
+    if config.mode == 'single':
+        server = http.server.HTTPServer(address, DevTechAIHandler, bind_and_activate=listen_socket is None)
+    else:
+        server = ThreadPoolHTTPServer(address, DevTechAIHandler, config.threads,
+                                      bind_and_activate=listen_socket is None)
+    if listen_socket is not None:
+        server.socket.close()
+        server.socket = listen_socket
+        server.server_address = listen_socket.getsockname()
+    server.keepalive_timeout = config.keepalive_timeout
+    server.max_keepalive_requests = config.max_keepalive_requests
+    server.static_cache = build_static_cache(config)
+    server.use_sendfile = config.sendfile
+    server.max_form_bytes = config.max_form_kb * 1024
+    server.catalog_watcher = start_catalog_watcher(config)
+    server.submission_queue = build_submission_queue(config)
+    server.subscriber_index = build_subscriber_index(config)
+    server.rate_limits = build_rate_limits(config)
+    server.metrics = metrics or build_metrics(config)
+    server.access_log = build_access_log(config)
+    server.tracer = tracer or build_tracer(config)
+    server.tracing_admin = config.tracing_admin
+    start_metrics(server.metrics, server.static_cache, server.submission_queue, server.access_log)
+    server.tracer.start()
+    return server
+
+
+def close_server_resources(server):
+    """Flush the submissions queue and the access log of a server that has stopped"""
+    if server.submission_queue is not None:
+        server.submission_queue.close()
+    if server.access_log is not None:
+        server.access_log.close()
+
+
+def build_access_log(config):
+    """Create this process's access log writer, or None when logging is off"""
+    if config.access_log == 'none':
+        return None
+    return AccessLog(config.access_log, max_bytes=config.access_log_max_mb * 1024 * 1024,
+                     backups=config.access_log_backups, sample=config.access_log_sample)
+
+
+def build_tracer(config):
+    """Request tracer; its slow-request settings are shared by processes forked after this"""
+    return Tracer(config.trace_dir, slow_ms=config.slow_request_ms, profile=config.profile,
+                  profile_sample=config.profile_sample)
+
+
+def build_metrics(config, workers=1):
+    """Shared metrics for ``workers`` processes, or None when /metrics is disabled"""
+    if not config.metrics:
+        return None
+    return Metrics(workers)
+
+
+def start_metrics(metrics, static_cache, submission_queue, access_log):
+    """Feed this process's caches, queue and access log into its metrics and start sampling them"""
+    if metrics is None:
+        return
+    if static_cache is not None:
+        metrics.add_source(lambda: {
+            'devtechai_static_cache_hits_total': static_cache.hits,
+            'devtechai_static_cache_misses_total': static_cache.misses,
+            'devtechai_static_cache_bytes': static_cache.current_bytes,
+        })
+    metrics.add_source(api_cache_counts)
+    if submission_queue is not None:
+        metrics.add_source(lambda: {
+            'devtechai_submissions_pending': len(submission_queue.pending),
+            'devtechai_submissions_delivered_total': submission_queue.delivered,
+        })
+    if access_log is not None:
+        metrics.add_source(lambda: {'devtechai_access_log_dropped_total': access_log.dropped})
+    metrics.start_sampler()
+
+
+def build_rate_limits(config):
+    """Per-client limits for forms and the API (static files are never limited)"""
+    return RateLimits((('/forms/', config.form_rate_limit), ('/api/', config.api_rate_limit)),
+                      max_clients=config.rate_limit_clients, trusted_proxies=parse_proxies(config.trusted_proxies))
+
+
+def build_subscriber_index(config):
+    """Open the newsletter dedup index, or None when it is disabled"""
+    if config.subscribers_dir == 'none':
+        return None
+    return SubscriberIndex(config.subscribers_dir)
+
+
+def build_submission_queue(config):
+    """Create this process's write-behind queue for form submissions, or None when disabled"""
+    if config.submissions == 'none':
+        return None
+    return SubmissionQueue(sink_from_spec(config.submissions), config.wal_dir,
+                           max_pending=config.queue_max, fsync_interval=config.wal_fsync_ms / 1000)
+
+
+def build_static_cache(config):
+    """Create the in-memory static file cache, or None when it is disabled"""
+    if config.cache_mb <= 0:
+        return None
+    return StaticFileCache(max_bytes=config.cache_mb * 1024 * 1024,
+                           max_file_bytes=config.cache_max_file_kb * 1024,
+                           revalidate_interval=config.cache_revalidate)
+
+
+def stop_worker(signum, frame):
+    """SIGTERM handler for forked workers"""
+    raise SystemExit(0)
+
+
+def run_prefork(config):
+    """Fork worker processes that all accept on one shared listening socket
+
+    Returns the exit status: 1 when workers kept failing right after starting.
+    """
+    listen_socket = create_listen_socket(config.host, config.port)
+    # Created before forking so every worker can report the totals of all of them
+    metrics = build_metrics(config, config.workers)
+    tracer = build_tracer(config)
+    children = {}
+    spawned_at = {}
+    fast_failures = [0] * config.workers
+    stopping = False
+    status = 0
+
+    def spawn_worker(slot):
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            # Unwind on SIGTERM so the worker's queued submissions are flushed
+            signal.signal(signal.SIGTERM, stop_worker)
+            if metrics is not None:
+                metrics.bind(slot)
+            tracer.bind()
+            status = 0
+            try:
+                if config.mode == 'asyncio':
+                    run_asyncio(config, listen_socket, metrics, tracer)
+                else:
+                    server = build_server(config, listen_socket, metrics, tracer)
+                    try:
+                        server.serve_forever()
+                    finally:
+                        close_server_resources(server)
+            except Exception as e:
+                sys.stderr.write(f"[DevTechAI Server] Worker {os.getpid()} crashed: {e}\n")
+                status = 1
+            finally:
+                os._exit(status)
+        children[pid] = slot
+        spawned_at[pid] = time.monotonic()
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for slot in range(config.workers):
+        spawn_worker(slot)
+
+    while children:
+        try:
+            pid, _ = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        slot = children.pop(pid, None)
+        uptime = time.monotonic() - spawned_at.pop(pid, 0.0)
+        if stopping or slot is None:
+            continue
+        fast_failures[slot] = fast_failures[slot] + 1 if uptime < WORKER_MIN_UPTIME else 0
+        if fast_failures[slot] >= WORKER_MAX_FAST_FAILURES:
+            sys.stderr.write(f"[DevTechAI Server] Worker {pid} exited {fast_failures[slot]} times in a row "
+                             f"right after starting, stopping the server\n")
+            status = 1
+            stop(None, None)
+            continue
+        delay = 0.0
+        if fast_failures[slot]:
+            delay = min(WORKER_MAX_RESTART_DELAY, WORKER_RESTART_DELAY * 2 ** (fast_failures[slot] - 1))
+        sys.stderr.write(f"[DevTechAI Server] Worker {pid} exited, restarting in {delay:g}s\n")
+        time.sleep(delay)
+        if not stopping:
+            spawn_worker(slot)
+
+    listen_socket.close()
+    return status
+
+
+def env_int(name, default):
+    """Read an integer setting from the environment"""
+    value = os.environ.get(name)
+    if value is None or value == '':
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        print(f"⚠️  Ignoring invalid {name}={value!r}, using {default}")
+        return default
+
+
+def env_float(name, default):
+    """Read a decimal setting from the environment"""
+    value = os.environ.get(name)
+    if value is None or value == '':
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        print(f"⚠️  Ignoring invalid {name}={value!r}, using {default}")
+        return default
+
+
+def parse_args(argv=None):
+    """Parse server options; every flag can also be set through the environment"""
+    cpu_count = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description='DevTechAI WebApp v2.0 development server')
+    parser.add_argument('--host', default=os.environ.get('WEBAPP_HOST', ''),
+                        help='Interface to bind (env WEBAPP_HOST, default: all interfaces)')
+    parser.add_argument('--port', type=int, default=env_int('WEBAPP_PORT', 8000),
+                        help='Port to listen on (env WEBAPP_PORT, default: 8000)')
+    parser.add_argument('--mode', choices=SERVER_MODES, default=os.environ.get('WEBAPP_MODE', 'threaded'),
+                        help='Concurrency model (env WEBAPP_MODE, default: threaded)')
+    parser.add_argument('--workers', type=int, default=env_int('WEBAPP_WORKERS', cpu_count),
+                        help='Worker processes in prefork/asyncio mode (env WEBAPP_WORKERS, default: CPU count)')
+    parser.add_argument('--threads', type=int, default=env_int('WEBAPP_THREADS', 32),
+                        help='Threads per process in threaded/prefork mode (env WEBAPP_THREADS, default: 32)')
+    parser.add_argument('--keepalive-timeout', type=float, default=env_float('WEBAPP_KEEPALIVE_TIMEOUT', 5.0),
+                        help='Seconds an idle keep-alive connection is held open (env WEBAPP_KEEPALIVE_TIMEOUT, default: 5)')
+    parser.add_argument('--max-keepalive-requests', type=int, default=env_int('WEBAPP_MAX_KEEPALIVE_REQUESTS', 100),
+                        help='Requests served per connection before it is closed (env WEBAPP_MAX_KEEPALIVE_REQUESTS, default: 100)')
+    parser.add_argument('--cache-mb', type=int, default=env_int('WEBAPP_CACHE_MB', 64),
+                        help='Memory for cached static files per process, 0 disables (env WEBAPP_CACHE_MB, default: 64)')
+    parser.add_argument('--cache-max-file-kb', type=int, default=env_int('WEBAPP_CACHE_MAX_FILE_KB', 1024),
+                        help='Largest file kept in the static cache (env WEBAPP_CACHE_MAX_FILE_KB, default: 1024)')
+    parser.add_argument('--cache-revalidate', type=float, default=env_float('WEBAPP_CACHE_REVALIDATE', 1.0),
+                        help='Seconds between stat() checks of a cached file (env WEBAPP_CACHE_REVALIDATE, default: 1)')
+    parser.add_argument('--sendfile', action=argparse.BooleanOptionalAction,
+                        default=env_int('WEBAPP_SENDFILE', 1) != 0,
+                        help='Send uncached files with zero-copy sendfile() (env WEBAPP_SENDFILE, default: on)')
+    parser.add_argument('--max-form-kb', type=int, default=env_int('WEBAPP_MAX_FORM_KB', MAX_FORM_BYTES // 1024),
+                        help='Largest form post accepted, larger ones get 413 (env WEBAPP_MAX_FORM_KB, default: 64)')
+    parser.add_argument('--submissions', default=os.environ.get('WEBAPP_SUBMISSIONS', 'sqlite:var/submissions.db'),
+                        help="Where form submissions are delivered: sqlite:<path>, supabase[:<table>] or none "
+                             "(env WEBAPP_SUBMISSIONS, default: sqlite:var/submissions.db)")
+    parser.add_argument('--wal-dir', default=os.environ.get('WEBAPP_WAL_DIR', os.path.join('var', 'wal')),
+                        help='Directory for the submissions write-ahead log (env WEBAPP_WAL_DIR, default: var/wal)')
+    parser.add_argument('--queue-max', type=int, default=env_int('WEBAPP_QUEUE_MAX', 10000),
+                        help='Submissions waiting for the sink before posts get 503 (env WEBAPP_QUEUE_MAX, default: 10000)')
+    parser.add_argument('--wal-fsync-ms', type=int, default=env_int('WEBAPP_WAL_FSYNC_MS', 10),
+                        help='Group-commit window for write-ahead log fsyncs (env WEBAPP_WAL_FSYNC_MS, default: 10)')
+    parser.add_argument('--subscribers-dir', default=os.environ.get('WEBAPP_SUBSCRIBERS_DIR', os.path.join('var', 'subscribers')),
+                        help='Newsletter dedup index, or none to accept repeats (env WEBAPP_SUBSCRIBERS_DIR, default: var/subscribers)')
+    parser.add_argument('--form-rate-limit', default=os.environ.get('WEBAPP_FORM_RATE_LIMIT', '10/min'),
+                        help='Form posts per client, e.g. 10/min, or off (env WEBAPP_FORM_RATE_LIMIT, default: 10/min)')
+    parser.add_argument('--api-rate-limit', default=os.environ.get('WEBAPP_API_RATE_LIMIT', '50/s'),
+                        help='API requests per client, e.g. 50/s, or off (env WEBAPP_API_RATE_LIMIT, default: 50/s)')
+    parser.add_argument('--trusted-proxies', default=os.environ.get('WEBAPP_TRUSTED_PROXIES', ''),
+                        help='Reverse proxies whose X-Forwarded-For names the client for rate limits, as '
+                             'comma-separated addresses or CIDR ranges (env WEBAPP_TRUSTED_PROXIES, default: none)')
+    parser.add_argument('--rate-limit-clients', type=int, default=env_int('WEBAPP_RATE_LIMIT_CLIENTS', 1000000),
+                        help='Clients tracked per limit and process (env WEBAPP_RATE_LIMIT_CLIENTS, default: 1000000)')
+    parser.add_argument('--metrics', action=argparse.BooleanOptionalAction,
+                        default=env_int('WEBAPP_METRICS', 1) != 0,
+                        help='Serve Prometheus metrics at /metrics (env WEBAPP_METRICS, default: on)')
+    parser.add_argument('--access-log', default=os.environ.get('WEBAPP_ACCESS_LOG', '-'),
+                        help='JSON-lines access log file, - for stderr or none (env WEBAPP_ACCESS_LOG, default: -)')
+    parser.add_argument('--access-log-max-mb', type=int, default=env_int('WEBAPP_ACCESS_LOG_MAX_MB', 100),
+                        help='Size at which the access log file is rotated, 0 never rotates (env WEBAPP_ACCESS_LOG_MAX_MB, default: 100)')
+    parser.add_argument('--access-log-backups', type=int, default=env_int('WEBAPP_ACCESS_LOG_BACKUPS', 5),
+                        help='Rotated access log files kept (env WEBAPP_ACCESS_LOG_BACKUPS, default: 5)')
+    parser.add_argument('--access-log-sample', type=float, default=env_float('WEBAPP_ACCESS_LOG_SAMPLE', 1.0),
+                        help='Fraction of successful requests logged; errors are always logged '
+                             '(env WEBAPP_ACCESS_LOG_SAMPLE, default: 1.0)')
+    parser.add_argument('--slow-request-ms', type=float, default=env_float('WEBAPP_SLOW_REQUEST_MS', 0),
+                        help='Dump requests slower than this to --trace-dir, 0 disables '
+                             '(env WEBAPP_SLOW_REQUEST_MS, default: 0)')
+    parser.add_argument('--profile', choices=PROFILE_MODES, default=os.environ.get('WEBAPP_PROFILE', 'stack'),
+                        help='What slow request dumps capture: stack samples, a cProfile of sampled requests, '
+                             'or off for phase timings only (env WEBAPP_PROFILE, default: stack)')
+    parser.add_argument('--profile-sample', type=float, default=env_float('WEBAPP_PROFILE_SAMPLE', 0.05),
+                        help='Fraction of requests run under cProfile in cprofile mode '
+                             '(env WEBAPP_PROFILE_SAMPLE, default: 0.05)')
+    parser.add_argument('--trace-dir', default=os.environ.get('WEBAPP_TRACE_DIR', os.path.join('var', 'traces')),
+                        help='Directory for slow request dumps (env WEBAPP_TRACE_DIR, default: var/traces)')
+    parser.add_argument('--tracing-admin', action=argparse.BooleanOptionalAction,
+                        default=env_int('WEBAPP_TRACING_ADMIN', 0) != 0,
+                        help='Let local clients view and change tracing at /admin/tracing '
+                             '(env WEBAPP_TRACING_ADMIN, default: off)')
+    parser.add_argument('--catalog', default=os.environ.get('WEBAPP_CATALOG', CATALOG_PATH),
+                        help='Catalog file behind /api/* (env WEBAPP_CATALOG, default: data/catalog.json)')
+    parser.add_argument('--catalog-poll', type=float, default=env_float('WEBAPP_CATALOG_POLL', 2.0),
+                        help='Seconds between checks for catalog edits, 0 disables reloading (env WEBAPP_CATALOG_POLL, default: 2)')
+    config = parser.parse_args(argv)
+    if config.mode not in SERVER_MODES:
+        parser.error(f"invalid WEBAPP_MODE {config.mode!r} (choose from {', '.join(SERVER_MODES)})")
+    config.workers = max(1, config.workers)
+    if config.mode == 'prefork' and not hasattr(os, 'fork'):
+        print("⚠️  Prefork mode needs os.fork(); falling back to threaded mode")
+        config.mode = 'threaded'
+    if config.mode == 'asyncio' and not hasattr(os, 'fork'):
+        config.workers = 1
+    config.threads = max(1, config.threads)
+    config.max_keepalive_requests = max(1, config.max_keepalive_requests)
+    if not 0.0 <= config.access_log_sample <= 1.0:
+        parser.error("--access-log-sample must be between 0 and 1")
+    if config.profile not in PROFILE_MODES:
+        parser.error(f"invalid WEBAPP_PROFILE {config.profile!r} (choose from {', '.join(PROFILE_MODES)})")
+    if config.slow_request_ms < 0:
+        parser.error("--slow-request-ms must not be negative")
+    if not 0.0 <= config.profile_sample <= 1.0:
+        parser.error("--profile-sample must be between 0 and 1")
+    for option in ('form_rate_limit', 'api_rate_limit'):
+        try:
+            parse_limit(getattr(config, option))
+        except ValueError as e:
+            parser.error(str(e))
+    try:
+        parse_proxies(config.trusted_proxies)
+    except ValueError as e:
+        parser.error(str(e))
+    return config
+
+
+def main(argv=None):
     """Main function to start the server"""
-    PORT = 8000
-    
+    config = parse_args(argv)
+    PORT = config.port
+
+    if config.mode == 'single':
+        concurrency = "single-threaded"
+    elif config.mode == 'threaded':
+        concurrency = f"{config.threads} worker threads"
+    elif config.mode == 'prefork':
+        concurrency = f"{config.workers} processes x {config.threads} threads"
+    else:
+        concurrency = f"asyncio event loop x {config.workers} processes"
+
+    # Fail before binding (or forking) when the catalog cannot be served
+    try:
+        load_catalog(config.catalog)
+    except CatalogError as e:
+        print(f"❌ Error loading catalog: {e}")
+        sys.exit(1)
+    if config.submissions != 'none':
+        try:
+            sink_from_spec(config.submissions).close()
+        except ValueError as e:
+            print(f"❌ Error opening submissions sink: {e}")
+            sys.exit(1)
+    try:
+        access_log = build_access_log(config)
+    except OSError as e:
+        print(f"❌ Error opening access log: {e}")
+        sys.exit(1)
+    if access_log is not None:
+        access_log.close()
+    # Workers create these themselves; a path they cannot use would crash every one of them
+    for directory, needed in ((config.wal_dir, config.submissions != 'none'),
+                              (config.subscribers_dir, config.subscribers_dir != 'none')):
+        if not needed:
+            continue
+        try:
+            os.makedirs(directory, exist_ok=True)
+            if not os.access(directory, os.W_OK | os.X_OK):
+                raise PermissionError(errno.EACCES, "Permission denied", directory)
+        except OSError as e:
+            print(f"❌ Error creating data directory: {e}")
+            sys.exit(1)
+
     # Check if port is available
     try:
-        with socketserver.TCPServer(("", PORT), DevTechAIHandler) as httpd:
-            print(f"🚀 DevTechAI WebApp v2.0 Server starting...")
-            print(f"📡 Server running at http://localhost:{PORT}")
-            print(f"📁 Serving files from: {os.getcwd()}")
-            print(f"🔗 Open your browser and visit: http://localhost:{PORT}")
-            print(f"⏹️  Press Ctrl+C to stop the server")
-            print("-" * 60)
-            
+        if config.mode == 'prefork':
+            print_banner(PORT, concurrency)
+            status = run_prefork(config)
+            print("\n🛑 Server stopped")
+            if status:
+                sys.exit(status)
+            return
+
+        if config.mode == 'asyncio':
+            print_banner(PORT, concurrency)
+            status = 0
+            if config.workers > 1:
+                status = run_prefork(config)
+            else:
+                run_asyncio(config, create_listen_socket(config.host, PORT))
+            print("\n🛑 Server stopped")
+            if status:
+                sys.exit(status)
+            return
+
+        with build_server(config) as httpd:
+            print_banner(PORT, concurrency)
             try:
                 httpd.serve_forever()
             except KeyboardInterrupt:
                 print("\n🛑 Server stopped by user")
-                httpd.shutdown()
+            finally:
+                close_server_resources(httpd)
     except OSError as e:
-        if e.errno == 48:  # Address already in use
+        if e.errno in (48, errno.EADDRINUSE):  # Address already in use
             print(f"❌ Port {PORT} is already in use. Please try a different port.")
-            print(f"💡 You can specify a different port by modifying the PORT variable in this script.")
+            print(f"💡 You can specify a different port with --port or the WEBAPP_PORT environment variable.")
         else:
             print(f"❌ Error starting server: {e}")
         sys.exit(1)
 
+
+def print_banner(port, concurrency):
+    """Print the startup banner"""
+    print(f"🚀 DevTechAI WebApp v2.0 Server starting...")
+    print(f"📡 Server running at http://localhost:{port}")
+    print(f"📁 Serving files from: {os.getcwd()}")
+    print(f"🧵 Concurrency: {concurrency}")
+    print(f"🔗 Open your browser and visit: http://localhost:{port}")
+    print(f"⏹️  Press Ctrl+C to stop the server")
+    print("-" * 60)
+
+
 if __name__ == "__main__":
     main()
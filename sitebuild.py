@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+"""
+Site builder for DevTechAI WebApp v2.0
+Renders the service, portfolio and solution detail pages from the catalog
+through one shared layout (templates/layout.html), shared partials and one
+section template per section. Templates are compiled once per section into
+static byte chunks and slots, with the header, sidebar and footer already in
+place, so a page is rendered by joining chunks with its own fields. Builds
+are incremental: var/sitebuild-manifest.json records the input hashes of
+every page, and only pages whose inputs changed are rendered and written.
+Rendering, optional minification, compression and writing fan out over a
+process pool; results are reported in catalog order. Pages are staged and
+renamed into place together (pagewriter.py), so a live server never sees a
+partly written page.
+
+Usage: python3 sitebuild.py [services] [portfolio] [solutions]
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from string import Template
+
+from catalog import CatalogError, load_catalog, source_signature
+from pagewriter import PageWriter, remove_leftovers
+
+try:
+    import brotli
+except ImportError:  # optional: only needed for .br sidecars
+    brotli = None
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_DIR = os.path.join(ROOT, 'templates')
+MANIFEST_PATH = os.path.join(ROOT, 'var', 'sitebuild-manifest.json')
+MANIFEST_VERSION = 1
+# Pre-compressed sidecars server.py prefers over compressing on the fly
+SIDECARS = (('gzip', '.gz'), ('br', '.br'))
+# Elements whose whitespace is content; minify_html() copies them unchanged
+MINIFY_RE = re.compile(rb'(<(pre|textarea|script|style)\b.*?</\2\s*>)|>\s+(?=<)', re.DOTALL | re.IGNORECASE)
+LAYOUT_TEMPLATES = ('layout.html', 'partials/header.html', 'partials/page-title.html', 'partials/footer.html')
+
+NAV_LINKS = {
+    'home': ('/#hero', 'Home'),
+    'about': ('/#about', 'About'),
+    'services': ('/#services', 'Services'),
+    'portfolio': ('/#portfolio', 'Portfolio'),
+    'team': ('/#team', 'Team'),
+    'contact': ('/#contact', 'Contact'),
+}
+
+# Per-section page settings; {field} placeholders are filled from the catalog entry
+SECTIONS = {
+    'services': {
+        'page_title': '{title} - DevTechAI',
+        'description': '{description}',
+        'keywords': 'DevTechAI, {title}, AI solutions, cloud services',
+        'subtitle': '{short_desc}',
+        'body_class': 'service-details-page',
+        'nav': ('home', 'about', 'services', 'portfolio', 'team', 'contact'),
+        'active': 'services',
+        'get_started': '/#contact',
+        'crumb': ('/#services', 'Services'),
+    },
+    'portfolio': {
+        'page_title': '{title} - DevTechAI Portfolio',
+        'description': '{subtitle}',
+        'keywords': 'DevTechAI, {title}, {category}, portfolio',
+        'subtitle': '{subtitle}',
+        'body_class': 'portfolio-details-page',
+        'nav': ('home', 'about', 'services', 'portfolio', 'contact'),
+        'active': 'portfolio',
+        'get_started': '/#contact',
+        'crumb': ('/#portfolio', 'Portfolio'),
+    },
+    'solutions': {
+        'page_title': '{title} - DevTechAI Solutions',
+        'description': '{description}',
+        'keywords': 'DevTechAI, {title}, solutions',
+        'subtitle': '{description}',
+        'body_class': 'service-details-page',
+        'nav': ('home', 'about', 'services', 'portfolio', 'solutions', 'contact'),
+        'active': None,
+        'get_started': '/#about',
+        'crumb': ('/#services', 'Solutions'),
+    },
+}
+
+
+def read_template(name):
+    """Source of a template file, without its final newline"""
+    with open(os.path.join(TEMPLATE_DIR, name), encoding='utf-8') as f:
+        text = f.read()
+    return text[:-1] if text.endswith('\n') else text
+
+
+class CompiledTemplate:
+    """A template split once into static byte chunks and named slots
+
+    ``parts`` mixes bytes (static markup) and str (slot names). Rendering
+    only looks up the slots and joins; nothing is searched or re-parsed.
+    """
+
+    __slots__ = ('parts', 'slots')
+
+    def __init__(self, parts):
+        merged = []
+        for part in parts:
+            if isinstance(part, bytes) and merged and isinstance(merged[-1], bytes):
+                merged[-1] += part
+            elif part != b'':
+                merged.append(part)
+        self.parts = tuple(merged)
+        self.slots = frozenset(part for part in merged if isinstance(part, str))
+
+    def render(self, values):
+        """Join the chunks with ``values`` (bytes by slot name); raises KeyError for a missing slot"""
+        return b''.join([part if part.__class__ is bytes else values[part] for part in self.parts])
+
+
+def compile_template(text, **static):
+    """Compile ``${slot}`` template source into a CompiledTemplate
+
+    Slots named in ``static`` are filled in now: a str or bytes value becomes
+    markup, a CompiledTemplate is spliced in with its own slots. The other
+    slots stay open for render().
+    """
+    parts = []
+    position = 0
+    for match in Template.pattern.finditer(text):
+        parts.append(text[position:match.start()].encode('utf-8'))
+        position = match.end()
+        if match.group('escaped') is not None:
+            parts.append(b'$')
+            continue
+        name = match.group('named') or match.group('braced')
+        if name is None:
+            raise ValueError(f"invalid placeholder in template at offset {match.start()}")
+        value = static.get(name)
+        if value is None:
+            parts.append(name)
+        elif isinstance(value, CompiledTemplate):
+            parts.extend(value.parts)
+        else:
+            parts.append(value if isinstance(value, bytes) else value.encode('utf-8'))
+    parts.append(text[position:].encode('utf-8'))
+    return CompiledTemplate(parts)
+
+
+def solutions_menu(solutions):
+    """Solutions dropdown: ungrouped entries inline, each group as a nested dropdown"""
+    entries = []
+    nested = {}
+    for solution in solutions:
+        group = solution.get('group')
+        if group is None:
+            entries.append((None, [solution]))
+        elif group in nested:
+            nested[group].append(solution)
+        else:
+            nested[group] = [solution]
+            entries.append((group, nested[group]))
+
+    lines = ['          <li class="dropdown"><a href="#"><span>Solutions</span> <i class="bi bi-chevron-down toggle-dropdown"></i></a>',
+             '            <ul>']
+    for group, members in entries:
+        if group is None:
+            lines.append(f'              <li><a href="{members[0]["slug"]}.html">{members[0]["name"]}</a></li>')
+            continue
+        lines.append(f'              <li class="dropdown"><a href="#"><span>{group}</span> <i class="bi bi-chevron-down toggle-dropdown"></i></a>')
+        lines.append('                <ul>')
+        lines.extend(f'                  <li><a href="{member["slug"]}.html">{member["name"]}</a></li>' for member in members)
+        lines.append('                </ul>')
+        lines.append('              </li>')
+    lines.append('            </ul>')
+    lines.append('          </li>')
+    return "\n".join(lines)
+
+
+def sidebar(items):
+    """Sidebar links with the active marker of each link as a slot: (template, {slug: slot})"""
+    parts = []
+    slots = {}
+    for index, item in enumerate(items):
+        slots[item['slug']] = f'active_{index}'
+        if index:
+            parts.append(b'\n')
+        parts.append(f'                <a href="{item["slug"]}.html"'.encode('utf-8'))
+        parts.append(slots[item['slug']])
+        parts.append(f'><i class="bi bi-arrow-right-circle"></i><span>{item["name"]}</span></a>'.encode('utf-8'))
+    return CompiledTemplate(parts), slots
+
+
+def compress(data, encoding):
+    """Sidecar body for ``encoding``, or None when the encoder is unavailable"""
+    if encoding == 'gzip':
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if encoding == 'br' and brotli is not None:
+        return brotli.compress(data)
+    return None
+
+
+def minify_html(data):
+    """Collapse whitespace between tags to one space or newline
+
+    Text and attribute values are left alone, and so are <pre>, <textarea>,
+    <script> and <style> elements, so the page renders the same.
+    """
+    def collapse(match):
+        if match.group(1):
+            return match.group(1)
+        return b'>\n' if b'\n' in match.group() else b'> '
+    return MINIFY_RE.sub(collapse, data)
+
+
+def digest(*parts):
+    """Short blake2b hex digest of some strings or bytes"""
+    h = hashlib.blake2b(digest_size=8)
+    for part in parts:
+        h.update(part if isinstance(part, bytes) else part.encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+class SiteBuilder:
+    """Renders catalog pages into ``output_dir`` (the docroot by default)
+
+    Each output is recorded in the manifest with the hashes of everything it
+    was rendered from. A page whose inputs and file are unchanged since the
+    last build is skipped without rendering; a re-rendered page whose bytes
+    did not change is left untouched on disk. With ``minify`` pages are
+    passed through minify_html(); with ``compress`` every page also gets .gz
+    (and .br, when brotli is installed) sidecars.
+    """
+
+    def __init__(self, catalog, output_dir=ROOT, compress=False, minify=False):
+        self.catalog = catalog
+        self.output_dir = output_dir
+        self.minify = minify
+        self.sidecars = [(encoding, suffix) for encoding, suffix in SIDECARS
+                         if compress and (encoding != 'br' or brotli is not None)]
+        self.templates = {name: read_template(name) for name in LAYOUT_TEMPLATES}
+        self.footer = compile_template(self.templates['partials/footer.html'], footer_services="\n".join(
+            f'              <li><i class="bi bi-chevron-right"></i> <a href="../services/{service["slug"]}.html"> {service["name"]}</a></li>'
+            for service in catalog['services'] if service.get('footer')
+        )).render({})
+        with open(os.path.abspath(__file__), encoding='utf-8') as f:
+            builder = digest(f.read())
+        self.common_inputs = {name: digest(text) for name, text in self.templates.items()}
+        self.common_inputs.update(builder=builder, footer=digest(self.footer))
+        if minify:
+            # Switching minification on or off re-renders every page
+            self.common_inputs['minify'] = 'on'
+        self.shared = {}
+
+    def nav(self, section):
+        config = SECTIONS[section]
+        lines = []
+        for key in config['nav']:
+            if key == 'solutions':
+                lines.append(solutions_menu(self.catalog['solutions']))
+                continue
+            href, label = NAV_LINKS[key]
+            active = ' class="active"' if key == config['active'] else ''
+            lines.append(f'          <li><a href="{href}"{active}>{label}</a></li>')
+        return "\n".join(lines)
+
+    def section(self, section):
+        """What every page of a section shares, assembled once per build and process"""
+        if section in self.shared:
+            return self.shared[section]
+        config = SECTIONS[section]
+        name = f'sections/{section}.html'
+        source = read_template(name)
+        header = compile_template(self.templates['partials/header.html'],
+                                  nav=self.nav(section), get_started=config['get_started']).render({})
+        # Every entry of the section is listed, including hand-maintained pages
+        links, active_slots = sidebar(self.catalog[section])
+        crumb_href, crumb_label = config['crumb']
+        # The whole page as one chunk list: only per-page fields and the active link are left as slots
+        template = compile_template(
+            self.templates['layout.html'],
+            body_class=config['body_class'],
+            header=header,
+            heading=compile_template(self.templates['partials/page-title.html'],
+                                     crumb_href=crumb_href, crumb_label=crumb_label),
+            section=compile_template(source, sidebar=links),
+            footer=self.footer,
+        )
+        inputs = dict(self.common_inputs)
+        inputs[name] = digest(source)
+        inputs['section'] = digest(repr(sorted(config.items())), header, *(part for part in links.parts if isinstance(part, bytes)))
+        self.shared[section] = {'config': config, 'template': template, 'active_slots': active_slots,
+                                'inputs': inputs}
+        return self.shared[section]
+
+    def page_inputs(self, shared, item):
+        """Input hashes of one page: the section's plus the page's own catalog entry"""
+        return dict(shared['inputs'], page=digest(json.dumps(item, sort_keys=True)))
+
+    def render(self, shared, item):
+        """One page as bytes"""
+        config = shared['config']
+        template = shared['template']
+        fields = dict(item, icon=item.get('icon', 'gear'))
+        fields.update(page_title=config['page_title'].format_map(fields),
+                      subtitle=config['subtitle'].format_map(fields),
+                      description=config['description'].format_map(fields),
+                      keywords=config['keywords'].format_map(fields))
+        values = {slot: b'' for slot in shared['active_slots'].values()}
+        values.update((slot, str(fields[slot]).encode('utf-8')) for slot in template.slots if slot in fields)
+        active = shared['active_slots'].get(item['slug'])
+        if active is not None:
+            values[active] = b' class="active"'
+        return template.render(values)
+
+    def write_page(self, section, slug):
+        """Render one page and stage it and its sidecars if their bytes changed
+
+        Runs in the pool workers; returns a result dict for the report with
+        the staged (target, temporary file) pairs for the main process to
+        publish.
+        """
+        path = f"{section}/{slug}.html"
+        target = os.path.join(self.output_dir, path)
+        writer = PageWriter()
+        try:
+            data = self.render(self.section(section), self.catalog.get(section, slug))
+            if self.minify:
+                data = minify_html(data)
+            written = writer.write(target, data)
+            for encoding, suffix in self.sidecars:
+                writer.write(target + suffix, compress(data, encoding))
+        except (OSError, KeyError, ValueError) as e:
+            writer.abort()
+            return {'path': path, 'status': 'failed', 'error': f"{type(e).__name__}: {e}"}
+        except BaseException:
+            writer.abort()
+            raise
+        return {'path': path, 'status': 'written' if written else 'unchanged',
+                'staged': list(writer.staged.items())}
+
+    def build(self, sections, manifest_path=MANIFEST_PATH, force=False, jobs=1):
+        """Bring the pages of ``sections`` up to date; returns the per-page results in catalog order"""
+        manifest = load_manifest(manifest_path)
+        sidecars = [encoding for encoding, _ in self.sidecars]
+        results = []
+        tasks = []
+        for section in sections:
+            shared = self.section(section)
+            os.makedirs(os.path.join(self.output_dir, section), exist_ok=True)
+            for item in self.catalog.pages(section):
+                path = f"{section}/{item['slug']}.html"
+                target = os.path.abspath(os.path.join(self.output_dir, path))
+                inputs = self.page_inputs(shared, item)
+                entry = manifest.get(target)
+                result = {'path': path, 'section': section, 'target': target, 'inputs': inputs, 'previous': entry}
+                results.append(result)
+                if (not force and entry and entry['inputs'] == inputs and entry.get('sidecars', []) == sidecars
+                        and list(source_signature(target) or ()) == entry['signature']):
+                    result['status'] = 'skipped'
+                else:
+                    tasks.append((section, item['slug']))
+
+        pending = [result for result in results if 'status' not in result]
+        # Pages are published together once all of them rendered: one fsync pass, then the renames
+        with PageWriter() as writer:
+            if jobs > 1 and len(tasks) > 1:
+                size = max(1, len(tasks) // (jobs * 4))
+                chunks = [tasks[start:start + size] for start in range(0, len(tasks), size)]
+                with ProcessPoolExecutor(min(jobs, len(tasks)), initializer=init_worker,
+                                         initargs=(self.catalog, self.output_dir, bool(self.sidecars),
+                                                   self.minify)) as pool:
+                    futures = [pool.submit(write_pages, chunk) for chunk in chunks]
+                    try:
+                        done = (outcome for future in futures for outcome in future.result())
+                        for result, outcome in zip(pending, done):
+                            writer.extend(outcome.pop('staged', ()))
+                            result.update(outcome)
+                    except BaseException:
+                        # Take over what the other workers staged, so the writer removes it too
+                        for future, chunk in zip(futures, chunks):
+                            if future.cancel():
+                                continue
+                            if future.exception() is None:
+                                for outcome in future.result():
+                                    writer.extend(outcome.pop('staged', ()))
+                            elif isinstance(future.exception(), BrokenProcessPool):
+                                # A killed worker could not remove its own temporary files
+                                for section, slug in chunk:
+                                    remove_leftovers(os.path.join(self.output_dir, f"{section}/{slug}.html"))
+                        raise
+            else:
+                for result, task in zip(pending, tasks):
+                    outcome = self.write_page(*task)
+                    writer.extend(outcome.pop('staged', ()))
+                    result.update(outcome)
+
+        for result in results:
+            if result['status'] in ('written', 'unchanged'):
+                manifest[result['target']] = {'inputs': result['inputs'], 'signature': list(source_signature(result['target'])),
+                                              'sidecars': sidecars}
+        save_manifest(manifest_path, manifest)
+        return results
+
+
+# Each pool worker builds its own SiteBuilder once and renders many pages with it
+worker_builder = None
+
+
+def init_worker(catalog, output_dir, compress, minify):
+    global worker_builder
+    worker_builder = SiteBuilder(catalog, output_dir, compress, minify)
+
+
+def write_pages(tasks):
+    """Render a chunk of pages; if one raises, the pages staged before it are removed"""
+    outcomes = []
+    try:
+        for task in tasks:
+            outcomes.append(worker_builder.write_page(*task))
+    except BaseException:
+        writer = PageWriter()
+        for outcome in outcomes:
+            writer.extend(outcome.get('staged', ()))
+        writer.abort()
+        raise
+    return outcomes
+
+
+def load_manifest(path):
+    """Outputs recorded by the last build: {absolute path: entry}"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Ignoring unreadable build manifest {path}: {e}", file=sys.stderr)
+        return {}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {}
+    return manifest.get('outputs', {})
+
+
+def save_manifest(path, outputs):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with PageWriter() as writer:
+        writer.write(path, json.dumps({'version': MANIFEST_VERSION, 'outputs': outputs}, indent=1, sort_keys=True))
+
+
+def report(results, sections, elapsed, jobs):
+    """Print one line per written or failed page and a summary per section"""
+    for result in results:
+        if result['status'] == 'written':
+            previous = result['previous']
+            changed = sorted(name for name, value in result['inputs'].items()
+                             if previous and previous['inputs'].get(name) != value)
+            print(f"Generated: {result['path']}" + (f" ({', '.join(changed)} changed)" if changed else ''))
+        elif result['status'] == 'failed':
+            print(f"❌ {result['path']}: {result['error']}", file=sys.stderr)
+
+    print(f"\n📄 {len(results)} pages in {elapsed:.2f}s ({jobs} {'process' if jobs == 1 else 'processes'})")
+    for section in sections:
+        counts = {status: 0 for status in ('written', 'unchanged', 'skipped', 'failed')}
+        for result in results:
+            if result['section'] == section:
+                counts[result['status']] += 1
+        print(f"   {section:<10} {counts['written']} written, {counts['unchanged']} unchanged, "
+              f"{counts['skipped']} up to date" + (f", {counts['failed']} failed" if counts['failed'] else ''))
+    failed = sum(result['status'] == 'failed' for result in results)
+    print(f"{'❌' if failed else '✅'} Build {'failed' if failed else 'complete'}")
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render the DevTechAI detail pages from data/catalog.json')
+    parser.add_argument('sections', nargs='*', metavar='section',
+                        help=f"sections to build ({', '.join(SECTIONS)}; default: all)")
+    parser.add_argument('--output-dir', default=ROOT, help='docroot to write the pages into (default: the repository)')
+    parser.add_argument('--manifest', default=MANIFEST_PATH,
+                        help='build manifest with the input hashes of every page (default: var/sitebuild-manifest.json)')
+    parser.add_argument('--force', action='store_true', help='re-render every page even if its inputs did not change')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='processes rendering and writing pages (default: CPU count)')
+    parser.add_argument('--compress', action='store_true',
+                        help='also write .gz (and .br with brotli installed) sidecars that server.py serves directly')
+    parser.add_argument('--minify', action='store_true',
+                        help='collapse whitespace between tags (pre, textarea, script and style are kept as is)')
+    args = parser.parse_args(argv)
+    unknown = [section for section in args.sections if section not in SECTIONS]
+    if unknown:
+        parser.error(f"unknown section: {', '.join(unknown)}")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    try:
+        catalog = load_catalog()
+    except CatalogError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    sections = args.sections or list(SECTIONS)
+    started = time.perf_counter()
+    builder = SiteBuilder(catalog, args.output_dir, args.compress, args.minify)
+    results = builder.build(sections, args.manifest, args.force, args.jobs)
+    return 1 if report(results, sections, time.perf_counter() - started, args.jobs) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
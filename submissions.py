@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Write-behind queue for form submissions in DevTechAI WebApp v2.0
+A submission is appended to a local write-ahead log and acknowledged at once;
+background threads fsync the log in groups and deliver batches to a sink
+(SQLite locally, Supabase in production). Logs left behind by a crashed
+process are replayed on the next start, and sinks ignore duplicate ids.
+"""
+
+import datetime
+import json
+import os
+import secrets
+import sqlite3
+import sys
+import threading
+import time
+import urllib.request
+from collections import deque
+
+try:
+    import fcntl
+except ImportError:  # no advisory locks (Windows): every log found at startup is adopted
+    fcntl = None
+
+WAL_SUFFIX = '.wal'
+# New logs are created and locked under this name, then renamed to .wal
+NEW_WAL_SUFFIX = '.wal.new'
+MAX_SEGMENT_BYTES = 1024 * 1024
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 0.5
+MAX_RETRY_DELAY = 30.0
+
+
+class QueueFull(Exception):
+    """Raised when too many submissions are waiting for the sink"""
+
+
+class SQLiteSink:
+    """Stores submissions in a local SQLite database, one transaction per batch"""
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        # Prefork workers share the database file; wait for each other's batches
+        self.db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('''CREATE TABLE IF NOT EXISTS submissions (
+            id TEXT PRIMARY KEY,
+            form TEXT NOT NULL,
+            received_at TEXT NOT NULL,
+            fields TEXT NOT NULL
+        )''')
+        self.db.commit()
+
+    def __str__(self):
+        return f"sqlite:{self.path}"
+
+    def write_batch(self, records):
+        with self.db:
+            self.db.executemany(
+                'INSERT OR IGNORE INTO submissions (id, form, received_at, fields) VALUES (?, ?, ?, ?)',
+                [(r['id'], r['form'], r['received_at'], json.dumps(r['fields'])) for r in records])
+
+    def close(self):
+        self.db.close()
+
+
+class SupabaseSink:
+    """Bulk-inserts submissions through the Supabase REST API (see SUPABASE_SETUP.md)"""
+
+    def __init__(self, url, key, table='submissions', timeout=10):
+        self.endpoint = f"{url.rstrip('/')}/rest/v1/{table}?on_conflict=id"
+        self.key = key
+        self.timeout = timeout
+
+    def __str__(self):
+        return f"supabase:{self.endpoint.split('?')[0]}"
+
+    def write_batch(self, records):
+        body = json.dumps([{'id': r['id'], 'form': r['form'], 'received_at': r['received_at'],
+                            'fields': r['fields']} for r in records]).encode()
+        request = urllib.request.Request(self.endpoint, data=body, method='POST', headers={
+            'apikey': self.key,
+            'Authorization': f'Bearer {self.key}',
+            'Content-Type': 'application/json',
+            'Prefer': 'resolution=ignore-duplicates,return=minimal',
+        })
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+    def close(self):
+        pass
+
+
+def sink_from_spec(spec):
+    """Build a sink from 'sqlite:<path>' or 'supabase[:<table>]'"""
+    kind, _, arg = spec.partition(':')
+    if kind == 'sqlite':
+        path = arg or os.path.join('var', 'submissions.db')
+        try:
+            return SQLiteSink(path)
+        except sqlite3.Error as e:
+            raise ValueError(f"cannot open {path}: {e}") from e
+    if kind == 'supabase':
+        url = os.environ.get('SUPABASE_URL')
+        key = os.environ.get('SUPABASE_SERVICE_ROLE_KEY') or os.environ.get('SUPABASE_ANON_KEY')
+        if not url or not key:
+            raise ValueError("the supabase sink needs SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY (or SUPABASE_ANON_KEY)")
+        return SupabaseSink(url, key, arg or 'submissions')
+    raise ValueError(f"unknown submissions sink {spec!r} (use sqlite:<path> or supabase[:<table>])")
+
+
+class Segment:
+    """One write-ahead log file, locked by the process that owns it"""
+
+    def __init__(self, path, create=False):
+        self.path = path
+        flags = os.O_RDWR | os.O_APPEND | (os.O_CREAT | os.O_EXCL if create else 0)
+        self.fd = os.open(path, flags, 0o600)
+        self.size = os.fstat(self.fd).st_size
+        self.pending = 0
+        self.sealed = not create
+
+    def try_lock(self):
+        """Take the segment's lock; False when a live process still owns it"""
+        if fcntl is None:
+            return True
+        try:
+            fcntl.flock(self.fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return False
+        return True
+
+    def records(self):
+        """Records in the log; a torn last line from a crash is skipped"""
+        with open(self.path, 'rb') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+    def remove(self):
+        os.close(self.fd)
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def process_alive(pid):
+    """Whether a process with this id (a string from a log name) may still be running"""
+    if fcntl is None:  # os.kill() would terminate it on Windows
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except (ValueError, ProcessLookupError):
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class SubmissionQueue:
+    """Durable write-behind queue: WAL append, group fsync, batched delivery with backpressure"""
+
+    def __init__(self, sink, wal_dir, max_pending=10000, fsync_interval=0.01,
+                 batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.sink = sink
+        self.wal_dir = wal_dir
+        self.max_pending = max_pending
+        self.fsync_interval = fsync_interval
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.pending = deque()
+        self.lock = threading.Lock()
+        self.ready = threading.Condition(self.lock)
+        self.dirty = threading.Event()
+        self.unsynced = set()
+        self.closing = False
+        self.delivered = 0
+        self.failures = 0
+        os.makedirs(wal_dir, exist_ok=True)
+        self.recovered = self.adopt_orphans()
+        self.active = self.new_segment()
+        self.threads = [
+            threading.Thread(target=self.sync_loop, name='wal-sync', daemon=True),
+            threading.Thread(target=self.flush_loop, name='submission-flush', daemon=True),
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def new_segment(self):
+        """Create a locked log; raises OSError
+
+        The log only appears under its .wal name once it is locked, so a worker
+        starting at the same moment cannot adopt it as an orphan and delete it.
+        """
+        name = f"{os.getpid()}-{time.time_ns()}-{secrets.token_hex(2)}"
+        segment = Segment(os.path.join(self.wal_dir, name + NEW_WAL_SUFFIX), create=True)
+        try:
+            if not segment.try_lock():
+                raise OSError(f"could not lock new submission log {segment.path}")
+            path = os.path.join(self.wal_dir, name + WAL_SUFFIX)
+            os.rename(segment.path, path)
+        except OSError:
+            segment.remove()
+            raise
+        segment.path = path
+        return segment
+
+    def adopt_orphans(self):
+        """Queue the records of logs whose owning process is gone"""
+        recovered = 0
+        for name in sorted(os.listdir(self.wal_dir)):
+            if name.endswith(NEW_WAL_SUFFIX):
+                # Empty leftover of a crash before the rename; a live creator may not have locked it yet
+                if not process_alive(name.split('-', 1)[0]):
+                    try:
+                        os.unlink(os.path.join(self.wal_dir, name))
+                    except FileNotFoundError:
+                        pass
+                continue
+            if not name.endswith(WAL_SUFFIX):
+                continue
+            try:
+                segment = Segment(os.path.join(self.wal_dir, name))
+            except FileNotFoundError:
+                continue
+            if not segment.try_lock():
+                os.close(segment.fd)
+                continue
+            for record in segment.records():
+                self.pending.append((segment, record))
+                segment.pending += 1
+                recovered += 1
+            if segment.pending == 0:
+                segment.remove()
+        if recovered:
+            sys.stderr.write(f"[DevTechAI Server] Recovered {recovered} queued submissions from {self.wal_dir}\n")
+        return recovered
+
+    def submit(self, form, fields):
+        """Log a submission and queue it for the sink; raises QueueFull under backpressure"""
+        record = {
+            'id': secrets.token_hex(12),
+            'form': form,
+            'received_at': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='milliseconds'),
+            'fields': fields,
+        }
+        line = json.dumps(record, separators=(',', ':')).encode() + b'\n'
+        with self.lock:
+            if len(self.pending) >= self.max_pending:
+                raise QueueFull(f"{len(self.pending)} submissions waiting for {self.sink}")
+            segment = self.active
+            # One write() per record: a crash loses at most the fsync window, never a half-queued batch
+            os.write(segment.fd, line)
+            segment.size += len(line)
+            segment.pending += 1
+            self.pending.append((segment, record))
+            self.unsynced.add(segment)
+            if segment.size >= MAX_SEGMENT_BYTES:
+                self.active = self.new_segment()
+                segment.sealed = True
+            if len(self.pending) >= self.batch_size:
+                self.ready.notify()
+        self.dirty.set()
+        return record['id']
+
+    def sync_loop(self):
+        """Group commit: one fsync covers every record appended since the last one"""
+        while True:
+            self.dirty.wait()
+            if self.closing:
+                return
+            time.sleep(self.fsync_interval)
+            self.dirty.clear()
+            with self.lock:
+                segments, self.unsynced = self.unsynced, set()
+            for segment in segments:
+                try:
+                    os.fsync(segment.fd)
+                except OSError:  # already delivered and removed
+                    pass
+
+    def flush_loop(self):
+        """Deliver batches when one is full or every flush_interval, backing off on sink errors"""
+        delay = 0
+        while True:
+            with self.lock:
+                if not self.closing:
+                    self.ready.wait_for(lambda: self.closing or len(self.pending) >= self.batch_size,
+                                        timeout=self.flush_interval)
+                batch = [self.pending[i] for i in range(min(len(self.pending), self.batch_size))]
+                if not batch and self.closing:
+                    return
+            if not batch:
+                continue
+            try:
+                self.sink.write_batch([record for _, record in batch])
+            except Exception as e:
+                # Records stay queued and logged; the next attempt resends the same batch
+                self.failures += 1
+                delay = min(MAX_RETRY_DELAY, max(1.0, delay * 2))
+                sys.stderr.write(f"[DevTechAI Server] Delivering {len(batch)} submissions to {self.sink} failed, "
+                                 f"retrying in {delay:.0f}s: {e}\n")
+                with self.lock:
+                    if self.closing:
+                        return
+                    self.ready.wait_for(lambda: self.closing, timeout=delay)
+                continue
+            delay = 0
+            self.settle(batch)
+
+    def settle(self, batch):
+        """Drop delivered records; logs with nothing left to deliver are deleted"""
+        finished = []
+        with self.lock:
+            for segment, _ in batch:
+                self.pending.popleft()
+                segment.pending -= 1
+                if segment.pending == 0 and segment.sealed:
+                    finished.append(segment)
+            self.delivered += len(batch)
+        for segment in set(finished):
+            segment.remove()
+
+    def close(self, timeout=5.0):
+        """Deliver what is queued, then remove the active log if it is fully delivered"""
+        with self.lock:
+            self.closing = True
+            self.ready.notify_all()
+        self.dirty.set()
+        for thread in self.threads:
+            thread.join(timeout)
+        with self.lock:
+            active = self.active
+            active.sealed = True
+            if active.pending == 0:
+                active.remove()
+            else:
+                os.fsync(active.fd)
+        self.sink.close()
@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Newsletter subscriber index for DevTechAI WebApp v2.0
+Subscribers are kept on disk as 16-byte BLAKE2 digests of their normalized
+address: a sorted index file searched by bisection plus a journal of recent
+additions. An in-memory Bloom filter answers "never seen" without touching
+either, and compaction folds the journal into the index.
+
+    python3 subscribers.py stats [DIR]
+    python3 subscribers.py compact [DIR]
+"""
+
+import hashlib
+import math
+import mmap
+import os
+import sys
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:  # no advisory locks (Windows): run a single server process
+    fcntl = None
+
+DIGEST_SIZE = 16
+INDEX_FILE = 'index.dat'
+JOURNAL_FILE = 'journal.dat'
+COMPACT_THRESHOLD = 50000
+BLOOM_CAPACITY = 1000000
+BLOOM_ERROR_RATE = 0.01
+
+
+def normalize_email(email):
+    return email.strip().lower()
+
+
+def email_digest(email):
+    return hashlib.blake2b(normalize_email(email).encode(), digest_size=DIGEST_SIZE,
+                           person=b'devtechai-subs').digest()
+
+
+class BloomFilter:
+    """Bit array with k probes derived from a digest by double hashing"""
+
+    def __init__(self, capacity=BLOOM_CAPACITY, error_rate=BLOOM_ERROR_RATE):
+        self.size = max(64, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.probes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def positions(self, digest):
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:16], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.probes)]
+
+    def add(self, digest):
+        for position in self.positions(digest):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, digest):
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self.positions(digest))
+
+
+class SubscriberIndex:
+    """Set of subscribed addresses shared by every server process through the files in ``directory``
+
+    Requests only append to the journal. Compaction runs on a background
+    thread that merges and builds the new Bloom filter without holding either
+    lock, then swaps them in. A process that finds an index compacted by
+    another one switches to it at once and answers from the sorted index alone
+    until its own Bloom filter has been rebuilt in the background.
+    """
+
+    def __init__(self, directory, compact_threshold=COMPACT_THRESHOLD):
+        self.directory = directory
+        self.compact_threshold = compact_threshold
+        self.index_path = os.path.join(directory, INDEX_FILE)
+        self.journal_path = os.path.join(directory, JOURNAL_FILE)
+        self.lock = threading.Lock()
+        # Serializes compaction and Bloom filter rebuilds, which work outside self.lock
+        self.maintenance_lock = threading.Lock()
+        self.maintainer = None
+        self.closing = False
+        os.makedirs(directory, exist_ok=True)
+        self.journal_fd = os.open(self.journal_path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o600)
+        self.index_map = None
+        with self.lock, self.file_lock():
+            index_map, count, inode = self.open_index()
+            self.switch_index(index_map, count, inode, self.build_bloom(index_map, count))
+
+    def file_lock(self):
+        return JournalLock(self.journal_fd)
+
+    def open_index(self, path=None):
+        """Map an index file: (mmap or None, entries, inode); index files are only ever replaced"""
+        try:
+            with open(path or self.index_path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                if st.st_size < DIGEST_SIZE:
+                    return None, 0, st.st_ino
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), st.st_size // DIGEST_SIZE, st.st_ino
+        except FileNotFoundError:
+            return None, 0, None
+
+    def build_bloom(self, index_map, count):
+        bloom = BloomFilter(max(BLOOM_CAPACITY, 2 * (count + self.compact_threshold)))
+        for i in range(count):
+            bloom.add(index_map[i * DIGEST_SIZE:(i + 1) * DIGEST_SIZE])
+        return bloom
+
+    def switch_index(self, index_map, count, inode, bloom=None):
+        """Use another index file and re-read its journal (caller holds both locks)
+
+        Without ``bloom``, lookups skip the filter until the background
+        thread has built one.
+        """
+        if self.index_map is not None:
+            self.index_map.close()
+        self.index_map = index_map
+        self.index_count = count
+        self.index_inode = inode
+        self.bloom = bloom
+        self.journal = set()
+        self.journal_offset = 0
+        self.catch_up()
+        if bloom is None:
+            self.schedule_maintenance()
+
+    def catch_up(self):
+        """Pick up journal entries appended by other processes"""
+        size = os.fstat(self.journal_fd).st_size
+        if size - self.journal_offset < DIGEST_SIZE:
+            return
+        data = os.pread(self.journal_fd, size - self.journal_offset, self.journal_offset)
+        whole = len(data) - len(data) % DIGEST_SIZE
+        for start in range(0, whole, DIGEST_SIZE):
+            digest = data[start:start + DIGEST_SIZE]
+            self.journal.add(digest)
+            if self.bloom is not None:
+                self.bloom.add(digest)
+        self.journal_offset += whole
+
+    def index_file_inode(self):
+        try:
+            return os.stat(self.index_path).st_ino
+        except FileNotFoundError:
+            return None
+
+    def refresh(self):
+        """Switch to an index another process compacted, otherwise read new journal entries"""
+        if self.index_file_inode() != self.index_inode:
+            self.switch_index(*self.open_index())
+        else:
+            self.catch_up()
+
+    def in_index(self, digest):
+        """Binary search of the sorted on-disk index"""
+        index_map = self.index_map
+        low, high = 0, self.index_count
+        while low < high:
+            middle = (low + high) // 2
+            probe = index_map[middle * DIGEST_SIZE:(middle + 1) * DIGEST_SIZE]
+            if probe < digest:
+                low = middle + 1
+            elif probe > digest:
+                high = middle
+            else:
+                return True
+        return False
+
+    def known(self, digest):
+        if self.bloom is not None and digest not in self.bloom:
+            return False
+        return digest in self.journal or self.in_index(digest)
+
+    def __contains__(self, email):
+        digest = email_digest(email)
+        with self.lock:
+            if self.known(digest):
+                return True
+            with self.file_lock():
+                self.refresh()
+                return self.known(digest)
+
+    def add(self, email, commit=None):
+        """Record a new subscriber; returns False for an address that is already subscribed
+
+        ``commit`` runs while the address is reserved. If it raises, the
+        address is not recorded and the exception propagates.
+        """
+        digest = email_digest(email)
+        with self.lock:
+            # Subscribers are never removed, so a hit needs no cross-process check
+            if self.known(digest):
+                return False
+            with self.file_lock():
+                self.refresh()
+                if self.known(digest):
+                    return False
+                if commit is not None:
+                    commit()
+                os.write(self.journal_fd, digest)
+                self.journal_offset += DIGEST_SIZE
+                self.journal.add(digest)
+                if self.bloom is not None:
+                    self.bloom.add(digest)
+            if len(self.journal) >= self.compact_threshold:
+                self.schedule_maintenance()
+        return True
+
+    def schedule_maintenance(self):
+        """Start the background thread unless it is already running (caller holds self.lock)"""
+        if self.maintainer is None and not self.closing:
+            self.maintainer = threading.Thread(target=self.maintain, name='subscriber-index', daemon=True)
+            self.maintainer.start()
+
+    def maintain(self):
+        """Rebuild a missing Bloom filter and compact a long journal until neither is needed"""
+        while True:
+            with self.lock:
+                rebuild = self.bloom is None
+                if self.closing or not (rebuild or len(self.journal) >= self.compact_threshold):
+                    self.maintainer = None
+                    return
+            try:
+                if rebuild:
+                    self.rebuild_bloom()
+                else:
+                    self.compact()
+            except OSError as e:
+                sys.stderr.write(f"[DevTechAI Server] Subscriber index maintenance failed: {e}\n")
+                with self.lock:
+                    self.maintainer = None
+                return
+
+    def rebuild_bloom(self):
+        """Build the Bloom filter of the current index off-lock and swap it in"""
+        with self.maintenance_lock:
+            index_map, count, inode = self.open_index()
+            try:
+                bloom = self.build_bloom(index_map, count)
+            finally:
+                if index_map is not None:
+                    index_map.close()
+            with self.lock, self.file_lock():
+                self.refresh()
+                # Otherwise the index was replaced again and the next round builds for that one
+                if self.index_inode == inode and self.bloom is None:
+                    for digest in self.journal:
+                        bloom.add(digest)
+                    self.bloom = bloom
+
+    def compact(self):
+        """Merge the journal into the sorted index; returns False when there was nothing to do
+
+        Only the snapshot at the start and the swap at the end hold the locks;
+        entries added in between stay in the journal.
+        """
+        with self.maintenance_lock:
+            with self.lock, self.file_lock():
+                self.refresh()
+                if self.bloom is None or not self.journal:
+                    return False
+                inode = self.index_inode
+                merged = sorted(self.journal)
+                offset = self.journal_offset
+            index_map, count, opened_inode = self.open_index()
+            if opened_inode != inode:
+                # Another process compacted meanwhile
+                if index_map is not None:
+                    index_map.close()
+                return False
+            fd, temp_path = tempfile.mkstemp(prefix=INDEX_FILE + '.', suffix='.tmp', dir=self.directory)
+            try:
+                with os.fdopen(fd, 'wb') as out:
+                    existing = (index_map[i * DIGEST_SIZE:(i + 1) * DIGEST_SIZE] for i in range(count))
+                    for digest in merge_unique(existing, merged):
+                        out.write(digest)
+                    out.flush()
+                    os.fsync(out.fileno())
+                if index_map is not None:
+                    index_map.close()
+                new_map, new_count, new_inode = self.open_index(temp_path)
+                bloom = self.build_bloom(new_map, new_count)
+                with self.lock, self.file_lock():
+                    self.refresh()
+                    if self.index_inode != inode:
+                        if new_map is not None:
+                            new_map.close()
+                        os.unlink(temp_path)
+                        return False
+                    size = os.fstat(self.journal_fd).st_size
+                    tail = os.pread(self.journal_fd, size - offset, offset) if size > offset else b''
+                    # The new index is durable before the journal it replaces is rewritten
+                    os.replace(temp_path, self.index_path)
+                    fsync_directory(self.directory)
+                    self.rewrite_journal(tail[:len(tail) - len(tail) % DIGEST_SIZE])
+                    self.switch_index(new_map, new_count, new_inode, bloom)
+            except BaseException:
+                try:
+                    os.unlink(temp_path)
+                except FileNotFoundError:
+                    pass
+                raise
+        return True
+
+    def rewrite_journal(self, tail):
+        """Keep only ``tail`` in the journal (caller holds both locks)
+
+        The tail is written over the start of the old journal before it is cut
+        short, so a crash leaves entries the index already has, never fewer.
+        """
+        fd = os.open(self.journal_path, os.O_WRONLY)
+        try:
+            if tail:
+                os.pwrite(fd, tail, 0)
+            os.ftruncate(fd, len(tail))
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def stats(self):
+        with self.lock, self.file_lock():
+            self.refresh()
+            return {'indexed': self.index_count, 'journal': len(self.journal),
+                    'bloom_bits': self.bloom.size if self.bloom is not None else 0,
+                    'bloom_probes': self.bloom.probes if self.bloom is not None else 0}
+
+    def close(self, timeout=5.0):
+        with self.lock:
+            self.closing = True
+            maintainer = self.maintainer
+        if maintainer is not None:
+            maintainer.join(timeout)
+        with self.lock:
+            if self.index_map is not None:
+                self.index_map.close()
+                self.index_map = None
+            os.close(self.journal_fd)
+
+
+def merge_unique(existing, merged):
+    """Sorted, duplicate-free union of two sorted digest sequences"""
+    pending = iter(merged)
+    next_new = next(pending, None)
+    last = None
+    for digest in existing:
+        while next_new is not None and next_new < digest:
+            if next_new != last:
+                yield next_new
+                last = next_new
+            next_new = next(pending, None)
+        if digest != last:
+            yield digest
+            last = digest
+    while next_new is not None:
+        if next_new != last:
+            yield next_new
+            last = next_new
+        next_new = next(pending, None)
+
+
+def fsync_directory(path):
+    """Persist a rename in ``path`` where the platform supports it"""
+    if hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+class JournalLock:
+    """Exclusive flock on the journal, serializing index changes across processes"""
+
+    def __init__(self, fd):
+        self.fd = fd
+
+    def __enter__(self):
+        if fcntl is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info):
+        if fcntl is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+    directory = sys.argv[2] if len(sys.argv) > 2 else os.path.join('var', 'subscribers')
+    if command not in ('stats', 'compact'):
+        print(f"Usage: {sys.argv[0]} [stats|compact] [DIR]")
+        sys.exit(2)
+    index = SubscriberIndex(directory)
+    if command == 'compact':
+        index.compact()
+        print(f"✅ Compacted subscriber index in {directory}")
+    for key, value in index.stats().items():
+        print(f"{key}: {value}")
+    index.close()
@@ -0,0 +1,152 @@
+"""Tests for the indexed collection queries and /api/batch in server.py"""
+
+import json
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import server  # noqa: E402
+from catalog import load_catalog  # noqa: E402
+from server import (API_BATCH_RESOURCES, API_MAX_LIMIT, ApiCollection, ApiQueryError,  # noqa: E402
+                    api_payload, build_batch_response)
+
+ITEMS = [
+    {'id': 1, 'name': 'Cloud Migration', 'category': 'Cloud'},
+    {'id': 2, 'name': 'cloud security', 'category': 'Security'},
+    {'id': 3, 'name': 'Data Lake', 'category': 'cloud'},
+    {'id': 4, 'name': 'Zeta', 'category': None},
+]
+
+
+class ApiCollectionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.collection = ApiCollection('portfolio', ITEMS, 'category')
+
+    def ids(self, params):
+        payload = self.collection.payload(*self.collection.normalize(params))
+        return [entry['id'] for entry in payload['portfolio']]
+
+    def test_indexes(self):
+        self.assertEqual(self.collection.by_id, {1: 0, 2: 1, 3: 2, 4: 3})
+        self.assertEqual(self.collection.name_keys, ['cloud migration', 'cloud security', 'data lake', 'zeta'])
+        self.assertEqual(self.collection.by_category, {'cloud': [0, 2], 'security': [1]})
+        self.assertEqual(self.collection.fields, ('id', 'name', 'category'))
+
+    def test_ids(self):
+        self.assertEqual(self.ids({'id': ['3,1']}), [1, 3])
+        self.assertEqual(self.ids({'id': ['1', '99']}), [1])
+        with self.assertRaises(ApiQueryError):
+            self.collection.normalize({'id': ['one']})
+
+    def test_name_prefix(self):
+        self.assertEqual(self.ids({'name': ['CLOUD']}), [1, 2])
+        self.assertEqual(self.ids({'name': ['cloud s']}), [2])
+        self.assertEqual(self.ids({'name': ['zeta']}), [4])
+
+    def test_name_prefix_edges(self):
+        # An empty prefix matches every name; one sorting past the last name matches none
+        self.assertEqual(self.ids({'name': ['']}), [1, 2, 3, 4])
+        self.assertEqual(self.ids({'name': ['zz']}), [])
+        self.assertEqual(self.ids({'name': ['zeta, extended']}), [])
+        self.assertEqual(self.ids({'name': ['a']}), [])
+
+    def test_category(self):
+        self.assertEqual(self.ids({'category': ['CLOUD']}), [1, 3])
+        self.assertEqual(self.ids({'category': ['cloud'], 'name': ['data']}), [3])
+        self.assertEqual(self.ids({'category': ['unknown']}), [])
+        with self.assertRaises(ApiQueryError):
+            ApiCollection('team', ITEMS).normalize({'category': ['cloud']})
+
+    def test_normalize(self):
+        normalize = self.collection.normalize
+        self.assertEqual(normalize({'id': ['3,1']}), normalize({'id': ['1', '3']}))
+        self.assertEqual(normalize({'name': ['Cloud']}), normalize({'name': ['cLOUD']}))
+        self.assertEqual(normalize({'fields': ['name,id,name']})[3], ('name', 'id'))
+        self.assertEqual(normalize({}), (None,) * 6)
+        for params in ({'fields': ['secret']}, {'limit': ['0']}, {'limit': [str(API_MAX_LIMIT + 1)]},
+                       {'limit': ['-1']}, {'cursor': ['x']}):
+            with self.subTest(params=params), self.assertRaises(ApiQueryError):
+                normalize(params)
+
+    def test_fields_projection(self):
+        payload = self.collection.payload(*self.collection.normalize({'fields': ['name,id'], 'id': ['2']}))
+        self.assertEqual(payload, {'portfolio': [{'name': 'cloud security', 'id': 2}]})
+        self.assertEqual(list(payload['portfolio'][0]), ['name', 'id'])
+
+    def test_pagination(self):
+        first = self.collection.payload(*self.collection.normalize({'limit': ['3']}))
+        self.assertEqual([entry['id'] for entry in first['portfolio']], [1, 2, 3])
+        self.assertEqual((first['total'], first['next_cursor']), (4, '3'))
+        last = self.collection.payload(*self.collection.normalize({'limit': ['3'], 'cursor': [first['next_cursor']]}))
+        self.assertEqual([entry['id'] for entry in last['portfolio']], [4])
+        self.assertIsNone(last['next_cursor'])
+        past = self.collection.payload(*self.collection.normalize({'cursor': ['10']}))
+        self.assertEqual((past['portfolio'], past['total'], past['next_cursor']), ([], 4, None))
+
+    def test_query_caches_by_normalized_key(self):
+        self.assertIsNone(self.collection.query({'other': ['x']}))
+        response = self.collection.query({'id': ['3,1']})
+        self.assertEqual(json.loads(response.plain.body), {'portfolio': [ITEMS[0], ITEMS[2]]})
+        self.assertIs(self.collection.query({'id': ['1', '3']}), response)
+        self.assertEqual((self.collection.hits, self.collection.misses), (1, 1))
+
+    def test_query_cache_is_bounded(self):
+        self.collection.max_cached_queries = 2
+        for name in ('c', 'd', 'z'):
+            self.collection.query({'name': [name]})
+        self.assertEqual(len(self.collection.responses), 2)
+        self.collection.query({'name': ['c']})
+        self.assertEqual(self.collection.misses, 4)
+
+
+class BatchResponseTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.catalog = load_catalog()
+        server.publish_catalog(cls.catalog)
+
+    def setUp(self):
+        server.batch_responses.clear()
+        server.batch_counts.update(hits=0, misses=0)
+
+    def test_joins_the_named_resources(self):
+        response = build_batch_response('r=health,team&r=services,team')
+        body = json.loads(response.plain.body)
+        self.assertEqual(list(body), ['health', 'team', 'services'])
+        for name in body:
+            self.assertEqual(body[name], api_payload(API_BATCH_RESOURCES[name], self.catalog))
+
+    def test_rejects_missing_and_unknown_resources(self):
+        for query in ('', 'r=', 'r=,', 'x=health'):
+            with self.subTest(query=query), self.assertRaises(ApiQueryError) as caught:
+                build_batch_response(query)
+            self.assertIn('r must list resources', str(caught.exception))
+        with self.assertRaises(ApiQueryError) as caught:
+            build_batch_response('r=health,secrets')
+        self.assertIn("'secrets'", str(caught.exception))
+        self.assertEqual(len(server.batch_responses), 0)
+
+    def test_cached_by_resources_and_order(self):
+        response = build_batch_response('r=health,team')
+        self.assertIs(build_batch_response('r=health&r=team'), response)
+        self.assertIsNot(build_batch_response('r=team,health'), response)
+        self.assertEqual(server.batch_counts, {'hits': 1, 'misses': 2})
+
+    def test_cache_size_limit(self):
+        with mock.patch.object(server, 'MAX_BATCH_RESPONSES', 2):
+            first = build_batch_response('r=health')
+            build_batch_response('r=team')
+            build_batch_response('r=services')
+            self.assertEqual(len(server.batch_responses), 2)
+            self.assertIsNot(build_batch_response('r=health'), first)
+            self.assertEqual(len(server.batch_responses), 2)
+        self.assertEqual(server.batch_counts, {'hits': 0, 'misses': 4})
+
+
+if __name__ == '__main__':
+    unittest.main()
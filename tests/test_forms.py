@@ -0,0 +1,119 @@
+"""Tests for the streaming form body parsing in forms.py"""
+
+import asyncio
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from forms import (RequestBodyError, aiter_body, body_length, chunk_header,  # noqa: E402
+                   iter_body, read_form)
+
+
+def read_chunked(data, max_bytes=1024, chunk_size=4):
+    return b''.join(iter_body(io.BytesIO(data), None, max_bytes, chunk_size))
+
+
+def aread_chunked(data, max_bytes=1024, chunk_size=4):
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return b''.join([chunk async for chunk in aiter_body(reader, None, max_bytes, chunk_size)])
+    return asyncio.run(run())
+
+
+class ChunkHeaderTest(unittest.TestCase):
+
+    def test_hex_sizes(self):
+        self.assertEqual(chunk_header(b'0\r\n'), 0)
+        self.assertEqual(chunk_header(b'1a\r\n'), 26)
+        self.assertEqual(chunk_header(b'FF\n'), 255)
+        self.assertEqual(chunk_header(b'10;name=value\r\n'), 16)
+        self.assertEqual(chunk_header(b'10 ;name=value\r\n'), 16)
+
+    def test_rejects_non_hex_sizes(self):
+        for line in (b'-1\r\n', b'-5\r\n', b'+5\r\n', b'1_0\r\n', b'0x10\r\n', b'\r\n', b'g\r\n',
+                     b' \r\n', b'1 0\r\n', b'12345678901234567\r\n'):
+            with self.subTest(line=line), self.assertRaises(RequestBodyError) as caught:
+                chunk_header(line)
+            self.assertEqual(caught.exception.status, 400)
+
+    def test_rejects_unterminated_and_long_lines(self):
+        with self.assertRaises(RequestBodyError):
+            chunk_header(b'10')
+        with self.assertRaises(RequestBodyError):
+            chunk_header(b'1;' + b'x' * 2048 + b'\r\n')
+
+
+class ChunkedBodyTest(unittest.TestCase):
+    readers = (read_chunked, aread_chunked)
+
+    def test_decodes_chunks_and_ignores_trailers(self):
+        body = b'5\r\nhello\r\n7;ext=1\r\n, world\r\n0\r\nX-Trailer: yes\r\n\r\n'
+        for read in self.readers:
+            with self.subTest(read=read.__name__):
+                self.assertEqual(read(body), b'hello, world')
+
+    def test_trailer_cap(self):
+        line = b'X-Trailer: ' + b'y' * 1000 + b'\r\n'
+        for read in self.readers:
+            with self.subTest(read=read.__name__):
+                self.assertEqual(read(b'1\r\nx\r\n0\r\n' + line * 3 + b'\r\n'), b'x')
+                with self.assertRaises(RequestBodyError) as caught:
+                    read(b'1\r\nx\r\n0\r\n' + b'X-Trailer: yes\r\n' * 500 + b'\r\n')
+                self.assertEqual(caught.exception.status, 431)
+
+    def test_negative_size_is_rejected_before_reading(self):
+        body = b'-1\r\n' + b'x' * 4096
+        for read in self.readers:
+            with self.subTest(read=read.__name__), self.assertRaises(RequestBodyError) as caught:
+                read(body)
+            self.assertEqual(caught.exception.status, 400)
+
+    def test_body_cap(self):
+        body = b'400\r\n' + b'x' * 1024 + b'\r\n1\r\nx\r\n0\r\n\r\n'
+        for read in self.readers:
+            with self.subTest(read=read.__name__), self.assertRaises(RequestBodyError) as caught:
+                read(body, max_bytes=1024)
+            self.assertEqual(caught.exception.status, 413)
+
+    def test_truncated_chunk(self):
+        for read in self.readers:
+            with self.subTest(read=read.__name__), self.assertRaises(RequestBodyError) as caught:
+                read(b'a\r\nshort')
+            self.assertEqual(caught.exception.status, 400)
+
+    def test_bad_terminator(self):
+        for read in self.readers:
+            with self.subTest(read=read.__name__), self.assertRaises(RequestBodyError):
+                read(b'3\r\nabcX\r\n0\r\n\r\n')
+
+
+class BodyLengthTest(unittest.TestCase):
+
+    def test_lengths(self):
+        self.assertIsNone(body_length('chunked', None, 10))
+        self.assertEqual(body_length(None, None, 10), 0)
+        self.assertEqual(body_length(None, '7', 10), 7)
+
+    def test_rejections(self):
+        for args, status in ((('gzip', None, 10), 501), ((None, '-1', 10), 400),
+                             ((None, '1e3', 10), 400), ((None, '11', 10), 413)):
+            with self.subTest(args=args), self.assertRaises(RequestBodyError) as caught:
+                body_length(*args)
+            self.assertEqual(caught.exception.status, status)
+
+
+class ReadFormTest(unittest.TestCase):
+
+    def test_chunked_urlencoded_form(self):
+        body = b'6\r\nemail=\r\n9\r\na%40b.org\r\n0\r\n\r\n'
+        form = read_form(io.BytesIO(body), 'application/x-www-form-urlencoded', None, 1024)
+        self.assertEqual(form.get('email'), 'a@b.org')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+"""Tests for the baseline comparison in loadtest.py"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from loadtest import compare, error_rate  # noqa: E402
+
+
+def result(**fields):
+    summary = {'requests': 1000, 'rps': 100.0, 'p50_ms': 5.0, 'p90_ms': 8.0, 'p99_ms': 10.0,
+               'errors': 0, 'non_2xx': 0, 'rss_mb': 40.0}
+    summary.update(fields)
+    return summary
+
+
+class CompareTest(unittest.TestCase):
+
+    def test_error_rate(self):
+        self.assertEqual(error_rate(result()), 0)
+        self.assertAlmostEqual(error_rate(result(requests=90, errors=10)), 0.1)
+        self.assertEqual(error_rate(result(requests=0, errors=0)), 0)
+
+    def test_errors_fail_even_when_the_baseline_had_them(self):
+        failing = result(errors=32)
+        self.assertEqual(len(compare({'a': failing}, {'a': failing}, 0.2)), 1)
+        self.assertEqual(len(compare({'a': failing}, {}, 0.2)), 1)
+        self.assertEqual(compare({'a': result(non_2xx=1)}, {}, 0.2), [])
+        self.assertEqual(len(compare({'a': result(non_2xx=1)}, {}, 0.2, max_error_rate=0)), 1)
+
+    def test_throughput_and_latency(self):
+        base = {'a': result()}
+        self.assertEqual(compare({'a': result(rps=90.0, p99_ms=11.0)}, base, 0.2), [])
+        self.assertEqual(len(compare({'a': result(rps=70.0)}, base, 0.2)), 1)
+        self.assertEqual(len(compare({'a': result(p99_ms=20.0)}, base, 0.2)), 1)
+        # Within the p99 noise floor
+        self.assertEqual(compare({'a': result(p99_ms=1.0)}, {'a': result(p99_ms=0.5)}, 0.2), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+"""Tests for the shared Prometheus metrics in metrics.py"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metrics import SAMPLED_INDEX, Metrics  # noqa: E402
+
+
+class RestartTest(unittest.TestCase):
+
+    def test_sampled_counters_survive_a_worker_restart(self):
+        metrics = Metrics(workers=2)
+        metrics.bind(1)
+        figures = {'devtechai_static_cache_hits_total': 40, 'devtechai_static_cache_bytes': 1000,
+                   'devtechai_submissions_delivered_total': 7}
+        metrics.add_source(lambda: figures)
+        metrics.sample()
+        # The replacement worker's sources count from zero again
+        metrics.bind(1)
+        figures = {'devtechai_static_cache_hits_total': 2, 'devtechai_static_cache_bytes': 10,
+                   'devtechai_submissions_delivered_total': 0}
+        metrics.add_source(lambda: figures)
+        metrics.sample()
+        totals = metrics.totals()
+        self.assertEqual(totals[SAMPLED_INDEX['devtechai_static_cache_hits_total']], 42)
+        self.assertEqual(totals[SAMPLED_INDEX['devtechai_submissions_delivered_total']], 7)
+        self.assertEqual(totals[SAMPLED_INDEX['devtechai_static_cache_bytes']], 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
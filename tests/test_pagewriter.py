@@ -0,0 +1,45 @@
+"""Tests for the atomic page writer in pagewriter.py"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pagewriter import PageWriter, remove_leftovers  # noqa: E402
+
+
+class PageWriterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.scratch = tempfile.TemporaryDirectory()
+        self.page = os.path.join(self.scratch.name, 'page.html')
+
+    def tearDown(self):
+        self.scratch.cleanup()
+
+    def test_commit_and_abort(self):
+        with PageWriter(fsync=False) as writer:
+            self.assertTrue(writer.write(self.page, '<p>one</p>'))
+            self.assertFalse(os.path.exists(self.page))
+        with open(self.page, encoding='utf-8') as f:
+            self.assertEqual(f.read(), '<p>one</p>')
+        with self.assertRaises(RuntimeError), PageWriter(fsync=False) as writer:
+            writer.write(self.page, '<p>two</p>')
+            raise RuntimeError
+        self.assertEqual(os.listdir(self.scratch.name), ['page.html'])
+
+    def test_remove_leftovers(self):
+        writer = PageWriter(fsync=False)
+        writer.write(self.page, '<p>one</p>')
+        writer.write(self.page + '.gz', b'\x1f\x8b')
+        other = os.path.join(self.scratch.name, 'other.html')
+        writer.write(other, '<p>other</p>')
+        remove_leftovers(self.page)
+        self.assertEqual([temp for path, temp in writer.staged.items() if os.path.exists(temp)],
+                         [writer.staged[other]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Tests for Range request handling in server.py"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from server import MAX_BYTE_RANGES, ByteRanges, parse_range, resolve_ranges  # noqa: E402
+
+BODY = bytes(range(100))
+
+
+class ParseRangeTest(unittest.TestCase):
+
+    def test_ranges(self):
+        cases = {
+            'bytes=0-9': [(0, 9)],
+            'bytes=90-': [(90, 99)],
+            'bytes=-10': [(90, 99)],
+            'bytes=-500': [(0, 99)],
+            'bytes=50-500': [(50, 99)],
+            'bytes=20-29, 0-9': [(0, 9), (20, 29)],
+            'bytes=0-9,5-19,20-24': [(0, 24)],
+            'Bytes = 0-0': [(0, 0)],
+        }
+        for header, expected in cases.items():
+            with self.subTest(header=header):
+                self.assertEqual(parse_range(header, len(BODY)), expected)
+
+    def test_unsatisfiable(self):
+        for header in ('bytes=100-', 'bytes=200-300', 'bytes=-0'):
+            with self.subTest(header=header):
+                self.assertEqual(parse_range(header, len(BODY)), [])
+
+    def test_ignored(self):
+        too_many = 'bytes=' + ','.join(f'{2 * i}-{2 * i}' for i in range(MAX_BYTE_RANGES + 1))
+        for header in ('items=0-9', 'bytes=', 'bytes=9-0', 'bytes=a-b', 'bytes=0', 'bytes=--1', too_many):
+            with self.subTest(header=header):
+                self.assertIsNone(parse_range(header, len(BODY)))
+
+
+class ByteRangesTest(unittest.TestCase):
+
+    def test_single_range(self):
+        byte_ranges = ByteRanges([(10, 19)], len(BODY), 'text/plain')
+        self.assertEqual(byte_ranges.headers, [('Content-Range', 'bytes 10-19/100')])
+        self.assertEqual(byte_ranges.slice(BODY), BODY[10:20])
+        self.assertEqual(byte_ranges.content_length, 10)
+
+    def test_multipart(self):
+        byte_ranges = ByteRanges([(0, 1), (98, 99)], len(BODY), 'text/plain')
+        self.assertTrue(byte_ranges.content_type.startswith('multipart/byteranges; boundary='))
+        body = byte_ranges.slice(BODY)
+        self.assertEqual(len(body), byte_ranges.content_length)
+        self.assertIn(b'Content-Range: bytes 98-99/100\r\n\r\n' + BODY[98:], body)
+
+    def test_unsatisfiable(self):
+        byte_ranges = resolve_ranges('bytes=500-', None, '"x"', 0, len(BODY), 'text/plain')
+        self.assertFalse(byte_ranges.satisfiable)
+        self.assertEqual(byte_ranges.headers, [('Content-Range', 'bytes */100')])
+
+    def test_if_range(self):
+        self.assertIsNotNone(resolve_ranges('bytes=0-9', '"abc"', '"abc"', 0, len(BODY), 'text/plain'))
+        self.assertIsNone(resolve_ranges('bytes=0-9', '"old"', '"abc"', 0, len(BODY), 'text/plain'))
+        self.assertIsNone(resolve_ranges('bytes=0-9', 'W/"abc"', '"abc"', 0, len(BODY), 'text/plain'))
+
+
+if __name__ == '__main__':
+    unittest.main()
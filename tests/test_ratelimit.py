@@ -0,0 +1,74 @@
+"""Tests for the per-client rate limits in ratelimit.py"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ratelimit import RateLimiter, RateLimits, forwarded_client, parse_limit, parse_proxies  # noqa: E402
+
+
+class ParseTest(unittest.TestCase):
+
+    def test_parse_limit(self):
+        self.assertEqual(parse_limit('10/min'), (10, 60))
+        self.assertEqual(parse_limit('20/s'), (20, 1))
+        self.assertEqual(parse_limit('5/10s'), (5, 10))
+        self.assertIsNone(parse_limit('off'))
+        for spec in ('10', '0/s', '10/fortnight'):
+            with self.subTest(spec=spec), self.assertRaises(ValueError):
+                parse_limit(spec)
+
+    def test_parse_proxies(self):
+        self.assertEqual(len(parse_proxies('10.0.0.0/8, 127.0.0.1,::1')), 3)
+        self.assertEqual(parse_proxies(''), ())
+        with self.assertRaises(ValueError):
+            parse_proxies('nginx')
+
+
+class RateLimiterTest(unittest.TestCase):
+
+    def test_burst_then_refill(self):
+        limiter = RateLimiter(rate=1.0, burst=3)
+        self.assertEqual([limiter.check('a', now=100.0) for _ in range(3)], [0, 0, 0])
+        self.assertAlmostEqual(limiter.check('a', now=100.0), 1.0)
+        self.assertEqual(limiter.check('b', now=100.0), 0)
+        self.assertEqual(limiter.check('a', now=101.0), 0)
+        self.assertGreater(limiter.check('a', now=101.0), 0)
+
+    def test_idle_clients_are_forgotten(self):
+        limiter = RateLimiter(rate=1.0, burst=2)
+        start = limiter.rotated_at
+        limiter.check('a', now=start)
+        limiter.check('b', now=start + 5.0)
+        limiter.check('c', now=start + 10.0)
+        self.assertNotIn('a', limiter.current)
+        self.assertNotIn('a', limiter.previous)
+
+
+class ForwardedClientTest(unittest.TestCase):
+    proxies = parse_proxies('10.0.0.0/8')
+
+    def test_untrusted_peer_ignores_header(self):
+        self.assertEqual(forwarded_client('203.0.113.9', '198.51.100.1', self.proxies), '203.0.113.9')
+
+    def test_trusted_peer_uses_right_most_untrusted_entry(self):
+        self.assertEqual(forwarded_client('10.0.0.2', 'spoofed, 198.51.100.7, 10.0.0.5', self.proxies),
+                         '198.51.100.7')
+        self.assertEqual(forwarded_client('::ffff:10.0.0.2', '198.51.100.7', self.proxies), '198.51.100.7')
+
+    def test_without_header_or_proxies(self):
+        self.assertEqual(forwarded_client('10.0.0.2', None, self.proxies), '10.0.0.2')
+        self.assertEqual(forwarded_client('10.0.0.2', '198.51.100.7', ()), '10.0.0.2')
+
+    def test_clients_behind_proxy_get_separate_buckets(self):
+        limits = RateLimits((('/forms/', '1/min'),), trusted_proxies=self.proxies)
+        self.assertEqual(limits.retry_after('/forms/contact.php', '10.0.0.2', '198.51.100.1'), 0)
+        self.assertEqual(limits.retry_after('/forms/contact.php', '10.0.0.2', '198.51.100.2'), 0)
+        self.assertGreater(limits.retry_after('/forms/contact.php', '10.0.0.2', '198.51.100.1'), 0)
+        self.assertEqual(limits.retry_after('/other', '10.0.0.2', '198.51.100.1'), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
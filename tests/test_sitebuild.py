@@ -0,0 +1,32 @@
+"""Tests for the page minification in sitebuild.py"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sitebuild import minify_html  # noqa: E402
+
+
+class MinifyHtmlTest(unittest.TestCase):
+
+    def test_collapses_whitespace_between_tags(self):
+        page = b'<ul>\n      <li><a href="#">One</a></li>   <li>Two</li>\n\n    </ul>\n'
+        self.assertEqual(minify_html(page), b'<ul>\n<li><a href="#">One</a></li> <li>Two</li>\n</ul>\n')
+
+    def test_keeps_text_and_attributes(self):
+        page = b'<p title="a   b">Some   words\n   here</p>'
+        self.assertEqual(minify_html(page), page)
+
+    def test_keeps_whitespace_sensitive_elements(self):
+        for element in (b'<pre>\n  <b>x</b>\n  </pre>', b'<TEXTAREA>  <i>y</i>  </textarea>',
+                        b'<script>\n  var html = "<a>  </a>";\n</script>',
+                        b'<style>\n  a > b  {}\n</style >'):
+            with self.subTest(element=element):
+                self.assertEqual(minify_html(b'<div>\n  ' + element + b'\n</div>'),
+                                 b'<div>\n' + element + b'\n</div>')
+
+
+if __name__ == '__main__':
+    unittest.main()
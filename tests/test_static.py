@@ -0,0 +1,115 @@
+"""Tests for static file serving helpers in server.py"""
+
+import gzip
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from server import StaticFileCache, file_etag, open_static_file  # noqa: E402
+
+CSS = b'body { color: #333; }\n' * 200
+
+
+class StaticTest(unittest.TestCase):
+
+    def setUp(self):
+        self.scratch = tempfile.TemporaryDirectory()
+        self.root = self.scratch.name
+
+    def tearDown(self):
+        self.scratch.cleanup()
+
+    def write(self, name, data):
+        path = os.path.join(self.root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+
+class OpenStaticFileTest(StaticTest):
+
+    def test_files_and_index_pages(self):
+        self.write('docs/index.html', b'<h1>docs</h1>')
+        f, st, etag = open_static_file(os.path.join(self.root, 'docs') + '/')
+        with f:
+            self.assertTrue(f.name.endswith('index.html'))
+            self.assertEqual(st.st_size, 13)
+            self.assertEqual(f.tell(), 0)
+
+    def test_directories_are_not_listed(self):
+        os.makedirs(os.path.join(self.root, 'assets'))
+        self.assertIsNone(open_static_file(os.path.join(self.root, 'assets') + '/'))
+        with self.assertRaises(IsADirectoryError):
+            open_static_file(os.path.join(self.root, 'assets'))
+        self.assertIsNone(open_static_file(os.path.join(self.root, 'missing.css')))
+
+
+class FileEtagTest(StaticTest):
+
+    def etag(self, path):
+        with open(path, 'rb') as f:
+            return file_etag(f, os.fstat(f.fileno()))
+
+    def test_matches_the_cached_etag(self):
+        path = self.write('main.css', CSS)
+        self.assertEqual(self.etag(path), StaticFileCache().get(path).plain.etag)
+
+    def test_follows_the_content(self):
+        path = self.write('main.css', CSS)
+        first = self.etag(path)
+        self.assertEqual(self.etag(path), first)
+        self.write('main.css', CSS + b'a { }\n')
+        self.assertNotEqual(self.etag(path), first)
+
+
+class StaticFileCacheTest(StaticTest):
+
+    def test_peek_only_returns_validated_entries(self):
+        cache = StaticFileCache(revalidate_interval=60)
+        path = self.write('main.css', CSS)
+        self.assertIsNone(cache.peek(path))
+        entry = cache.get(path)
+        self.assertIs(cache.peek(path), entry)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_select_cached_needs_a_loaded_variant(self):
+        cache = StaticFileCache()
+        entry = cache.get(self.write('main.css', CSS))
+        self.assertIsNone(cache.select_cached(entry, 'gzip'))
+        gzipped = cache.select(entry, 'gzip')
+        self.assertEqual(gzipped.etag, f'"{entry.digest}-gzip"')
+        self.assertIs(cache.select_cached(entry, 'gzip'), gzipped)
+        self.assertIs(cache.select_cached(entry, 'identity'), entry.plain)
+
+    def test_sidecars_are_revalidated_with_their_entry(self):
+        cache = StaticFileCache(revalidate_interval=0)
+        path = self.write('main.css', CSS)
+        entry = cache.get(path)
+        built = cache.select(entry, 'gzip').body
+        self.write('main.css.gz', gzip.compress(CSS, mtime=0)[:-1] + b'\0')
+        self.assertIs(cache.get(path), entry)
+        sidecar = cache.select(entry, 'gzip').body
+        self.assertNotEqual(sidecar, built)
+        os.unlink(path + '.gz')
+        self.assertIs(cache.get(path), entry)
+        self.assertEqual(cache.select(entry, 'gzip').body, built)
+        self.assertEqual(cache.current_bytes, entry.size)
+
+    def test_variants_count_towards_the_limit(self):
+        first = self.write('a.css', CSS)
+        second = self.write('b.css', CSS.replace(b'333', b'444'))
+        cache = StaticFileCache(max_bytes=2 * len(CSS) + 10)
+        cache.get(first)
+        entry = cache.get(second)
+        cache.select(entry, 'gzip')
+        self.assertLessEqual(cache.current_bytes, cache.max_bytes)
+        self.assertIsNone(cache.peek(first))
+        self.assertEqual(cache.current_bytes, entry.size)
+
+
+if __name__ == '__main__':
+    unittest.main()
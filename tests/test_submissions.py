@@ -0,0 +1,70 @@
+"""Tests for the write-ahead log behind the submission queue in submissions.py"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from submissions import NEW_WAL_SUFFIX, WAL_SUFFIX, SubmissionQueue  # noqa: E402
+
+
+class ListSink:
+    def __init__(self):
+        self.records = []
+
+    def write_batch(self, records):
+        self.records.extend(records)
+
+    def close(self):
+        pass
+
+
+class WalTest(unittest.TestCase):
+
+    def setUp(self):
+        self.scratch = tempfile.TemporaryDirectory()
+        self.wal_dir = self.scratch.name
+
+    def tearDown(self):
+        self.scratch.cleanup()
+
+    def queue(self, sink=None):
+        return SubmissionQueue(sink or ListSink(), self.wal_dir, fsync_interval=0, flush_interval=0.01)
+
+    def test_active_log_is_not_adopted_by_another_queue(self):
+        first = self.queue()
+        first.submit('contact', {'name': 'a'})
+        self.assertTrue(first.active.path.endswith(WAL_SUFFIX))
+        second = self.queue()
+        self.assertEqual(second.recovered, 0)
+        self.assertTrue(os.path.exists(first.active.path))
+        second.close()
+        first.close()
+
+    def test_orphaned_log_is_replayed(self):
+        record = {'id': 'abc', 'form': 'contact', 'received_at': '', 'fields': {}}
+        with open(os.path.join(self.wal_dir, f'1-1-0000{WAL_SUFFIX}'), 'wb') as f:
+            f.write(json.dumps(record).encode() + b'\n{"torn')
+        sink = ListSink()
+        queue = self.queue(sink)
+        self.assertEqual(queue.recovered, 1)
+        queue.close()
+        self.assertEqual(sink.records, [record])
+        self.assertEqual(os.listdir(self.wal_dir), [])
+
+    def test_leftover_new_logs_of_dead_processes_are_removed(self):
+        dead = os.path.join(self.wal_dir, f'999999999-1-0000{NEW_WAL_SUFFIX}')
+        live = os.path.join(self.wal_dir, f'{os.getpid()}-1-0000{NEW_WAL_SUFFIX}')
+        for path in (dead, live):
+            open(path, 'wb').close()
+        queue = self.queue()
+        self.assertFalse(os.path.exists(dead))
+        self.assertTrue(os.path.exists(live))
+        queue.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""Tests for the Bloom-fronted newsletter subscriber index in subscribers.py"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from subscribers import BloomFilter, SubscriberIndex, email_digest  # noqa: E402
+
+
+class BloomFilterTest(unittest.TestCase):
+
+    def test_no_false_negatives_and_few_false_positives(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        added = [email_digest(f'user{i}@example.com') for i in range(1000)]
+        for digest in added:
+            bloom.add(digest)
+        self.assertTrue(all(digest in bloom for digest in added))
+        others = [email_digest(f'other{i}@example.com') for i in range(10000)]
+        self.assertLess(sum(digest in bloom for digest in others), 300)
+
+
+class SubscriberIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.scratch = tempfile.TemporaryDirectory()
+        self.index = SubscriberIndex(self.scratch.name, compact_threshold=3)
+
+    def tearDown(self):
+        self.index.close()
+        self.scratch.cleanup()
+
+    def test_addresses_are_normalized_and_deduplicated(self):
+        self.assertTrue(self.index.add('Reader@Example.com '))
+        self.assertFalse(self.index.add('reader@example.com'))
+        self.assertIn('READER@example.com', self.index)
+        self.assertNotIn('someone@example.com', self.index)
+
+    def test_failed_commit_does_not_record(self):
+        def commit():
+            raise RuntimeError('queue full')
+        with self.assertRaises(RuntimeError):
+            self.index.add('reader@example.com', commit=commit)
+        self.assertNotIn('reader@example.com', self.index)
+
+    def settle(self, index):
+        """Wait for background compaction and reloads to finish"""
+        while True:
+            maintainer = index.maintainer
+            if maintainer is None:
+                return
+            maintainer.join()
+
+    def test_compaction_runs_in_the_background(self):
+        addresses = [f'user{i}@example.com' for i in range(7)]
+        for address in addresses:
+            self.index.add(address)
+        self.settle(self.index)
+        stats = self.index.stats()
+        self.assertEqual(stats['indexed'] + stats['journal'], 7)
+        self.assertGreaterEqual(stats['indexed'], 6)
+        self.assertTrue(all(address in self.index for address in addresses))
+
+    def test_entries_added_during_compaction_are_kept(self):
+        self.index.compact_threshold = 100
+        for i in range(5):
+            self.index.add(f'user{i}@example.com')
+        original = self.index.build_bloom
+
+        def build_bloom(index_map, count):
+            # Another process adds a subscriber while the merge runs off-lock
+            other = SubscriberIndex(self.scratch.name, compact_threshold=100)
+            other.add('late@example.com')
+            other.close()
+            return original(index_map, count)
+        self.index.build_bloom = build_bloom
+        self.assertTrue(self.index.compact())
+        self.assertEqual(self.index.stats()['indexed'], 5)
+        self.assertEqual(self.index.stats()['journal'], 1)
+        self.assertIn('late@example.com', self.index)
+        fresh = SubscriberIndex(self.scratch.name)
+        try:
+            self.assertIn('late@example.com', fresh)
+            self.assertIn('user0@example.com', fresh)
+        finally:
+            fresh.close()
+
+    def test_other_processes_reload_in_the_background(self):
+        addresses = [f'user{i}@example.com' for i in range(7)]
+        other = SubscriberIndex(self.scratch.name, compact_threshold=3)
+        try:
+            for address in addresses:
+                self.index.add(address)
+            self.settle(self.index)
+            # Answered from the new sorted index before the Bloom filter is rebuilt
+            self.assertTrue(all(address in other for address in addresses))
+            self.assertTrue(other.add('late@example.com'))
+            self.settle(other)
+            self.assertEqual(other.index_inode, self.index.index_file_inode())
+            self.assertIsNotNone(other.bloom)
+        finally:
+            other.close()
+        self.assertIn('late@example.com', self.index)
+        self.assertFalse(self.index.add('late@example.com'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+"""Tests for request tracing in tracing.py"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tracing import Tracer  # noqa: E402
+
+
+class CProfileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.scratch = tempfile.TemporaryDirectory()
+        self.tracer = Tracer(self.scratch.name, slow_ms=1000, profile='cprofile', profile_sample=1.0)
+
+    def tearDown(self):
+        self.scratch.cleanup()
+
+    def finish(self, trace):
+        trace.finish()
+        self.tracer.end(trace, {})
+
+    def test_one_profiled_request_per_process(self):
+        first = self.tracer.begin()
+        second = self.tracer.begin()
+        self.assertIsNotNone(first.profiler)
+        self.assertIsNone(second.profiler)
+        self.finish(second)
+        self.finish(first)
+        third = self.tracer.begin()
+        self.assertIsNotNone(third.profiler)
+        self.finish(third)
+
+    def test_off_without_a_threshold(self):
+        self.tracer.configure(slow_ms=0)
+        trace = self.tracer.begin()
+        self.assertIsNone(trace.profiler)
+        self.finish(trace)
+
+
+if __name__ == '__main__':
+    unittest.main()
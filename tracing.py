@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Request tracing for DevTechAI WebApp v2.0
+Every request carries a Trace that splits its time into phases (parse, route,
+cache, open, api, body, queue, write). Requests slower than a threshold are
+written to disk with their phases and either stack samples taken while they
+ran or a cProfile of the request. The threshold and profiler live in a small
+shared mapping, so /admin/tracing can change them for every worker at once.
+"""
+
+import cProfile
+import json
+import mmap
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+
+from accesslog import format_timestamp
+
+PROFILE_MODES = ('off', 'stack', 'cprofile')
+SAMPLE_INTERVAL = 0.005
+IDLE_INTERVAL = 0.1
+MAX_SAMPLES = 400
+MAX_PENDING_DUMPS = 32
+MAX_DUMPS = 100
+TOP_FUNCTIONS = 25
+
+
+class Trace:
+    """Phase timings of one request; mark(phase) closes the phase that just ran"""
+
+    __slots__ = ('started', 'last', 'phases', 'elapsed', 'status', 'size', 'thread_id', 'samples', 'profiler')
+
+    def __init__(self):
+        self.started = self.last = time.perf_counter()
+        self.phases = {}
+        self.elapsed = None
+        self.status = None
+        self.size = 0
+        self.thread_id = None
+        self.samples = None
+        self.profiler = None
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self.last
+        self.last = now
+
+    def finish(self, phase='write'):
+        """Charge the time since the last mark to ``phase`` and return the total"""
+        self.mark(phase)
+        self.elapsed = self.last - self.started
+        return self.elapsed
+
+
+class Tracer:
+    """Starts request traces and dumps the slow ones to ``directory``"""
+
+    def __init__(self, directory, slow_ms=0.0, profile='stack', profile_sample=0.05, max_dumps=MAX_DUMPS):
+        self.directory = directory
+        self.max_dumps = max_dumps
+        # slow_ms, profile mode, cProfile sample rate: shared with forked workers
+        self.buffer = mmap.mmap(-1, 3 * 8)
+        self.settings = memoryview(self.buffer).cast('d')
+        self.configure(slow_ms, profile, profile_sample)
+        self.bind()
+
+    def bind(self):
+        """Reset the per-process state (called in each worker after fork)"""
+        self.active = {}
+        # Held while a request runs under cProfile; a second enable() in the
+        # same process fails on Python 3.12+, where profilers are process-wide
+        self.profiling = threading.Lock()
+        self.dumps = deque(maxlen=MAX_PENDING_DUMPS)
+        self.written = 0
+        self.thread = None
+
+    def configure(self, slow_ms=None, profile=None, profile_sample=None):
+        """Change the settings of every process sharing this tracer; raises ValueError"""
+        if slow_ms is not None:
+            slow_ms = float(slow_ms)
+            if slow_ms < 0:
+                raise ValueError("slow_ms must not be negative")
+            self.settings[0] = slow_ms
+        if profile is not None:
+            if profile not in PROFILE_MODES:
+                raise ValueError(f"profile must be one of {', '.join(PROFILE_MODES)}")
+            self.settings[1] = PROFILE_MODES.index(profile)
+        if profile_sample is not None:
+            profile_sample = float(profile_sample)
+            if not 0.0 <= profile_sample <= 1.0:
+                raise ValueError("profile_sample must be between 0 and 1")
+            self.settings[2] = profile_sample
+
+    @property
+    def slow_ms(self):
+        return self.settings[0]
+
+    @property
+    def profile(self):
+        return PROFILE_MODES[int(self.settings[1])]
+
+    def status(self):
+        return {
+            'slow_ms': self.slow_ms,
+            'profile': self.profile,
+            'profile_sample': self.settings[2],
+            'directory': os.path.abspath(self.directory),
+            'dumps_written': self.written,
+            'pid': os.getpid(),
+        }
+
+    def start(self):
+        """Start this process's sampling and dump-writing thread"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name='tracer', daemon=True)
+            self.thread.start()
+
+    def begin(self):
+        """Trace for a request that starts now"""
+        trace = Trace()
+        if not self.settings[0]:
+            return trace
+        profile = self.profile
+        if profile == 'stack':
+            trace.thread_id = threading.get_ident()
+            trace.samples = []
+            self.active[id(trace)] = trace
+        elif profile == 'cprofile' and random.random() < self.settings[2]:
+            # One profiled request per process; others sampled meanwhile run without
+            if self.profiling.acquire(blocking=False):
+                profiler = cProfile.Profile()
+                try:
+                    profiler.enable()
+                except ValueError:
+                    # Another profiler or debugger is active in this process
+                    self.profiling.release()
+                else:
+                    trace.thread_id = threading.get_ident()
+                    trace.profiler = profiler
+        return trace
+
+    def end(self, trace, record):
+        """Finish a trace; slow ones are queued for the writer thread with their access record"""
+        if trace.samples is not None:
+            self.active.pop(id(trace), None)
+        if trace.profiler is not None:
+            trace.profiler.disable()
+            self.profiling.release()
+        slow_ms = self.settings[0]
+        if slow_ms and trace.elapsed * 1000 >= slow_ms:
+            # Copied before the access log writer reformats the record
+            self.dumps.append((trace, dict(record)))
+
+    def run(self):
+        while True:
+            sampling = self.settings[0] and self.profile == 'stack'
+            time.sleep(SAMPLE_INTERVAL if sampling else IDLE_INTERVAL)
+            if sampling and self.active:
+                self.sample_stacks()
+            while self.dumps:
+                trace, record = self.dumps.popleft()
+                try:
+                    self.dump(trace, record)
+                except OSError as e:
+                    sys.stderr.write(f"[DevTechAI Server] Writing a slow request trace failed: {e}\n")
+
+    def sample_stacks(self):
+        """Record the stack of every traced request that is already over the threshold"""
+        threshold = self.settings[0] / 1000
+        now = time.perf_counter()
+        frames = None
+        # list() copies the values atomically, so handlers can add and remove traces meanwhile
+        for trace in list(self.active.values()):
+            if now - trace.started < threshold or len(trace.samples) >= MAX_SAMPLES:
+                continue
+            if frames is None:
+                frames = sys._current_frames()
+            frame = frames.get(trace.thread_id)
+            if frame is not None:
+                trace.samples.append(tuple(f'{entry.filename}:{entry.lineno} in {entry.name}'
+                                           for entry in traceback.extract_stack(frame)))
+
+    def dump(self, trace, record):
+        os.makedirs(self.directory, exist_ok=True)
+        name = f'slow-{os.getpid()}-{self.written % self.max_dumps:04d}'
+        record.pop('phases', None)
+        record['ts'] = format_timestamp(record['ts'])
+        report = {
+            'request': record,
+            'duration_ms': round(trace.elapsed * 1000, 3),
+            'phases_ms': {phase: round(seconds * 1000, 3) for phase, seconds in trace.phases.items()},
+        }
+        if trace.samples:
+            report['sample_interval_ms'] = SAMPLE_INTERVAL * 1000
+            report['stack_samples'] = [{'count': count, 'stack': list(stack)}
+                                       for stack, count in Counter(trace.samples).most_common()]
+        if trace.profiler is not None:
+            profile_path = os.path.join(self.directory, name + '.prof')
+            trace.profiler.dump_stats(profile_path)
+            report['profile'] = os.path.basename(profile_path)
+            report['top_functions'] = top_functions(trace.profiler)
+        with open(os.path.join(self.directory, name + '.json'), 'w') as f:
+            json.dump(report, f, indent=2)
+        self.written += 1
+
+
+def top_functions(profiler, limit=TOP_FUNCTIONS):
+    """The functions with the most cumulative time in a profile"""
+    stats = pstats.Stats(profiler).stats
+    rows = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]
+    return [{
+        'function': f'{filename}:{line}({function})',
+        'calls': calls,
+        'tottime_ms': round(tottime * 1000, 3),
+        'cumtime_ms': round(cumtime * 1000, 3),
+    } for (filename, line, function), (_, calls, tottime, cumtime, _) in rows]
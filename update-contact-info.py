@@ -4,6 +4,8 @@
 import os
 import re
 
+from pagewriter import PageWriter
+
 services_dir = "services"
 old_address1 = "123 AI Innovation Drive"
 old_address2 = "Tech Valley, CA 94000"
@@ -24,19 +26,19 @@ replacements = [
      '<strong>Contact:</strong> <span>contact@devtechai.org</span>'),
 ]
 
-for filename in os.listdir(services_dir):
-    if filename.endswith('.html'):
-        filepath = os.path.join(services_dir, filename)
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        for pattern, replacement in replacements:
-            content = re.sub(pattern, replacement, content)
+# Pages are replaced atomically once all of them are updated
+with PageWriter() as writer:
+    for filename in os.listdir(services_dir):
+        if filename.endswith('.html'):
+            filepath = os.path.join(services_dir, filename)
+            with open(filepath, 'r', encoding='utf-8') as f:
+                content = f.read()
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+            for pattern, replacement in replacements:
+                content = re.sub(pattern, replacement, content)
         
-        print(f"Updated: {filename}")
+            if writer.write(filepath, content):
+                print(f"Updated: {filename}")
 
 print("All service pages updated successfully!")
 
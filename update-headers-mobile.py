@@ -7,11 +7,12 @@ import os
 import re
 from pathlib import Path
 
-def update_header_logo(file_path):
+from pagewriter import PageWriter
+
+def update_header_logo(file_path, writer):
     """Update header logo to include image"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = writer.read_text(file_path)
         
         # Determine the correct path prefix based on file location
         if 'services/' in str(file_path) or 'portfolio/' in str(file_path) or 'solutions/' in str(file_path):
@@ -37,10 +38,7 @@ def update_header_logo(file_path):
         content = re.sub(r'href="\.\./index\.html#', 'href="/#', content)
         content = re.sub(r'href="index\.html#', 'href="/#', content)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        return True
+        return writer.write(file_path, content)
     except Exception as e:
         print(f"  ⚠️  {file_path.name} - Header update error: {e}")
         return False
@@ -55,19 +53,21 @@ def main():
     total_files = 0
     updated_files = 0
     
-    for dir_name in directories:
-        dir_path = base_dir / dir_name
-        if not dir_path.exists():
-            continue
-        
-        print(f"\n📁 Processing {dir_name}/")
-        html_files = list(dir_path.glob('*.html'))
-        
-        for html_file in html_files:
-            total_files += 1
-            if update_header_logo(html_file):
-                updated_files += 1
-                print(f"  ✅ {html_file.name} - Header updated")
+    # Pages are replaced atomically once all of them are updated
+    with PageWriter() as writer:
+        for dir_name in directories:
+            dir_path = base_dir / dir_name
+            if not dir_path.exists():
+                continue
+
+            print(f"\n📁 Processing {dir_name}/")
+            html_files = list(dir_path.glob('*.html'))
+
+            for html_file in html_files:
+                total_files += 1
+                if update_header_logo(html_file, writer):
+                    updated_files += 1
+                    print(f"  ✅ {html_file.name} - Header updated")
     
     print(f"\n{'='*50}")
     print(f"✅ Processed {total_files} files")